@@ -0,0 +1,76 @@
+# dictionary_project/benchmarks/bench_fuzzy.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Memory and latency of the symmetric-delete fuzzy index over the full headword set.
+
+Queries are headwords with 0-2 random edits (substitution, insertion, deletion,
+transposition). A sample is cross-checked against a brute-force scan.
+
+Usage:
+  python -m lookup.packed build merged_dictionary.json dictionary.ldict
+  python -m benchmarks.bench_fuzzy dictionary.ldict --queries 5000
+"""
+
+import argparse
+import random
+import string
+import time
+from pathlib import Path
+
+import numpy as np
+
+from lookup.fuzzy import edit_distance, measure_build
+from lookup.store import DictionaryStore
+
+
+def misspell(word: str, edits: int, rng: random.Random) -> str:
+    for _ in range(edits):
+        op = rng.choice("sidt") if len(word) > 1 else "i"
+        i = rng.randrange(len(word))
+        if op == "s":
+            word = word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1:]
+        elif op == "i":
+            word = word[:i] + rng.choice(string.ascii_lowercase) + word[i:]
+        elif op == "d":
+            word = word[:i] + word[i + 1:]
+        elif i + 1 < len(word):
+            word = word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fuzzy headword lookup")
+    parser.add_argument("store", type=Path)
+    parser.add_argument("--queries", type=int, default=5000)
+    parser.add_argument("--verify", type=int, default=200, help="Queries cross-checked against a brute-force scan")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with DictionaryStore(args.store) as store:
+        index, allocated, seconds = measure_build(store)
+        print(f"{len(store):,} headwords -> {len(index):,} delete keys, {allocated / 1e6:.1f} MB "
+              f"({allocated / len(store):,.0f} B/headword), built in {seconds:.2f}s")
+
+        words = index.words
+        queries = [misspell(rng.choice(words), rng.randint(0, 2), rng) for _ in range(args.queries)]
+        timings, found = [], 0
+        for query in queries:
+            start = time.perf_counter()
+            found += bool(index.suggest(query))
+            timings.append(time.perf_counter() - start)
+        ms = np.array(timings) * 1e3
+        print(f"  {len(queries):,} queries: p50 {np.percentile(ms, 50):.3f} ms   p99 {np.percentile(ms, 99):.3f} ms   "
+              f"max {ms.max():.3f} ms   ({found / len(queries):.0%} with a suggestion)")
+
+        missed = 0
+        for query in queries[:args.verify]:
+            expected = {w for w in words if edit_distance(query, w, index.max_distance) <= index.max_distance}
+            missed += bool(expected - {s.word for s in index.suggest(query, limit=None)})
+        print(f"  brute-force check on {min(args.verify, len(queries))} queries: {missed} with missing suggestions")
+
+
+if __name__ == "__main__":
+    main()
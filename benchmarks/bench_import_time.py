@@ -0,0 +1,80 @@
+# dictionary_project/benchmarks/bench_import_time.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Measure module import cost with `python -X importtime` and fail if a module
+cannot be imported, or if heavy dependencies (torch, sentence-transformers,
+faiss) are pulled in at import time.
+
+Usage:
+  python -m benchmarks.bench_import_time
+  python -m benchmarks.bench_import_time builder utils.quality_scorer --max-ms 300
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+DEFAULT_MODULES = ["builder", "utils.quality_scorer", "validators"]
+HEAVY_MODULES = ("torch", "sentence_transformers", "faiss", "transformers")
+ROOT = Path(__file__).resolve().parent.parent
+
+_LINE_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\s*)(\S+)")
+
+
+def measure(module: str) -> Tuple[int, Dict[str, int]]:
+    """Return (cumulative_us for `module`, {imported_module: self_us})."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError((proc.stderr.strip().splitlines() or [f"exit status {proc.returncode}"])[-1])
+    total, self_times = 0, {}
+    for line in proc.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, _, name = match.groups()
+        self_times[name] = int(self_us)
+        if name == module:
+            total = int(cumulative_us)
+    return total, self_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time benchmark")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--max-ms", type=float, default=None, help="Fail if any module takes longer to import")
+    parser.add_argument("--top", type=int, default=5, help="Show the N slowest imports per module")
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    for module in args.modules:
+        try:
+            total_us, self_times = measure(module)
+        except RuntimeError as e:
+            # 임포트에 실패한 모듈은 건너뛰지 않고 실패로 집계합니다.
+            print(f"{module:<24} FAILED ({e})")
+            failures.append(f"{module} failed to import: {e}")
+            continue
+        heavy = sorted(name for name in self_times if name.split(".")[0] in HEAVY_MODULES)
+        print(f"{module:<24} {total_us / 1000:8.1f} ms  ({len(self_times)} modules)")
+        for name, self_us in sorted(self_times.items(), key=lambda kv: kv[1], reverse=True)[:args.top]:
+            print(f"    {self_us / 1000:8.1f} ms  {name}")
+        if heavy:
+            failures.append(f"{module} imports heavy dependencies at load time: {', '.join(heavy[:5])}")
+        if args.max_ms is not None and total_us / 1000 > args.max_ms:
+            failures.append(f"{module} import took {total_us / 1000:.1f} ms (> {args.max_ms} ms)")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
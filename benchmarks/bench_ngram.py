@@ -0,0 +1,98 @@
+# dictionary_project/benchmarks/bench_ngram.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Substring query latency of the CJK n-gram index against a linear scan.
+
+The source dictionary is repeated (with numbered headwords) up to --entries so
+the index can be measured at 100k+ entries even though the checked-in data is
+smaller. Queries are random 1-4 character substrings of indexed fields.
+
+Usage:
+  python -m benchmarks.bench_ngram merged_dictionary.json --lang ja --entries 100000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+from lookup.ngram_index import NgramIndex, build_ngram_index, field_texts, normalize_text
+from lookup.packed import load_canonical_entries, write_packed
+from lookup.store import DictionaryStore
+
+
+def synthetic_entries(source: str, count: int) -> List[Dict[str, Any]]:
+    base = [e for e in load_canonical_entries([source]).values()]
+    entries = []
+    for i in range(count):
+        entry = dict(base[i % len(base)])
+        if i >= len(base):
+            entry["word"] = f"{entry['word']}{i // len(base)}"
+        entries.append(entry)
+    return entries
+
+
+def sample_queries(texts: List[str], count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    nonempty = [t for t in texts if len(t) >= 4]
+    queries = []
+    while len(queries) < count:
+        text = rng.choice(nonempty)
+        size = rng.randint(1, 4)
+        start = rng.randrange(len(text) - size + 1)
+        queries.append(text[start:start + size])
+    return queries
+
+
+def _percentiles(samples: List[float]) -> str:
+    ms = np.array(samples) * 1e3
+    return f"p50 {np.percentile(ms, 50):7.3f} ms   p99 {np.percentile(ms, 99):7.3f} ms   max {ms.max():7.3f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the CJK n-gram substring index")
+    parser.add_argument("source", type=str, help="Any supported dictionary JSON")
+    parser.add_argument("--lang", type=str, default="ja")
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--scan-queries", type=int, default=20, help="Linear-scan baseline is slow; fewer queries")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        store_path = Path(workdir) / "bench.ldict"
+        index_path = Path(workdir) / f"bench.{args.lang}.ngram"
+        write_packed(synthetic_entries(args.source, args.entries), store_path)
+        with DictionaryStore(store_path) as store:
+            start = time.perf_counter()
+            stats = build_ngram_index(store, args.lang, index_path)
+            build_s = time.perf_counter() - start
+            texts = [normalize_text(text) for i in range(len(store)) for text in field_texts(store.packed.entry(i), args.lang)]
+        print(f"{args.entries:,} entries, {stats['docs']:,} {args.lang} fields: {stats['grams']:,} grams, "
+              f"index {stats['bytes'] / 1e6:.2f} MB (postings {stats['postings_bytes'] / 1e6:.2f} MB), built in {build_s:.1f}s")
+
+        queries = sample_queries(texts, args.queries)
+        with NgramIndex(index_path) as index:
+            timings, hits = [], 0
+            for query in queries:
+                start = time.perf_counter()
+                hits += len(index.search_docs(query))
+                timings.append(time.perf_counter() - start)
+            print(f"  index ({len(queries)} queries, {hits / len(queries):,.0f} hits avg)  {_percentiles(timings)}")
+
+            scan = []
+            for query in queries[:args.scan_queries]:
+                start = time.perf_counter()
+                expected = [doc_id for doc_id, text in enumerate(texts) if query in text]
+                scan.append(time.perf_counter() - start)
+                assert expected == index.search_docs(query), f"mismatch for {query!r}"
+            print(f"  linear scan ({len(scan)} queries, results verified equal)  {_percentiles(scan)}")
+
+
+if __name__ == "__main__":
+    main()
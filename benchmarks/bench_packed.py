@@ -0,0 +1,83 @@
+# dictionary_project/benchmarks/bench_packed.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Compare file size, load time and lookup latency of JSON dictionaries against the
+packed `.ldict` format built from them.
+
+Usage:
+  python -m benchmarks.bench_packed merged_dictionary.json multilingual_dict.json
+  python -m benchmarks.bench_packed merged_dictionary.json --lookups 5000 --repeat 5
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from lookup.packed import PackedDictionary, convert, load_canonical_entries
+
+
+def _best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _json_lookup_table(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    entries = data.get("entries", data) if isinstance(data, dict) else data
+    if isinstance(entries, dict):
+        return entries
+    return {entry["word"]: entry for entry in entries}
+
+
+def bench_file(path: str, lookups: int, repeat: int, workdir: Path):
+    packed_path = workdir / (Path(path).stem + ".ldict")
+    build_s = _best_of(lambda: convert([path], packed_path), 1)
+    words: List[str] = sorted(load_canonical_entries([path]))
+    sample = random.Random(0).choices(words, k=lookups)
+
+    json_size = Path(path).stat().st_size
+    packed_size = packed_path.stat().st_size
+    json_load = _best_of(lambda: _json_lookup_table(path), repeat)
+    packed_open = _best_of(lambda: PackedDictionary(packed_path).close(), repeat)
+
+    table = _json_lookup_table(path)
+    json_lookup = _best_of(lambda: [table[w] for w in sample], repeat)
+    with PackedDictionary(packed_path) as packed:
+        packed_lookup = _best_of(lambda: [packed.get(w) for w in sample], repeat)
+        packed_find = _best_of(lambda: [packed.find(w) for w in sample], repeat)
+
+    print(f"\n{path} ({len(words):,} headwords, packed in {build_s:.2f}s)")
+    print(f"  size         JSON {json_size / 1e6:8.2f} MB   packed {packed_size / 1e6:8.2f} MB "
+          f"({packed_size / json_size:.0%})")
+    print(f"  load/open    JSON {json_load * 1e3:8.2f} ms   packed {packed_open * 1e3:8.3f} ms "
+          f"({json_load / packed_open:,.0f}x faster)")
+    print(f"  lookup       JSON {json_lookup / lookups * 1e6:8.2f} µs   packed {packed_lookup / lookups * 1e6:8.2f} µs "
+          f"(index only {packed_find / lookups * 1e6:.2f} µs)")
+    print(f"  open + 1 get JSON {json_load * 1e3:8.2f} ms   packed {(packed_open + packed_lookup / lookups) * 1e3:8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON dictionaries against the packed .ldict format")
+    parser.add_argument("paths", nargs="+", help="JSON dictionaries (any supported shape)")
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for path in args.paths:
+            bench_file(path, args.lookups, args.repeat, Path(workdir))
+
+
+if __name__ == "__main__":
+    main()
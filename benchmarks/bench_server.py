@@ -0,0 +1,155 @@
+# dictionary_project/benchmarks/bench_server.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Load test for the HTTP lookup service: p50 / p99 latency and requests per second.
+
+`--concurrency` keep-alive connections each send requests back to back. The
+request mix is drawn from the store's own headwords: exact lookups, 2-letter
+prefixes, misspelled lookups (fuzzy path) and, when the server has an English
+n-gram index, short substring searches. With --spawn the server runs in this
+process (against the given store) on a free port; otherwise --url points at a
+running one.
+
+Usage:
+  python -m benchmarks.bench_server dictionary.ldict --spawn --concurrency 32 --requests 20000
+  python -m benchmarks.bench_server dictionary.ldict --url http://127.0.0.1:8080 --duration 10
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+import numpy as np
+
+from benchmarks.bench_fuzzy import misspell
+from lookup.server import LookupService, serve
+from lookup.store import DictionaryStore
+
+
+def request_mix(store: DictionaryStore, count: int, searchable: bool, seed: int = 0) -> List[str]:
+    """Request targets; a fixed pool is sampled with repeats so the response cache sees a realistic hit rate."""
+    rng = random.Random(seed)
+    words = [store.word_at(rng.randrange(len(store))) for _ in range(min(count, 5000))]
+    targets = []
+    for _ in range(count):
+        word = rng.choice(words)
+        kind = rng.random()
+        if kind < 0.55:
+            targets.append(f"/lookup/{quote(word)}")
+        elif kind < 0.7:
+            targets.append(f"/lookup/{quote(misspell(word, rng.randint(1, 2), rng))}")
+        elif kind < 0.85:
+            targets.append(f"/prefix/{quote(word[:2])}?limit=10")
+        elif searchable and len(word) >= 4:
+            targets.append(f"/search?q={quote(word[:4])}&limit=10")
+        else:
+            targets.append(f"/batch?words={quote(','.join(rng.sample(words, 5)))}")
+    return targets
+
+
+async def _read_response(reader: asyncio.StreamReader) -> int:
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    length = 0
+    for line in lines[1:]:
+        if line.lower().startswith("content-length:"):
+            length = int(line.split(":", 1)[1])
+    if length:
+        await reader.readexactly(length)
+    return status
+
+
+async def _client(host: str, port: int, queue: "asyncio.Queue[str]", deadline: Optional[float],
+                  timings: List[float], statuses: dict):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while deadline is None or time.perf_counter() < deadline:
+            try:
+                target = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            started = time.perf_counter()
+            writer.write(f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("latin-1"))
+            await writer.drain()
+            status = await _read_response(reader)
+            timings.append(time.perf_counter() - started)
+            statuses[status] = statuses.get(status, 0) + 1
+            if deadline is not None:
+                queue.put_nowait(target)
+    finally:
+        writer.close()
+
+
+async def load_test(host: str, port: int, targets: List[str], concurrency: int,
+                    duration: Optional[float] = None) -> Tuple[List[float], dict, float]:
+    """(per-request latencies, {status: count}, wall seconds)."""
+    queue: "asyncio.Queue[str]" = asyncio.Queue()
+    for target in targets:
+        queue.put_nowait(target)
+    timings: List[float] = []
+    statuses: dict = {}
+    started = time.perf_counter()
+    deadline = started + duration if duration else None
+    await asyncio.gather(*(_client(host, port, queue, deadline, timings, statuses) for _ in range(concurrency)))
+    return timings, statuses, time.perf_counter() - started
+
+
+def report(label: str, timings: List[float], statuses: dict, seconds: float):
+    ms = np.array(timings) * 1e3
+    codes = ", ".join(f"{code}: {n:,}" for code, n in sorted(statuses.items()))
+    print(f"  {label}: {len(ms):,} requests in {seconds:.2f}s = {len(ms) / seconds:,.0f} req/s   "
+          f"p50 {np.percentile(ms, 50):.3f} ms   p99 {np.percentile(ms, 99):.3f} ms   ({codes})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the dictionary HTTP service")
+    parser.add_argument("store", type=Path, help="Store the request mix is drawn from (and served, with --spawn)")
+    parser.add_argument("--url", type=str, default="http://127.0.0.1:8080")
+    parser.add_argument("--spawn", action="store_true", help="Run the server in this process on a free port")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--duration", type=float, default=None, help="Run for this many seconds instead")
+    parser.add_argument("--cache-size", type=int, default=10_000, help="Response cache of the spawned server")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    async def run():
+        service = server = None
+        if args.spawn:
+            service = LookupService(DictionaryStore(args.store), cache_size=args.cache_size)
+            server = await serve(service, "127.0.0.1", 0)
+            host, port = server.sockets[0].getsockname()[:2]
+            store, searchable = service.store, "en" in service.ngrams
+        else:
+            split = urlsplit(args.url)
+            host, port = split.hostname, split.port or 80
+            store, searchable = DictionaryStore(args.store), False
+        try:
+            targets = request_mix(store, args.requests, searchable, args.seed)
+            print(f"{len(store):,} entries, concurrency {args.concurrency}, server {host}:{port}"
+                  + (" (in-process)" if args.spawn else ""))
+            # 첫 번째 실행은 응답 캐시를 채우고, 두 번째 실행은 캐시가 데워진 상태를 측정합니다.
+            for label in ("cold cache", "warm cache"):
+                report(label, *await load_test(host, port, targets, args.concurrency, args.duration))
+            if service is not None:
+                info = service.cache_info()
+                print(f"  response cache: {info['hits']:,} hits / {info['misses']:,} misses, {info['size']:,} stored")
+        finally:
+            if server is not None:
+                server.close()
+                await server.wait_closed()
+                service.close()
+            store.close()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# dictionary_project/benchmarks/bench_validation.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Compare entries/sec of the structural fast path against DictionaryRoot.parse_obj.
+
+Usage:
+  python -m benchmarks.bench_validation --entries 100000
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List
+
+from schemas.base import DictionaryRoot
+from validators.structural_validator import is_well_formed_entry
+
+LANGS = ["ko", "de", "ja", "hr", "es", "fr", "zh"]
+
+
+def _value_field(value: Any, confidence: float = 0.9) -> Dict[str, Any]:
+    return {
+        "value": value,
+        "provenance": {"source": "llm:gpt-oss-120b", "timestamp": "2025-09-05T22:06:20.247766"},
+        "confidence": confidence,
+    }
+
+
+def make_synthetic_corpus(n: int, invalid_every: int = 0) -> List[Dict[str, Any]]:
+    """Build `n` synthetic entries; every `invalid_every`-th entry has an out-of-range confidence."""
+    corpus = []
+    for i in range(n):
+        bad = invalid_every and i % invalid_every == 0
+        translations = {
+            lang: {
+                "word_target": _value_field(f"{lang}_word_{i}"),
+                "part_of_speech": _value_field("noun"),
+                "examples": [_value_field(f"{lang} example {i}", 1.5 if bad else 0.9)],
+            }
+            for lang in LANGS
+        }
+        corpus.append({
+            "schema_version": "1.4",
+            "word_en": f"word{i}",
+            "senses": [{
+                "sense_id": f"wn:{i:08d}-n",
+                "definition_en": f"Definition of word{i}.",
+                "examples_en": [f"An example with word{i}."],
+                "translations": translations,
+            }],
+        })
+    return corpus
+
+
+def _time(label: str, fn, corpus: List[Dict[str, Any]]) -> float:
+    start = time.perf_counter()
+    for entry in corpus:
+        fn(entry)
+    elapsed = time.perf_counter() - start
+    rate = len(corpus) / elapsed if elapsed else float("inf")
+    print(f"{label:<28} {elapsed:8.3f}s  {rate:12,.0f} entries/sec")
+    return rate
+
+
+def _pydantic_path(entry: Dict[str, Any]) -> None:
+    try:
+        DictionaryRoot.parse_obj(entry)
+    except Exception:
+        pass
+
+
+def _fast_path(entry: Dict[str, Any]) -> None:
+    if not is_well_formed_entry(entry):
+        _pydantic_path(entry)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DictionaryRoot validation paths")
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--invalid-every", type=int, default=0, help="Make every N-th entry invalid (0 = none)")
+    args = parser.parse_args()
+
+    corpus = make_synthetic_corpus(args.entries, args.invalid_every)
+    print(f"Synthetic corpus: {len(corpus):,} entries x {len(LANGS)} languages")
+    baseline = _time("pydantic parse_obj", _pydantic_path, corpus)
+    fast = _time("structural + fallback", _fast_path, corpus)
+    print(f"Speedup: {fast / baseline:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-#pip install requests faiss-cpu sentence-transformers numpy
+#pip install requests faiss-cpu sentence-transformers
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
@@ -30,23 +30,17 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 
 import requests
-import numpy as np
 from pathlib import Path
 
-# Optional imports for vector support
-try:
-    import faiss
-    HAS_FAISS = True
-except ImportError:
-    HAS_FAISS = False
-    print("Warning: FAISS not available. Vector features disabled.")
+from utils.model_registry import is_available, get_module, get_sentence_transformer
+from utils.frequency import FREQUENCY_PRIOR_PATH, UNTAGGED_RARITY, FrequencyPrior
+from utils.json_stream import iter_json_items
+from utils.morphy import get_morphy
 
-try:
-    from sentence_transformers import SentenceTransformer
-    HAS_EMBEDDINGS = True
-except ImportError:
-    HAS_EMBEDDINGS = False
-    print("Warning: sentence-transformers not available. Embedding features disabled.")
+# Optional vector support: only probe for the packages here; faiss, sentence-transformers
+# (and torch) are imported on first use when --vector-store is enabled.
+HAS_FAISS = is_available("faiss")
+HAS_EMBEDDINGS = is_available("sentence_transformers")
 
 
 class Language(Enum):
@@ -103,7 +97,12 @@ class MultilingualDictionaryBuilder:
         rarity_cut: int = 4,
         overgen_factor: float = 1.6,
         use_vectors: bool = False,
-        embedding_model: str = "all-MiniLM-L6-v2"
+        embedding_model: str = "all-MiniLM-L6-v2",
+        frequency_prior: Optional[FrequencyPrior] = None,
+        prior_reject_at: int = 0,
+        seed_entries: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        seed_votes: int = 1,
+        drop_inflections: bool = False
     ):
         self.model = model
         self.target_language = target_language
@@ -119,6 +118,11 @@ class MultilingualDictionaryBuilder:
         self.embedding_model_name = embedding_model
         self.encoder = None
         self.vector_index = None
+        self.frequency_prior = frequency_prior
+        self.prior_reject_at = int(prior_reject_at)
+        self.seed_entries = seed_entries
+        self.seed_votes = max(1, int(seed_votes))
+        self.morphy = get_morphy() if drop_inflections else None
         
         if self.use_vectors:
             self._initialize_vector_components()
@@ -140,7 +144,10 @@ class MultilingualDictionaryBuilder:
     def _initialize_vector_components(self):
         try:
             print(f"Loading embedding model: {self.embedding_model_name}")
-            self.encoder = SentenceTransformer(self.embedding_model_name)
+            self.encoder = get_sentence_transformer(self.embedding_model_name)
+            faiss = get_module("faiss")
+            if self.encoder is None or faiss is None:
+                raise RuntimeError("faiss or sentence-transformers could not be loaded")
             embedding_dim = self.encoder.get_sentence_embedding_dimension()
             self.vector_index = faiss.IndexFlatIP(embedding_dim)
             print(f"Vector components initialized (dim: {embedding_dim})")
@@ -212,6 +219,52 @@ Validate and provide the dictionary entry for: '{word}'
         if j.get("rarity", 5) >= self.rarity_cut: j["accept"] = False; j["reasons"].append("rarity_cutoff")
         return j
 
+    def llm_translate_seeded(self, seed: Dict[str, Any], temperature: float = 0.2) -> Dict[str, Any]:
+        """Short prompt for seeded mode: the English side is already known, only the target fields are requested."""
+        name = self.get_language_config()["name"]
+        if name == "Unknown": name = self.target_language
+        prompt = f"""Translate this English dictionary entry into {name}. Return ONLY JSON:
+{{"word_target": "single most common {name} word", "definition_target": "...", "example_target": "...", "confidence": 0.0-1.0}}
+
+word: {seed['word']} ({seed.get('pos') or 'n/a'})
+definition: {seed.get('definition_en', '')}
+example: {seed.get('example_en', '')}
+"""
+        resp = self.ask_ollama(prompt, timeout=30, temperature=temperature)
+        try:
+            j = json.loads(self._extract_json(resp))
+        except Exception as e:
+            print(f"JSON parse error for '{seed['word']}': {e}"); return {}
+        j.setdefault("word_target", ""); j.setdefault("definition_target", ""); j.setdefault("example_target", ""); j.setdefault("confidence", 0.0)
+        return j
+
+    def self_consistency_seeded(self, seed: Dict[str, Any]) -> Tuple[bool, DictionaryEntry]:
+        word = seed["word"]
+        results = [self.llm_translate_seeded(seed, temp) for temp in self.temps[:self.seed_votes]]
+        self.metrics["seeded_calls"] += len(results)
+        accepts = [r for r in results if r.get("word_target") and r.get("definition_target")]
+        min_consensus = 1 if len(results) == 1 else max(2, (len(results) + 1) // 2)
+        base = dict(word=word, prefix=seed.get("prefix") or word[:2], length=len(word), pos=seed.get("pos") or "",
+                    definition_en=seed.get("definition_en") or "", example_en=seed.get("example_en") or "", target_lang=self.target_language)
+        if len(accepts) < min_consensus:
+            return False, DictionaryEntry(**base)
+        best_result = max(accepts, key=lambda x: x.get("confidence", 0.0))
+        conf = sum(float(r.get("confidence", 0) or 0) for r in accepts) / len(accepts)
+        return True, DictionaryEntry(**base, word_target=best_result["word_target"], definition_target=best_result["definition_target"],
+                                     example_target=best_result.get("example_target", ""), rarity=int(seed.get("rarity") or 3),
+                                     confidence=round(conf, 3), score=round(conf * len(accepts) / len(results), 3), collected_at=datetime.now().isoformat())
+
+    def run_seeded_prefix(self, prefix: str) -> List[DictionaryEntry]:
+        seeds = self.seed_entries.get(prefix, []); accepted = []
+        self.metrics["candidates_generated"] += len(seeds)
+        for seed in seeds:
+            if self.shutdown_requested: break
+            ok, entry = self.self_consistency_seeded(seed)
+            self.metrics["attempts"] += 1
+            if not ok or entry.score < self.score_cut: self.metrics["rejected"] += 1; continue
+            accepted.append(entry); self.metrics["accepted"] += 1
+        return accepted
+
     def self_consistency_multilingual(self, word: str) -> Tuple[bool, DictionaryEntry]:
         results = [self.llm_validate_and_translate(word, temp) for temp in self.temps]
         accepts = [r for r in results if r.get("accept")]
@@ -251,25 +304,61 @@ Validate and provide the dictionary entry for: '{word}'
             if len(words) >= over: break
         return words
 
+    def apply_frequency_prior(self, candidates: List[str]) -> List[str]:
+        """Drop candidates the cntlist prior marks as rare (before any validation call) and order the rest most-common-first."""
+        if not self.frequency_prior: return candidates
+        kept = []
+        for word in candidates:
+            prior = self.frequency_prior.rarity(word)
+            if prior is None: self.metrics["prior_unknown"] += 1
+            elif self.prior_reject_at and prior >= self.prior_reject_at: self.metrics["prior_rejected"] += 1; continue
+            kept.append(word)
+        return self.frequency_prior.order(kept)
+
+    def drop_inflected(self, candidates: List[str]) -> List[str]:
+        """Drop inflected forms (aahed, aahs) whose base form is a WordNet lemma or another candidate, before any validation call."""
+        if not self.morphy: return candidates
+        batch = set(candidates)
+        is_lemma = (lambda w: self.frequency_prior.count(w) is not None) if self.frequency_prior else (lambda w: False)
+        kept = []
+        for word in candidates:
+            # 단어 자체가 WordNet 표제어면 (glasses, news) 굴절형이 아니므로 유지합니다.
+            if not is_lemma(word) and self.morphy.lemmatize(word, lambda base: base in batch or is_lemma(base)):
+                self.metrics["inflections_dropped"] += 1; continue
+            kept.append(word)
+        return kept
+
+    def record_prior_agreement(self, word: str, llm_rarity: int):
+        prior = self.frequency_prior.rarity(word) if self.frequency_prior else None
+        if prior is None: return
+        diff = abs(prior - llm_rarity)
+        self.metrics["prior_compared"] += 1; self.metrics["prior_abs_diff_total"] += diff
+        if diff == 0: self.metrics["prior_exact"] += 1
+        if diff <= 1: self.metrics["prior_within_1"] += 1
+
     def run_prefix(self, prefix: str, batch: int) -> List[DictionaryEntry]:
+        if self.seed_entries is not None: return self.run_seeded_prefix(prefix)
         strict = prefix in self.rare_prefixes; candidates = self.generate_candidates(prefix, batch, strict)
         self.metrics["candidates_generated"] += len(candidates); accepted = []
+        candidates = self.apply_frequency_prior(self.drop_inflected(candidates))
         for word in candidates:
             if self.shutdown_requested: break
             ok, entry = self.self_consistency_multilingual(word); entry.prefix = prefix
             self.metrics["attempts"] += 1
+            if ok: self.record_prior_agreement(word, entry.rarity)
             if not ok or entry.score < self.score_cut or entry.rarity >= self.rarity_cut: self.metrics["rejected"] += 1; continue
             accepted.append(entry); self.metrics["accepted"] += 1
             if len(accepted) >= batch: break
         return accepted
 
     def generate_prefixes(self, mode="2letter") -> List[str]:
+        if mode == "seeded": return sorted(self.seed_entries or {})
         if mode == "2letter":
             common_first = "stpbcmdrhlfgwyvnkjqxz"; common_second = "aeiouhrlnstmdcpgbykvwfjqxz"
             prefixes = [a + b for a in common_first for b in common_second]
             all_prefixes = {a + b for a in string.ascii_lowercase for b in string.ascii_lowercase}
             prefixes.extend(sorted(list(all_prefixes - set(prefixes)))); return prefixes
-        raise ValueError("mode must be '2letter'")
+        raise ValueError("mode must be '2letter' or 'seeded'")
 
     def save_progress(self, payload: Dict[str, Any]):
         backup = self.progress_file + ".bak"; 
@@ -319,6 +408,29 @@ Validate and provide the dictionary entry for: '{word}'
         print(f"\n=== DICTIONARY COMPLETED ===\nMain file: {filename}\nTotal entries: {len(final_entries):,}")
         return filename
 
+def load_seed_entries(path: str, target_language: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Headwords and English fields from an existing dictionary (merged_dictionary.json,
+    multilingual_dict.json or a builder output), grouped by prefix. Headwords that
+    already have a `target_language` translation are skipped.
+    """
+    seeds: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for key, record in iter_json_items(path):
+        word = key or record.get("word")
+        if not word: continue
+        if isinstance(record.get("translate"), dict):
+            en = record["translate"].get("en") or {}
+            if (record["translate"].get(target_language) or {}).get("mean"): continue
+            definition_en, example_en = en.get("mean"), en.get("example")
+        else:
+            if target_language in (record.get("translations") or {}) or record.get("target_lang") == target_language: continue
+            definition_en, example_en = record.get("definition_en"), record.get("example_en")
+        if not definition_en: continue
+        prefix = record.get("prefix") or word[:2].lower()
+        seeds[prefix].append({"word": word, "prefix": prefix, "pos": record.get("pos"), "definition_en": definition_en,
+                              "example_en": example_en, "rarity": record.get("rarity")})
+    return dict(seeds)
+
 # === THIS FUNCTION WAS MISSING ===
 def parse_temperatures(temp_str: str) -> List[float]:
     """Parse comma-separated temperature values"""
@@ -346,6 +458,12 @@ def main():
     parser.add_argument("--resume", action="store_true")
     parser.add_argument("--clean", action="store_true")
     parser.add_argument("--save-every", type=int, default=10)
+    parser.add_argument("--freq-prior", type=str, default=None, help=f"WordNet cntlist frequency prior, built on first use (default: {FREQUENCY_PRIOR_PATH})")
+    parser.add_argument("--no-freq-prior", action="store_true", help="Disable the frequency prior")
+    parser.add_argument("--seed-from", type=str, default=None, help="Reuse headwords and English fields from an existing dictionary; only target-language fields are generated")
+    parser.add_argument("--seed-votes", type=int, default=1, help="LLM calls per headword in --seed-from mode")
+    parser.add_argument("--drop-inflections", action="store_true", help="Skip inflected candidates (aahed, geese) whose base form is a WordNet lemma or another candidate")
+    parser.add_argument("--prior-reject-at", type=int, default=0, help=f"Opt-in: skip candidates whose prior rarity is >= this before any LLM call (default 0 = never). A SemCor count of 0 (rarity {UNTAGGED_RARITY}) is common for ordinary words, so this is not a rarity filter on its own")
     args = parser.parse_args()
 
     if args.vector_store and not (HAS_FAISS and HAS_EMBEDDINGS):
@@ -357,16 +475,34 @@ def main():
         os.remove(progress_file_name)
         print(f"Progress file '{progress_file_name}' removed.")
 
+    seed_entries = None
+    if args.seed_from:
+        seed_entries = load_seed_entries(args.seed_from, args.target_lang); args.mode = "seeded"
+        print(f"Seeding from {args.seed_from}: {sum(len(v) for v in seed_entries.values()):,} headwords without a {args.target_lang} translation")
+
+    frequency_prior = None
+    if not args.no_freq_prior:
+        try:
+            frequency_prior = FrequencyPrior.load(Path(args.freq_prior) if args.freq_prior else FREQUENCY_PRIOR_PATH)
+        except FileNotFoundError as e:
+            # 기본 경로의 사전 데이터가 없으면 경고만 하고 계속합니다. 명시적으로 지정한 경우에만 중단합니다.
+            if args.freq_prior:
+                print(f"Error: Cannot load frequency prior '{args.freq_prior}': {e}"); sys.exit(1)
+            print(f"Warning: Frequency prior unavailable ({e}); continuing without it")
+
     builder = MultilingualDictionaryBuilder(
         model=args.model, target_language=args.target_lang, host=args.host, port=args.port, 
         progress_file=progress_file_name, min_len=args.min_length, max_len=args.max_length,
         temps=parse_temperatures(args.temps), score_cut=args.score_cut, rarity_cut=args.rarity_cut, 
-        overgen_factor=args.overgen, use_vectors=args.vector_store, embedding_model=args.embedding_model
+        overgen_factor=args.overgen, use_vectors=args.vector_store, embedding_model=args.embedding_model,
+        frequency_prior=frequency_prior, prior_reject_at=args.prior_reject_at,
+        seed_entries=seed_entries, seed_votes=args.seed_votes, drop_inflections=args.drop_inflections
     )
     
     lang_config = builder.get_language_config()
     print("\n=== Enhanced Multilingual Dictionary Builder ==="); print(f"Model: {args.model}"); print(f"Target Language: {lang_config['name']} ({args.target_lang})");
     print(f"Mode: {args.mode}"); print(f"Batch size: {args.batch}"); print(f"Vector embeddings: {'Enabled' if args.vector_store else 'Disabled'}")
+    print(f"Frequency prior: {'Disabled' if builder.frequency_prior is None else f'{len(builder.frequency_prior):,} lemmas, ' + (f'reject at rarity >= {args.prior_reject_at}' if args.prior_reject_at else 'ordering only, no pre-rejection')}")
     print(f"Resume: {'Yes' if args.resume and not args.clean else 'No'}"); print("=" * 50)
 
     try:
@@ -378,6 +514,11 @@ def main():
         if output_file:
             print(f"\n🎉 Dictionary creation completed!"); print(f"📁 Main file: {output_file}"); print(f"🔤 Total unique words: {builder.metrics.get('accepted', 0):,}")
             print(f"🌐 Language pair: English → {lang_config['name']}")
+            compared = builder.metrics.get("prior_compared", 0)
+            if compared:
+                print(f"📊 Frequency prior: {builder.metrics.get('prior_rejected', 0):,} pre-rejected, "
+                      f"{builder.metrics.get('prior_within_1', 0) / compared:.0%} within ±1 of LLM rarity ({compared:,} compared)")
+            if args.drop_inflections: print(f"✂️  Inflected candidates skipped: {builder.metrics.get('inflections_dropped', 0):,}")
             if args.vector_store: print(f"🔍 Vector search enabled")
             print("\n💡 Next steps:"); print(f"   - Import into LangChain using the *_langchain_*.json file"); print(f"   - Build search index"); print(f"   - Create web interface or API")
     except KeyboardInterrupt:
@@ -0,0 +1,173 @@
+# dictionary_project/lang_plugins/__init__.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Lazy registry of language plugins.
+
+Plugins are discovered by language code without importing them:
+  - modules in this package named `<lang>_parser.py`, and
+  - third-party modules registered under the `llm_dictionary.lang_plugins`
+    entry-point group (entry-point name = language code, value = module path).
+A plugin module (and its Pydantic models) is imported only when that language
+is first requested.
+
+Keyword extractors (used to backfill `word_<lang>` keys) are registered the same
+way: `<lang>_keywords.py` modules in this package exposing `extract_keyword`, or
+the `llm_dictionary.keyword_extractors` entry-point group.
+
+Entry validators follow the same scheme: `<lang>_validator.py` modules (or the
+`llm_dictionary.validators` entry-point group) exposing `FEATURE_MODEL`, the
+language's Features model, and `validate_features(features) -> (ok, message)`.
+"""
+
+import importlib
+import pkgutil
+from functools import lru_cache
+from importlib.metadata import entry_points
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+PLUGIN_ENTRY_POINT_GROUP = "llm_dictionary.lang_plugins"
+KEYWORD_ENTRY_POINT_GROUP = "llm_dictionary.keyword_extractors"
+VALIDATOR_ENTRY_POINT_GROUP = "llm_dictionary.validators"
+_PARSER_SUFFIX = "_parser"
+_KEYWORDS_SUFFIX = "_keywords"
+_VALIDATOR_SUFFIX = "_validator"
+
+
+@lru_cache(maxsize=None)
+def _discover(suffix: str = _PARSER_SUFFIX, group: str = PLUGIN_ENTRY_POINT_GROUP) -> Dict[str, str]:
+    """Map language code -> plugin module path. Reads names only; nothing is imported."""
+    plugins = {
+        name[:-len(suffix)]: f"{__name__}.{name}"
+        for _, name, _ in pkgutil.iter_modules(__path__)
+        if name.endswith(suffix)
+    }
+    for ep in entry_points(group=group):
+        plugins.setdefault(ep.name, ep.value)
+    return plugins
+
+
+def available_languages() -> List[str]:
+    """Language codes that have a plugin, without importing any of them."""
+    return sorted(_discover())
+
+
+@lru_cache(maxsize=None)
+def load_plugin(lang: str) -> ModuleType:
+    """Import the plugin module for `lang` on first use."""
+    module_path = _discover().get(lang)
+    if module_path is None:
+        raise KeyError(f"No language plugin registered for '{lang}'")
+    return importlib.import_module(module_path)
+
+
+def _find_attr(module: ModuleType, predicate: Callable[[str, Any], bool], what: str) -> Any:
+    for name, obj in vars(module).items():
+        if getattr(obj, "__module__", None) == module.__name__ and predicate(name, obj):
+            return obj
+    raise LookupError(f"Plugin module '{module.__name__}' defines no {what}")
+
+
+@lru_cache(maxsize=None)
+def get_raw_model(lang: str) -> type:
+    """The `Raw*Data` model of a language plugin (e.g. RawGermanData for 'de')."""
+    return _find_attr(
+        load_plugin(lang),
+        lambda name, obj: isinstance(obj, type) and name.startswith("Raw") and name.endswith("Data"),
+        "Raw*Data model",
+    )
+
+
+@lru_cache(maxsize=None)
+def get_parser(lang: str) -> Callable:
+    """The `parse_*_data` coroutine of a language plugin."""
+    return _find_attr(
+        load_plugin(lang),
+        lambda name, obj: callable(obj) and name.startswith("parse_") and name.endswith("_data"),
+        "parse_*_data function",
+    )
+
+
+def keyword_languages() -> List[str]:
+    """Language codes that have a keyword extractor, without importing any of them."""
+    return sorted(_discover(_KEYWORDS_SUFFIX, KEYWORD_ENTRY_POINT_GROUP))
+
+
+@lru_cache(maxsize=None)
+def get_keyword_extractor(lang: str) -> Callable[[str, str], Optional[str]]:
+    """The `extract_keyword(definition, example)` function registered for `lang`."""
+    spec = _discover(_KEYWORDS_SUFFIX, KEYWORD_ENTRY_POINT_GROUP).get(lang)
+    if spec is None:
+        raise KeyError(f"No keyword extractor registered for '{lang}'")
+    target = resolve(spec)
+    return target if callable(target) else getattr(target, "extract_keyword")
+
+
+def validator_languages() -> List[str]:
+    """Language codes that have an entry validator, without importing any of them."""
+    return sorted(_discover(_VALIDATOR_SUFFIX, VALIDATOR_ENTRY_POINT_GROUP))
+
+
+@lru_cache(maxsize=None)
+def load_validator_plugin(lang: str) -> ModuleType:
+    """Import the validator module for `lang` on first use."""
+    spec = _discover(_VALIDATOR_SUFFIX, VALIDATOR_ENTRY_POINT_GROUP).get(lang)
+    if spec is None:
+        raise KeyError(f"No entry validator registered for '{lang}'")
+    return resolve(spec)
+
+
+def get_feature_validator(lang: str) -> Callable[[Any], Tuple[bool, str]]:
+    """The `validate_features` function registered for `lang`."""
+    return getattr(load_validator_plugin(lang), "validate_features")
+
+
+def get_feature_model(lang: str) -> type:
+    """The Features model (e.g. GermanFeatures) that `lang`'s validator expects."""
+    return getattr(load_validator_plugin(lang), "FEATURE_MODEL")
+
+
+def resolve(spec: str) -> Any:
+    """Import and return the object named by a 'package.module:attribute' spec."""
+    module_path, _, attr = spec.partition(":")
+    module = importlib.import_module(module_path)
+    return getattr(module, attr) if attr else module
+
+
+class LazyRegistry(Mapping):
+    """
+    Read-only mapping whose keys are known up front but whose values are loaded on
+    first access. Membership tests and iteration never trigger an import.
+    """
+
+    def __init__(self, keys: Callable[[], Iterable[str]], loader: Callable[[str], Any]):
+        self._keys = keys
+        self._known: Optional[Dict[str, None]] = None
+        self._loader = lru_cache(maxsize=None)(loader)
+
+    def _known_keys(self) -> Dict[str, None]:
+        # 검증 시 항목마다 멤버십을 확인하므로 탐색 결과는 한 번만 계산합니다 (순서 유지).
+        if self._known is None:
+            self._known = dict.fromkeys(self._keys())
+        return self._known
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._known_keys():
+            raise KeyError(key)
+        return self._loader(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._known_keys()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._known_keys()))
+
+    def __len__(self) -> int:
+        return len(self._known_keys())
+
+    @classmethod
+    def from_specs(cls, specs: Mapping[str, str]) -> "LazyRegistry":
+        """Build a registry from {key: 'module:attribute'} specs."""
+        return cls(lambda: specs.keys(), lambda key: resolve(specs[key]))
@@ -0,0 +1,19 @@
+# dictionary_project/lang_plugins/de_keywords.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+import re
+from typing import Optional
+
+# 독일어 명사는 대문자로 시작하므로 정의문에서 첫 번째 대문자 단어(관사 제외)를 고릅니다.
+# 예: 'Ein Tierpark, in dem...' -> 'Tierpark'
+_NOUN_RE = re.compile(r"\b[A-ZÄÖÜ][a-zäöüß]+\b")
+_ARTICLES = frozenset({"Ein", "Eine", "Einen", "Einem", "Einer", "Der", "Die", "Das", "Den", "Dem"})
+
+
+def extract_keyword(definition: str, example: str) -> Optional[str]:
+    """German headword candidate: the first capitalized word of the definition that is not an article."""
+    for word in _NOUN_RE.findall(definition or ""):
+        if word not in _ARTICLES:
+            return word
+    return None
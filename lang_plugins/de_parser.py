@@ -44,11 +44,11 @@ async def parse_german_data(raw_data: RawGermanData) -> GermanFeatures:
         plural=await create_value_field(raw_data.plural, "plural", provenance, lang="de"),
         declension_table=[
             Inflection(form=await create_value_field(form, case, provenance, lang="de"), type=case)
-            async for case, form in raw_data.declensions.items()
+            for case, form in raw_data.declensions.items()
         ],
         examples=[
             await create_value_field(ex, "examples", provenance, lang="de")
-            async for ex in all_examples
+            for ex in all_examples
         ]
     )
 
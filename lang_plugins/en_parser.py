@@ -39,7 +39,7 @@ async def parse_english_data(raw_data: RawEnglishData) -> EnglishFeatures:
         definition=await create_value_field(raw_data.definition_target, "definition", provenance, lang="en"),
         examples=[
             await create_value_field(ex, "examples", provenance, lang="en")
-            async for ex in all_examples
+            for ex in all_examples
         ]
     )
 
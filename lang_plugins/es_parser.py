@@ -44,11 +44,11 @@ async def parse_spanish_data(raw_data: RawSpanishData) -> SpanishFeatures:
         number=await create_value_field(raw_data.number, "number", provenance, lang="es"),
         verb_conjugations=[
             Inflection(form=await create_value_field(form, tense, provenance, lang="es"), type=tense)
-            async for tense, form in raw_data.verb_conjugations.items()
+            for tense, form in raw_data.verb_conjugations.items()
         ],
         examples=[
             await create_value_field(ex, "examples", provenance, lang="es")
-            async for ex in all_examples
+            for ex in all_examples
         ]
     )
 
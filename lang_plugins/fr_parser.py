@@ -44,11 +44,11 @@ async def parse_french_data(raw_data: RawFrenchData) -> FrenchFeatures:
         number=await create_value_field(raw_data.number, "number", provenance, lang="fr"),
         verb_tenses=[
             Inflection(form=await create_value_field(form, tense, provenance, lang="fr"), type=tense)
-            async for tense, form in raw_data.verb_tenses.items()
+            for tense, form in raw_data.verb_tenses.items()
         ],
         examples=[
             await create_value_field(ex, "examples", provenance, lang="fr")
-            async for ex in all_examples
+            for ex in all_examples
         ]
     )
 
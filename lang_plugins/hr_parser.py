@@ -43,12 +43,12 @@ async def parse_croatian_data(raw_data: RawCroatianData) -> CroatianFeatures:
         gender=await create_value_field(raw_data.gender, "gender", provenance, lang="hr"),
         declensions=[
             Inflection(form=await create_value_field(form, case, provenance, lang="hr"), type=case)
-            async for case, form in raw_data.declensions.items()
+            for case, form in raw_data.declensions.items()
         ],
         aspect=await create_value_field(raw_data.aspect, "aspect", provenance, lang="hr"),
         examples=[
             await create_value_field(ex, "examples", provenance, lang="hr")
-            async for ex in all_examples
+            for ex in all_examples
         ]
     )
 
@@ -48,11 +48,11 @@ async def parse_japanese_data(raw_data: RawJapaneseData) -> JapaneseFeatures:
         romanization=await create_value_field(raw_data.romanization, "romanization", provenance, lang="ja"),
         politeness_levels=[
             Inflection(form=await create_value_field(form, p_level, provenance, lang="ja"), type=p_level)
-            async for p_level, form in raw_data.politeness_levels.items()
+            for p_level, form in raw_data.politeness_levels.items()
         ],
         examples=[
             await create_value_field(ex, "examples", provenance, lang="ja")
-            async for ex in all_examples
+            for ex in all_examples
         ]
     )
 
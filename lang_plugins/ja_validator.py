@@ -0,0 +1,12 @@
+# dictionary_project/lang_plugins/ja_validator.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""Japanese entry validator plugin: the rules live in validators.custom_validator."""
+
+from schemas.base import JapaneseFeatures
+from validators.custom_validator import validate_japanese_features as validate_features
+
+FEATURE_MODEL = JapaneseFeatures
+
+__all__ = ["FEATURE_MODEL", "validate_features"]
@@ -0,0 +1,16 @@
+# dictionary_project/lang_plugins/ko_keywords.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+import re
+from typing import Optional
+
+# 예문에서 조사(을/를, 으로/로, 은/는, 이/가) 바로 앞의 어절을 대표 단어로 봅니다.
+# 예: '동물원을 방문했다' -> '동물원'
+_PARTICLE_RE = re.compile(r"(\S+?)(?:을|를|으로|로|은|는|이|가)\s")
+
+
+def extract_keyword(definition: str, example: str) -> Optional[str]:
+    """Korean headword candidate: the first noun marked by a case particle in the example."""
+    match = _PARTICLE_RE.search(example or "")
+    return match.group(1) if match else None
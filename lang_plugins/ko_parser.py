@@ -43,11 +43,11 @@ async def parse_korean_data(raw_data: RawKoreanData) -> KoreanFeatures:
         romanization=await create_value_field(raw_data.romanization, "romanization", provenance, lang="ko"),
         conjugation_samples=[
             Inflection(form=await create_value_field(form, c_type, provenance, lang="ko"), type=c_type)
-            async for c_type, form in raw_data.conjugations.items()
+            for c_type, form in raw_data.conjugations.items()
         ],
         examples=[
             await create_value_field(ex, "examples", provenance, lang="ko")
-            async for ex in all_examples
+            for ex in all_examples
         ],
         definition=await create_value_field(raw_data.definition_target, "definition", provenance, lang="ko")
     )
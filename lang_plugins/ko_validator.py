@@ -0,0 +1,12 @@
+# dictionary_project/lang_plugins/ko_validator.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""Korean entry validator plugin: the rules live in validators.custom_validator."""
+
+from schemas.base import KoreanFeatures
+from validators.custom_validator import validate_korean_features as validate_features
+
+FEATURE_MODEL = KoreanFeatures
+
+__all__ = ["FEATURE_MODEL", "validate_features"]
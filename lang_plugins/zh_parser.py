@@ -48,11 +48,11 @@ async def parse_chinese_data(raw_data: RawChineseData) -> ChineseFeatures:
         tones=await create_value_field(raw_data.tones, "tones", provenance, lang="zh"),
         measure_words=[
             Inflection(form=await create_value_field(form, m_word, provenance, lang="zh"), type=m_word)
-            async for m_word, form in raw_data.measure_words.items()
+            for m_word, form in raw_data.measure_words.items()
         ],
         examples=[
             await create_value_field(ex, "examples", provenance, lang="zh")
-            async for ex in all_examples
+            for ex in all_examples
         ]
     )
 
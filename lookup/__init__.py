@@ -0,0 +1,28 @@
+# dictionary_project/lookup/__init__.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+import importlib
+
+# 하위 모듈은 처음 접근할 때 임포트됩니다 (`python -m lookup.<module>` 실행 시 중복 임포트 방지).
+_EXPORTS = {
+    "PackedDictionary": "lookup.packed",
+    "canonical_entry": "lookup.packed",
+    "convert": "lookup.packed",
+    "load_canonical_entries": "lookup.packed",
+    "write_packed": "lookup.packed",
+    "DictionaryStore": "lookup.store",
+    "ReverseIndex": "lookup.reverse_index",
+    "NgramIndex": "lookup.ngram_index",
+    "FuzzyIndex": "lookup.fuzzy",
+    "SearchDatabase": "lookup.sqlite_export",
+    "LookupService": "lookup.server",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,179 @@
+# dictionary_project/lookup/fuzzy.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Typo-tolerant headword lookup with a symmetric-delete (SymSpell-style) index.
+
+Every headword contributes the strings obtained by deleting up to `max_distance`
+characters from its first `prefix_length` characters; a query generates the same
+deletes and only headwords sharing one of them are compared with a real
+(optimal string alignment) edit distance. Suggestions are ranked by distance,
+then the entry's `score`, then frequency (SemCor count from the frequency prior
+when given, otherwise the inverse of the stored rarity).
+
+Usage:
+  python -m lookup.fuzzy dictionary.ldict aardvrak elefant
+  python -m lookup.fuzzy dictionary.ldict --memory
+"""
+
+import argparse
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from lookup.store import DictionaryStore
+from utils.frequency import FrequencyPrior
+
+DEFAULT_MAX_DISTANCE = 2
+DEFAULT_PREFIX_LENGTH = 7
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Optimal string alignment distance, or max_distance + 1 once it is known to exceed the bound."""
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+def deletes(word: str, max_distance: int) -> Set[str]:
+    """`word` and every string reachable from it by deleting up to `max_distance` characters."""
+    result = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        result |= frontier
+    return result
+
+
+@dataclass
+class Suggestion:
+    word: str
+    entry_id: int
+    distance: int
+    score: float
+    frequency: int
+
+
+class FuzzyIndex:
+    """Symmetric-delete index over a store's headwords."""
+
+    def __init__(self, store: DictionaryStore, prior: Optional[FrequencyPrior] = None,
+                 max_distance: int = DEFAULT_MAX_DISTANCE, prefix_length: int = DEFAULT_PREFIX_LENGTH):
+        if prefix_length <= max_distance:
+            raise ValueError("prefix_length must be larger than max_distance")
+        self.store = store
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.words: List[str] = []
+        # Most delete keys belong to a single headword, so those store a bare id instead of a list.
+        self._deletes: Dict[str, Union[int, List[int]]] = {}
+        attrs = store.packed.attr_table()
+        self._scores = attrs["score"].tolist()
+        rarities = attrs["rarity"].tolist()
+        for entry_id in range(len(store)):
+            word = store.word_at(entry_id).lower()
+            self.words.append(word)
+            for key in deletes(word[:prefix_length], max_distance):
+                bucket = self._deletes.get(key)
+                if bucket is None:
+                    self._deletes[key] = entry_id
+                elif isinstance(bucket, int):
+                    self._deletes[key] = [bucket, entry_id]
+                else:
+                    bucket.append(entry_id)
+        if prior is not None:
+            self._frequencies = [prior.count(word) or 0 for word in self.words]
+        else:
+            # 희귀도 1(가장 흔함) ~ 5(가장 드묾); 값이 없으면 0으로 둡니다.
+            self._frequencies = [6 - rarity if rarity else 0 for rarity in rarities]
+
+    def __len__(self) -> int:
+        return len(self._deletes)
+
+    def suggest(self, query: str, max_distance: Optional[int] = None, limit: Optional[int] = 5) -> List[Suggestion]:
+        """Headwords within `max_distance` edits of `query`, best first."""
+        max_distance = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        query = query.strip().lower()
+        if not query:
+            return []
+        seen: Set[int] = set()
+        suggestions: List[Tuple[Tuple[int, float, int], Suggestion]] = []
+        for key in deletes(query[:self.prefix_length], max_distance):
+            bucket = self._deletes.get(key)
+            if bucket is None:
+                continue
+            for entry_id in ((bucket,) if isinstance(bucket, int) else bucket):
+                if entry_id in seen:
+                    continue
+                seen.add(entry_id)
+                word = self.words[entry_id]
+                distance = edit_distance(query, word, max_distance)
+                if distance > max_distance:
+                    continue
+                suggestion = Suggestion(self.store.word_at(entry_id), entry_id, distance,
+                                        self._scores[entry_id], self._frequencies[entry_id])
+                suggestions.append(((distance, -suggestion.score, -suggestion.frequency), suggestion))
+        suggestions.sort(key=lambda item: item[0])
+        return [s for _, s in suggestions[:limit]]
+
+
+def measure_build(store: DictionaryStore, prior: Optional[FrequencyPrior] = None,
+                  **kwargs) -> Tuple[FuzzyIndex, int, float]:
+    """Build an index and return it with its allocated bytes (tracemalloc) and untraced build seconds."""
+    started = time.perf_counter()
+    FuzzyIndex(store, prior, **kwargs)
+    seconds = time.perf_counter() - started
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    index = FuzzyIndex(store, prior, **kwargs)
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return index, allocated, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuzzy headword lookup (symmetric-delete index)")
+    parser.add_argument("store", type=Path)
+    parser.add_argument("words", nargs="*")
+    parser.add_argument("--max-distance", type=int, default=DEFAULT_MAX_DISTANCE)
+    parser.add_argument("--prefix-length", type=int, default=DEFAULT_PREFIX_LENGTH)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--freq-prior", action="store_true", help="Rank ties by WordNet SemCor counts")
+    parser.add_argument("--memory", action="store_true", help="Report index size and build time")
+    args = parser.parse_args()
+
+    with DictionaryStore(args.store) as store:
+        prior = FrequencyPrior.load() if args.freq_prior else None
+        kwargs = {"max_distance": args.max_distance, "prefix_length": args.prefix_length}
+        if args.memory:
+            index, allocated, seconds = measure_build(store, prior, **kwargs)
+            print(f"{len(store):,} headwords -> {len(index):,} delete keys, {allocated / 1e6:.1f} MB, built in {seconds:.2f}s")
+        else:
+            index = FuzzyIndex(store, prior, **kwargs)
+        for word in args.words:
+            found = index.suggest(word, limit=args.limit)
+            print(f"{word}\t" + (", ".join(f"{s.word} ({s.distance})" for s in found) or "-"))
+
+
+if __name__ == "__main__":
+    main()
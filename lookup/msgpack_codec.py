@@ -0,0 +1,149 @@
+# dictionary_project/lookup/msgpack_codec.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+MessagePack encoding for packed dictionary records.
+
+Uses the `msgpack` package when it is installed and otherwise a small built-in
+codec for the subset the records need (None, bool, int, float, str, bytes, list,
+dict). Both produce standard MessagePack, so files written with either one can be
+read with the other or with any external MessagePack tool.
+"""
+
+import struct
+from typing import Any, Tuple
+
+from utils.model_registry import is_available
+
+HAS_MSGPACK = is_available("msgpack")
+
+
+def _pack_into(out: bytearray, obj: Any):
+    if obj is None:
+        out.append(0xC0)
+    elif obj is True:
+        out.append(0xC3)
+    elif obj is False:
+        out.append(0xC2)
+    elif isinstance(obj, int):
+        if 0 <= obj < 0x80:
+            out.append(obj)
+        elif -32 <= obj < 0:
+            out.append(obj & 0xFF)
+        elif 0 <= obj <= 0xFFFFFFFF:
+            out += struct.pack(">BI", 0xCE, obj) if obj > 0xFFFF else struct.pack(">BH", 0xCD, obj)
+        elif -0x80000000 <= obj < 0:
+            out += struct.pack(">Bi", 0xD2, obj)
+        else:
+            out += struct.pack(">Bq", 0xD3, obj)
+    elif isinstance(obj, float):
+        out += struct.pack(">Bd", 0xCB, obj)
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8")
+        size = len(data)
+        if size < 32:
+            out.append(0xA0 | size)
+        elif size < 0x100:
+            out += struct.pack(">BB", 0xD9, size)
+        elif size < 0x10000:
+            out += struct.pack(">BH", 0xDA, size)
+        else:
+            out += struct.pack(">BI", 0xDB, size)
+        out += data
+    elif isinstance(obj, (bytes, bytearray)):
+        size = len(obj)
+        out += struct.pack(">BB", 0xC4, size) if size < 0x100 else struct.pack(">BI", 0xC6, size)
+        out += obj
+    elif isinstance(obj, (list, tuple)):
+        size = len(obj)
+        out += bytes([0x90 | size]) if size < 16 else struct.pack(">BI", 0xDD, size)
+        for item in obj:
+            _pack_into(out, item)
+    elif isinstance(obj, dict):
+        size = len(obj)
+        out += bytes([0x80 | size]) if size < 16 else struct.pack(">BI", 0xDF, size)
+        for key, value in obj.items():
+            _pack_into(out, key)
+            _pack_into(out, value)
+    else:
+        raise TypeError(f"Cannot pack {type(obj).__name__}")
+
+
+_FIXED = {0xCC: ">B", 0xCD: ">H", 0xCE: ">I", 0xCF: ">Q", 0xD0: ">b", 0xD1: ">h", 0xD2: ">i", 0xD3: ">q",
+          0xCA: ">f", 0xCB: ">d"}
+_STR_LEN = {0xD9: ">B", 0xDA: ">H", 0xDB: ">I"}
+_BIN_LEN = {0xC4: ">B", 0xC5: ">H", 0xC6: ">I"}
+_ARRAY_LEN = {0xDC: ">H", 0xDD: ">I"}
+_MAP_LEN = {0xDE: ">H", 0xDF: ">I"}
+
+
+def _unpack_from(buf, pos: int) -> Tuple[Any, int]:
+    tag = buf[pos]
+    pos += 1
+    if tag < 0x80:
+        return tag, pos
+    if tag >= 0xE0:
+        return tag - 0x100, pos
+    if 0xA0 <= tag <= 0xBF:
+        end = pos + (tag & 0x1F)
+        return bytes(buf[pos:end]).decode("utf-8"), end
+    if 0x90 <= tag <= 0x9F:
+        return _unpack_array(buf, pos, tag & 0x0F)
+    if 0x80 <= tag <= 0x8F:
+        return _unpack_map(buf, pos, tag & 0x0F)
+    if tag == 0xC0:
+        return None, pos
+    if tag == 0xC2:
+        return False, pos
+    if tag == 0xC3:
+        return True, pos
+    if tag in _FIXED:
+        fmt = _FIXED[tag]
+        return struct.unpack_from(fmt, buf, pos)[0], pos + struct.calcsize(fmt)
+    for table, kind in ((_STR_LEN, "str"), (_BIN_LEN, "bin"), (_ARRAY_LEN, "array"), (_MAP_LEN, "map")):
+        if tag in table:
+            fmt = table[tag]
+            size = struct.unpack_from(fmt, buf, pos)[0]
+            pos += struct.calcsize(fmt)
+            if kind == "str":
+                return bytes(buf[pos:pos + size]).decode("utf-8"), pos + size
+            if kind == "bin":
+                return bytes(buf[pos:pos + size]), pos + size
+            if kind == "array":
+                return _unpack_array(buf, pos, size)
+            return _unpack_map(buf, pos, size)
+    raise ValueError(f"Unsupported MessagePack type 0x{tag:02x}")
+
+
+def _unpack_array(buf, pos: int, size: int) -> Tuple[list, int]:
+    items = []
+    for _ in range(size):
+        item, pos = _unpack_from(buf, pos)
+        items.append(item)
+    return items, pos
+
+
+def _unpack_map(buf, pos: int, size: int) -> Tuple[dict, int]:
+    result = {}
+    for _ in range(size):
+        key, pos = _unpack_from(buf, pos)
+        result[key], pos = _unpack_from(buf, pos)
+    return result, pos
+
+
+def packb(obj: Any) -> bytes:
+    if HAS_MSGPACK:
+        import msgpack
+        return msgpack.packb(obj, use_bin_type=True)
+    out = bytearray()
+    _pack_into(out, obj)
+    return bytes(out)
+
+
+def unpackb(data) -> Any:
+    if HAS_MSGPACK:
+        import msgpack
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    value, _ = _unpack_from(memoryview(data) if not isinstance(data, memoryview) else data, 0)
+    return value
@@ -0,0 +1,347 @@
+# dictionary_project/lookup/ngram_index.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Character n-gram substring index over target-language definitions and examples.
+
+Whitespace tokenization is meaningless for Japanese, Korean and Chinese text, so
+every field (`definition_target` / `example_target`, i.e. `translations[lang]`
+definition and example once packed; "en" indexes definition_en / example_en) is
+cut into overlapping 1..3-character grams after NFKC + casefold. Each gram maps to a posting list of document ids
+(document = entry id * 2 + field), stored delta + varint encoded.
+
+A query of up to 3 characters is a gram, so its posting list is the answer.
+Longer queries intersect the posting lists of their trigrams (shortest list
+first) and verify each candidate against the stored field text, so results are
+always exact substring matches.
+
+One `.ngram` file per language (little endian, sections 8-byte aligned):
+  header      magic b"LNGRAM\\x00\\x01", version, max gram size, doc count, gram count, section offsets
+  meta        UTF-8 JSON: language, source store hash
+  grams       uint32[grams + 1] offsets + UTF-8 blob, sorted
+  postings    uint64[grams + 1] offsets + varint blob
+  docs        uint32[docs + 1] offsets + normalized UTF-8 field texts
+
+Usage:
+  python -m lookup.ngram_index build dictionary.ldict
+  python -m lookup.ngram_index query dictionary.ldict ja 夜行性
+"""
+
+import argparse
+import json
+import mmap
+import struct
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from lookup.store import DictionaryStore
+from utils.hashing import file_sha1
+
+CJK_LANGS = ("ja", "ko", "zh")
+ENGLISH = "en"
+DEFAULT_MAX_GRAM = 3
+FIELDS = ("definition", "example")
+
+_MAGIC = b"LNGRAM\x00\x01"
+_VERSION = 1
+_HEADER = struct.Struct("<8sHHII5Q")  # magic, version, max gram, docs, grams, meta/grams/postings/docs offsets, file size
+
+
+def normalize_text(text: str) -> str:
+    return unicodedata.normalize("NFKC", text or "").casefold()
+
+
+def ngram_index_path_for(store_path: Union[str, Path], lang: str) -> Path:
+    store_path = Path(store_path)
+    return store_path.with_name(f"{store_path.stem}.{lang}.ngram")
+
+
+# ---------------------------------------------------------------------------
+# Posting list encoding
+# ---------------------------------------------------------------------------
+
+def encode_postings(doc_ids: Sequence[int]) -> bytes:
+    """Ascending doc ids -> delta + LEB128 varint bytes."""
+    out = bytearray()
+    previous = 0
+    for doc_id in doc_ids:
+        delta = doc_id - previous
+        previous = doc_id
+        while delta >= 0x80:
+            out.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        out.append(delta)
+    return bytes(out)
+
+
+def decode_postings(data) -> np.ndarray:
+    """Inverse of `encode_postings`, vectorized: one numpy pass instead of a per-byte loop."""
+    raw = np.frombuffer(data, dtype=np.uint8)
+    if not len(raw):
+        return np.zeros(0, dtype=np.int64)
+    ends = np.flatnonzero(raw < 0x80)
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    shifts = (np.arange(len(raw)) - np.repeat(starts, ends - starts + 1)) * 7
+    deltas = np.add.reduceat((raw & 0x7F).astype(np.int64) << shifts, starts)
+    return np.cumsum(deltas)
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+def iter_grams(text: str, max_gram: int = DEFAULT_MAX_GRAM) -> Iterable[str]:
+    for size in range(1, max_gram + 1):
+        for start in range(len(text) - size + 1):
+            gram = text[start:start + size]
+            if not gram.isspace():
+                yield gram
+
+
+def field_texts(entry: Dict[str, Any], lang: str) -> Tuple[str, str]:
+    """(definition, example) of `entry` in `lang`; "en" indexes the English fields."""
+    if lang == ENGLISH:
+        return entry.get("definition_en") or "", entry.get("example_en") or ""
+    translation = entry.get("translations", {}).get(lang) or {}
+    return translation.get("definition") or "", translation.get("example") or ""
+
+
+def _align(f) -> int:
+    pos = f.tell()
+    if pos % 8:
+        f.write(b"\0" * (8 - pos % 8))
+    return f.tell()
+
+
+def _write_string_table(f, strings: Sequence[bytes]):
+    offset = 0
+    f.write(struct.pack("<I", 0))
+    for data in strings:
+        offset += len(data)
+        f.write(struct.pack("<I", offset))
+    for data in strings:
+        f.write(data)
+
+
+def build_ngram_index(store: DictionaryStore, lang: str, path: Union[str, Path],
+                      max_gram: int = DEFAULT_MAX_GRAM) -> Dict[str, int]:
+    """Index one language's definitions and examples from `store` into `path`. Returns size stats."""
+    texts: List[bytes] = []
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for entry_id in range(len(store)):
+        fields = field_texts(store.packed.entry(entry_id), lang)
+        for field_id, raw in enumerate(fields):
+            doc_id = entry_id * 2 + field_id
+            text = normalize_text(raw)
+            texts.append(text.encode("utf-8"))
+            for gram in set(iter_grams(text, max_gram)):
+                postings[gram].append(doc_id)
+
+    grams = sorted(postings, key=lambda g: g.encode("utf-8"))
+    meta = {"lang": lang, "max_gram": max_gram, "source_sha1": file_sha1(store.path), "fields": list(FIELDS)}
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+        meta_off = _align(f)
+        f.write(json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+        grams_off = _align(f)
+        _write_string_table(f, [g.encode("utf-8") for g in grams])
+        postings_off = _align(f)
+        encoded = [encode_postings(postings[g]) for g in grams]
+        offset = 0
+        f.write(struct.pack("<Q", 0))
+        for data in encoded:
+            offset += len(data)
+            f.write(struct.pack("<Q", offset))
+        for data in encoded:
+            f.write(data)
+        docs_off = _align(f)
+        _write_string_table(f, texts)
+        size = f.tell()
+        f.seek(0)
+        f.write(_HEADER.pack(_MAGIC, _VERSION, max_gram, len(texts), len(grams), meta_off, grams_off,
+                             postings_off, docs_off, size))
+    tmp_path.replace(path)
+    return {"docs": len(texts), "grams": len(grams), "postings_bytes": offset, "bytes": size}
+
+
+# ---------------------------------------------------------------------------
+# Query
+# ---------------------------------------------------------------------------
+
+@dataclass
+class NgramMatch:
+    entry_id: int
+    field: str
+
+
+class NgramIndex:
+    """Memory-mapped n-gram index for one language."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.max_gram, self._doc_count, self._gram_count, meta_off, grams_off,
+         postings_off, docs_off, size) = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION or size != len(self._mm):
+            self._mm.close()
+            raise ValueError(f"{self.path} is not a complete version {_VERSION} n-gram index")
+        self.meta = json.loads(bytes(self._mm[meta_off:grams_off]).rstrip(b"\0"))
+        self.lang: str = self.meta["lang"]
+        self._grams_off = grams_off
+        self._gram_blob = grams_off + 4 * (self._gram_count + 1)
+        self._postings_off = postings_off
+        self._postings_blob = postings_off + 8 * (self._gram_count + 1)
+        self._docs_off = docs_off
+        self._docs_blob = docs_off + 4 * (self._doc_count + 1)
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self) -> "NgramIndex":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _gram_at(self, i: int) -> bytes:
+        start, end = struct.unpack_from("<II", self._mm, self._grams_off + 4 * i)
+        return self._mm[self._gram_blob + start:self._gram_blob + end]
+
+    def _find_gram(self, key: bytes) -> Optional[int]:
+        lo, hi = 0, self._gram_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._gram_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self._gram_count and self._gram_at(lo) == key else None
+
+    def _posting_bounds(self, gram: str) -> Optional[tuple]:
+        i = self._find_gram(gram.encode("utf-8"))
+        if i is None:
+            return None
+        start, end = struct.unpack_from("<QQ", self._mm, self._postings_off + 8 * i)
+        return self._postings_blob + start, self._postings_blob + end
+
+    def postings(self, gram: str) -> np.ndarray:
+        bounds = self._posting_bounds(normalize_text(gram))
+        return np.zeros(0, dtype=np.int64) if bounds is None else decode_postings(self._mm[bounds[0]:bounds[1]])
+
+    def doc_text(self, doc_id: int) -> str:
+        return self._doc_bytes(doc_id).decode("utf-8")
+
+    def _doc_bytes(self, doc_id: int) -> bytes:
+        start, end = struct.unpack_from("<II", self._mm, self._docs_off + 4 * doc_id)
+        return self._mm[self._docs_blob + start:self._docs_blob + end]
+
+    def candidates(self, query: str) -> np.ndarray:
+        """Doc ids containing every gram of `query` (a superset of the exact matches)."""
+        size = min(len(query), self.max_gram)
+        grams = {query[i:i + size] for i in range(len(query) - size + 1)}
+        bounds = []
+        for gram in grams:
+            found = self._posting_bounds(gram)
+            if found is None:
+                return np.zeros(0, dtype=np.int64)
+            bounds.append(found)
+        # 가장 짧은 포스팅부터 교집합을 구해 후보 수를 빠르게 줄입니다.
+        bounds.sort(key=lambda b: b[1] - b[0])
+        result = decode_postings(self._mm[bounds[0][0]:bounds[0][1]])
+        for start, end in bounds[1:]:
+            if not len(result):
+                break
+            result = np.intersect1d(result, decode_postings(self._mm[start:end]), assume_unique=True)
+        return result
+
+    def search_docs(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """Doc ids whose normalized text contains `query`, in doc order."""
+        query = normalize_text(query)
+        if not query:
+            return []
+        if len(query) <= self.max_gram:
+            # The query is itself an indexed gram, so its posting list is already exact.
+            doc_ids = self.postings(query)
+            return doc_ids[:limit].tolist()
+        needle = query.encode("utf-8")
+        matches = []
+        for doc_id in self.candidates(query).tolist():
+            if needle in self._doc_bytes(doc_id):
+                matches.append(doc_id)
+                if limit is not None and len(matches) >= limit:
+                    break
+        return matches
+
+    def search(self, query: str, limit: Optional[int] = None, field: Optional[str] = None) -> List[NgramMatch]:
+        """Entries whose definition or example (or only `field`) contains `query`."""
+        matches = []
+        for doc_id in self.search_docs(query):
+            match = NgramMatch(doc_id >> 1, FIELDS[doc_id & 1])
+            if field is None or match.field == field:
+                matches.append(match)
+                if limit is not None and len(matches) >= limit:
+                    break
+        return matches
+
+    def search_entries(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """Distinct entry ids with a match in any field."""
+        entry_ids: List[int] = []
+        for doc_id in self.search_docs(query):
+            if not entry_ids or entry_ids[-1] != doc_id >> 1:
+                entry_ids.append(doc_id >> 1)
+                if limit is not None and len(entry_ids) >= limit:
+                    break
+        return entry_ids
+
+    def is_current(self, store: DictionaryStore) -> bool:
+        return self.meta.get("source_sha1") == file_sha1(store.path)
+
+
+def build_all(store: DictionaryStore, langs: Optional[Iterable[str]] = None,
+              max_gram: int = DEFAULT_MAX_GRAM) -> Dict[str, Dict[str, int]]:
+    """Build `<store>.<lang>.ngram` for `langs` (default: the CJK languages the store carries)."""
+    langs = list(langs) if langs else [lang for lang in store.langs if lang in CJK_LANGS]
+    return {lang: build_ngram_index(store, lang, ngram_index_path_for(store.path, lang), max_gram) for lang in langs}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query CJK substring indexes over definitions/examples")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Build <store>.<lang>.ngram files")
+    build.add_argument("store", type=Path)
+    build.add_argument("--langs", nargs="*", default=None, help=f"Default: {', '.join(CJK_LANGS)} when present")
+    build.add_argument("--max-gram", type=int, default=DEFAULT_MAX_GRAM)
+    query = sub.add_parser("query", help="Substring search in one language")
+    query.add_argument("store", type=Path)
+    query.add_argument("lang")
+    query.add_argument("text")
+    query.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    with DictionaryStore(args.store) as store:
+        if args.command == "build":
+            for lang, stats in build_all(store, args.langs, args.max_gram).items():
+                print(f"{lang}: {stats['docs']:,} fields, {stats['grams']:,} grams, "
+                      f"{stats['bytes'] / 1e6:.2f} MB -> {ngram_index_path_for(args.store, lang)}")
+        else:
+            with NgramIndex(ngram_index_path_for(args.store, args.lang)) as index:
+                if not index.is_current(store):
+                    print(f"Warning: {index.path} was built from a different version of {args.store}")
+                for match in index.search(args.text, args.limit):
+                    text = index.doc_text(match.entry_id * 2 + FIELDS.index(match.field))
+                    print(f"{store.word_at(match.entry_id)}\t{match.field}\t{text}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+# dictionary_project/lookup/packed.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Packed binary dictionary format (`.ldict`) and its converter.
+
+Layout (little endian, every section 8-byte aligned):
+
+  header      magic b"LDICT\\x00\\x00\\x01", version, entry count, section offsets
+  meta        UTF-8 JSON: languages (bit order of lang_mask), pos pool, source info
+  headwords   uint32[count + 1] offsets + UTF-8 blob, sorted by code point
+  attrs       per-entry fixed 12 bytes: pos id (u16), rarity (u8), flags (u8, reserved),
+              lang_mask (u32), score (f32) - lets filters run without decoding
+  index       uint64[count + 1] offsets into the record blob
+  records     one MessagePack map per entry (everything except the headword)
+
+Entry i is the i-th headword in sorted order. Readers map the file and decode
+only the records they are asked for.
+
+Every input shape (builder output, multilingual_dict.json, merged_dictionary.json)
+is converted to one canonical entry:
+
+  {word, pos, prefix, length, rarity, confidence, score, collected_at,
+   definition_en, example_en, translations: {lang: {word, definition, example}}}
+
+Usage:
+  python -m lookup.packed build merged_dictionary.json dictionary.ldict
+  python -m lookup.packed build "ver 0.01/dict_ja.json" "ver 0.01/dict_ko.json" multi.ldict
+  python -m lookup.packed get dictionary.ldict aardvark
+"""
+
+import argparse
+import json
+import mmap
+import struct
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from lookup.msgpack_codec import packb, unpackb
+from utils.json_stream import iter_json_items
+
+MAGIC = b"LDICT\x00\x00\x01"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8sHHI6Q")  # magic, version, reserved, count, meta/headwords/attrs/index/records offsets, file size
+_ATTR = struct.Struct("<HBBIf")
+ATTR_DTYPE = np.dtype([("pos", "<u2"), ("rarity", "u1"), ("flags", "u1"), ("lang_mask", "<u4"), ("score", "<f4")])
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+CANONICAL_FIELDS = ("pos", "prefix", "length", "rarity", "confidence", "score", "collected_at",
+                    "definition_en", "example_en")
+NO_RARITY = 0
+
+
+# ---------------------------------------------------------------------------
+# Canonical entries
+# ---------------------------------------------------------------------------
+
+def _translation(word: Optional[str], definition: Optional[str], example: Optional[str], headword: str) -> Dict[str, str]:
+    # merged_dictionary.json repeats the English headword when no target word was known
+    target_word = word if word and word != headword else ""
+    return {"word": target_word, "definition": definition or "", "example": example or ""}
+
+
+def canonical_entry(key: Optional[str], record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Convert one record of any supported dictionary shape into a canonical entry."""
+    word = key or record.get("word")
+    if not word:
+        return None
+    entry: Dict[str, Any] = {"word": word}
+    for name in CANONICAL_FIELDS:
+        if record.get(name) not in (None, "", []):
+            entry[name] = record[name]
+    translations: Dict[str, Dict[str, str]] = {}
+
+    if isinstance(record.get("translate"), dict):
+        en = record["translate"].get("en") or {}
+        entry.setdefault("definition_en", en.get("mean") or "")
+        entry.setdefault("example_en", en.get("example") or "")
+        for lang, info in record["translate"].items():
+            if lang != "en" and info:
+                translations[lang] = _translation(info.get("word"), info.get("mean"), info.get("example"), word)
+    elif isinstance(record.get("translations"), dict):
+        for lang, info in record["translations"].items():
+            if info:
+                translations[lang] = _translation(info.get(f"word_{lang}"), info.get("definition"), info.get("example"), word)
+    elif record.get("target_lang"):
+        lang = record["target_lang"]
+        translations[lang] = _translation(record.get("word_target") or record.get(f"word_{lang}"),
+                                          record.get("definition_target"), record.get("example_target"), word)
+    entry.setdefault("prefix", word[:2].lower())
+    entry.setdefault("length", len(word))
+    entry["translations"] = translations
+    return entry
+
+
+def load_canonical_entries(paths: Sequence[Union[str, Path]]) -> Dict[str, Dict[str, Any]]:
+    """Canonical entries from one or more inputs, merged by headword (first input wins for shared fields)."""
+    entries: Dict[str, Dict[str, Any]] = {}
+    for path in paths:
+        for key, record in iter_json_items(path):
+            entry = canonical_entry(key, record)
+            if entry is None:
+                continue
+            existing = entries.get(entry["word"])
+            if existing is None:
+                entries[entry["word"]] = entry
+                continue
+            for name, value in entry.items():
+                if name != "translations":
+                    existing.setdefault(name, value)
+            for lang, info in entry["translations"].items():
+                existing["translations"].setdefault(lang, info)
+    return entries
+
+
+def iter_source_entries(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Canonical entries streamed from a `.ldict` file or any supported JSON/JSONL shape."""
+    path = Path(path)
+    if path.suffix == ".ldict":
+        with PackedDictionary(path) as packed:
+            yield from packed
+        return
+    for key, record in iter_json_items(path):
+        entry = canonical_entry(key, record)
+        if entry is not None:
+            yield entry
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+
+def _align(f) -> int:
+    pos = f.tell()
+    if pos % 8:
+        f.write(b"\0" * (8 - pos % 8))
+    return f.tell()
+
+
+def write_packed(entries: Iterable[Dict[str, Any]], path: Union[str, Path], source: str = "") -> Dict[str, Any]:
+    """Write canonical entries to a `.ldict` file. Returns the meta block."""
+    ordered = sorted(entries, key=lambda e: e["word"])
+    langs = sorted({lang for e in ordered for lang in e.get("translations", {})})
+    if len(langs) > 32:
+        raise ValueError(f"At most 32 target languages fit the lang_mask, got {len(langs)}")
+    lang_bits = {lang: 1 << i for i, lang in enumerate(langs)}
+    pos_pool = sorted({e.get("pos") or "" for e in ordered})
+    pos_ids = {pos: i for i, pos in enumerate(pos_pool)}
+    meta = {
+        "format": "ldict", "version": FORMAT_VERSION, "count": len(ordered), "langs": langs, "pos": pos_pool,
+        "source": source, "created_at": datetime.now().isoformat(),
+    }
+
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+        meta_off = _align(f)
+        f.write(json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+        headwords_off = _align(f)
+        encoded_words = [e["word"].encode("utf-8") for e in ordered]
+        offset = 0
+        f.write(_U32.pack(0))
+        for data in encoded_words:
+            offset += len(data)
+            f.write(_U32.pack(offset))
+        for data in encoded_words:
+            f.write(data)
+
+        attrs_off = _align(f)
+        for e in ordered:
+            mask = 0
+            for lang in e.get("translations", {}):
+                mask |= lang_bits[lang]
+            rarity = e.get("rarity")
+            f.write(_ATTR.pack(pos_ids[e.get("pos") or ""], int(rarity) if rarity is not None else NO_RARITY, 0,
+                               mask, float(e.get("score") or 0.0)))
+
+        index_off = _align(f)
+        records = [packb({k: v for k, v in e.items() if k != "word"}) for e in ordered]
+        offset = 0
+        f.write(_U64.pack(0))
+        for data in records:
+            offset += len(data)
+            f.write(_U64.pack(offset))
+        records_off = _align(f)
+        for data in records:
+            f.write(data)
+        size = f.tell()
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(ordered), meta_off, headwords_off, attrs_off,
+                             index_off, records_off, size))
+    tmp_path.replace(path)
+    return meta
+
+
+def convert(inputs: Sequence[Union[str, Path]], output: Union[str, Path]) -> Dict[str, Any]:
+    """Convert JSON dictionaries (any supported shape) into one `.ldict` file."""
+    entries = load_canonical_entries(inputs)
+    return write_packed(entries.values(), output, source=", ".join(str(p) for p in inputs))
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+class PackedDictionary:
+    """Memory-mapped reader for `.ldict` files. Opening reads only the header and meta block."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, _, self._count, meta_off, self._headwords_off, self._attrs_off,
+         self._index_off, self._records_off, size) = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} .ldict file")
+        if size != len(self._mm):
+            self._mm.close()
+            raise ValueError(f"{self.path} is truncated ({len(self._mm)} of {size} bytes)")
+        self.meta = json.loads(bytes(self._mm[meta_off:self._headwords_off]).rstrip(b"\0"))
+        self.langs: List[str] = self.meta["langs"]
+        self.pos_pool: List[str] = self.meta["pos"]
+        self._blob_off = self._headwords_off + 4 * (self._count + 1)
+        self._attr_table: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self):
+        self._attr_table = None
+        self._mm.close()
+
+    def __enter__(self) -> "PackedDictionary":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -- headwords ---------------------------------------------------------
+    def _word_bytes(self, i: int) -> bytes:
+        start, end = struct.unpack_from("<II", self._mm, self._headwords_off + 4 * i)
+        return self._mm[self._blob_off + start:self._blob_off + end]
+
+    def word_at(self, i: int) -> str:
+        return self._word_bytes(i).decode("utf-8")
+
+    def _lower_bound(self, key: bytes) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._word_bytes(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def find(self, word: str) -> Optional[int]:
+        """Index of `word` (exact, case-sensitive) or None. O(log n)."""
+        key = word.encode("utf-8")
+        i = self._lower_bound(key)
+        return i if i < self._count and self._word_bytes(i) == key else None
+
+    def prefix_range(self, prefix: str) -> range:
+        """Indices of all headwords starting with `prefix`, as a contiguous range."""
+        key = prefix.encode("utf-8")
+        start = self._lower_bound(key)
+        if not key:
+            return range(0, self._count)
+        # The first byte string greater than every string with this prefix.
+        end_key = key.rstrip(b"\xff")
+        end = self._lower_bound(end_key[:-1] + bytes([end_key[-1] + 1])) if end_key else self._count
+        return range(start, end)
+
+    # -- attributes ----------------------------------------------------------
+    def attrs(self, i: int) -> Tuple[str, Optional[int], int, float]:
+        """(pos, rarity, lang_mask, score) without decoding the record."""
+        pos_id, rarity, _, mask, score = _ATTR.unpack_from(self._mm, self._attrs_off + _ATTR.size * i)
+        return self.pos_pool[pos_id], (rarity if rarity != NO_RARITY else None), mask, score
+
+    def attr_table(self) -> np.ndarray:
+        """Every attribute row as a read-only structured array (ATTR_DTYPE) backed by the mapping."""
+        if self._attr_table is None:
+            self._attr_table = np.frombuffer(self._mm, dtype=ATTR_DTYPE, count=self._count, offset=self._attrs_off)
+        return self._attr_table
+
+    def lang_bit(self, lang: str) -> int:
+        return 1 << self.langs.index(lang) if lang in self.langs else 0
+
+    # -- records -------------------------------------------------------------
+    def raw_record(self, i: int) -> memoryview:
+        start, end = struct.unpack_from("<QQ", self._mm, self._index_off + 8 * i)
+        return memoryview(self._mm)[self._records_off + start:self._records_off + end]
+
+    def entry(self, i: int) -> Dict[str, Any]:
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        view = self.raw_record(i)
+        try:
+            record = unpackb(view)
+        finally:
+            view.release()
+        return {"word": self.word_at(i), **record}
+
+    def get(self, word: str) -> Optional[Dict[str, Any]]:
+        i = self.find(word)
+        return None if i is None else self.entry(i)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self._count):
+            yield self.entry(i)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query packed .ldict dictionaries")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Convert JSON dictionaries into one .ldict file")
+    build.add_argument("paths", nargs="+", help="Input JSON/JSONL files followed by the output .ldict path")
+    get = sub.add_parser("get", help="Print entries by headword")
+    get.add_argument("path")
+    get.add_argument("words", nargs="+")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        if len(args.paths) < 2:
+            parser.error("build needs at least one input and an output path")
+        *inputs, output = args.paths
+        meta = convert(inputs, output)
+        size = Path(output).stat().st_size
+        print(f"Packed {meta['count']:,} entries ({', '.join(meta['langs'])}) into {output} ({size / 1e6:.2f} MB)")
+    else:
+        with PackedDictionary(args.path) as packed:
+            for word in args.words:
+                print(json.dumps(packed.get(word), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# dictionary_project/lookup/reverse_index.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Reverse index from target-language words to English headwords.
+
+For every target language, the translated word of each entry (`word_target` /
+`word_<lang>` in builder output, `translations[lang].word_<lang>` in
+multilingual_dict.json, `translate[lang].word` in merged_dictionary.json - all
+`translations[lang].word` once packed) is normalized with NFKC + casefold and
+mapped to the ids of the entries it translates. Lookups are one dict access.
+
+Entry ids are positions in the packed `.ldict` file the index was built from;
+the exported file records that file's hash so a stale index is detected. Pass
+`--headwords` to export headword strings instead (e.g. for the HTML viewers).
+
+Usage:
+  python -m lookup.reverse_index build dictionary.ldict
+  python -m lookup.reverse_index query dictionary.ldict ja 安堵
+"""
+
+import argparse
+import json
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from lookup.store import DictionaryStore
+from utils.hashing import file_sha1
+from utils.lexicon import normalize_lemma
+
+REVERSE_INDEX_VERSION = 1
+
+# Several candidate words in one field ("安心, 安堵") are indexed separately.
+_ALTERNATIVES = re.compile(r"\s*[,;/、，；]\s*")
+
+
+def reverse_index_path_for(store_path: Union[str, Path]) -> Path:
+    store_path = Path(store_path)
+    return store_path.with_name(store_path.stem + ".reverse.json")
+
+
+def normalize_term(term: str) -> str:
+    return normalize_lemma(term)
+
+
+def index_terms(word: str) -> List[str]:
+    """Normalized keys for one target-language word field."""
+    terms = []
+    for part in _ALTERNATIVES.split(word or ""):
+        term = normalize_term(part)
+        if term and term not in terms:
+            terms.append(term)
+    return terms
+
+
+class ReverseIndex:
+    """Per-language mapping from normalized target words to entry ids."""
+
+    def __init__(self, index: Dict[str, Dict[str, List[int]]], source_sha1: Optional[str] = None):
+        self.index = index
+        self.source_sha1 = source_sha1
+
+    @property
+    def langs(self) -> List[str]:
+        return sorted(self.index)
+
+    @classmethod
+    def build(cls, store: DictionaryStore, langs: Optional[Iterable[str]] = None) -> "ReverseIndex":
+        wanted = set(langs) if langs else None
+        index: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+        for entry_id in range(len(store)):
+            # Records are decoded straight from the file so the build does not churn the store's LRU.
+            for lang, translation in store.packed.entry(entry_id).get("translations", {}).items():
+                if wanted is not None and lang not in wanted:
+                    continue
+                for term in index_terms(translation.get("word", "")):
+                    index[lang][term].append(entry_id)
+        return cls({lang: dict(terms) for lang, terms in index.items()}, file_sha1(store.path))
+
+    def lookup(self, lang: str, term: str) -> List[int]:
+        """Entry ids whose `lang` translation is `term` (after normalization)."""
+        return self.index.get(lang, {}).get(normalize_term(term), [])
+
+    def headwords(self, store: DictionaryStore, lang: str, term: str) -> List[str]:
+        return [store.word_at(entry_id) for entry_id in self.lookup(lang, term)]
+
+    def is_current(self, store: DictionaryStore) -> bool:
+        return self.source_sha1 == file_sha1(store.path)
+
+    def save(self, path: Union[str, Path], store: Optional[DictionaryStore] = None):
+        """Write the index as JSON; with `store`, map entry ids to headword strings."""
+        if store is not None:
+            index = {lang: {term: [store.word_at(i) for i in ids] for term, ids in terms.items()}
+                     for lang, terms in self.index.items()}
+        else:
+            index = self.index
+        document = {
+            "version": REVERSE_INDEX_VERSION,
+            "source_sha1": self.source_sha1,
+            "values": "headwords" if store is not None else "ids",
+            "langs": index,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ReverseIndex":
+        with open(path, "r", encoding="utf-8") as f:
+            document = json.load(f)
+        if document.get("version") != REVERSE_INDEX_VERSION or document.get("values") != "ids":
+            raise ValueError(f"{path} is not a version {REVERSE_INDEX_VERSION} id reverse index")
+        return cls(document["langs"], document.get("source_sha1"))
+
+
+def load_or_build(store: DictionaryStore, path: Optional[Union[str, Path]] = None) -> ReverseIndex:
+    """The saved index next to the store if it matches the store's file, otherwise a fresh build."""
+    path = Path(path) if path else reverse_index_path_for(store.path)
+    if path.exists():
+        try:
+            index = ReverseIndex.load(path)
+            if index.is_current(store):
+                return index
+        except ValueError:
+            pass
+    return ReverseIndex.build(store)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the target-language reverse index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Build <store>.reverse.json from a packed dictionary")
+    build.add_argument("store", type=Path)
+    build.add_argument("-o", "--output", type=Path, default=None)
+    build.add_argument("--langs", nargs="*", default=None)
+    build.add_argument("--headwords", action="store_true", help="Export headword strings instead of entry ids")
+    query = sub.add_parser("query", help="Headwords whose translation is a given word")
+    query.add_argument("store", type=Path)
+    query.add_argument("lang")
+    query.add_argument("terms", nargs="+")
+    args = parser.parse_args()
+
+    with DictionaryStore(args.store) as store:
+        if args.command == "build":
+            index = ReverseIndex.build(store, args.langs)
+            output = args.output or reverse_index_path_for(args.store)
+            index.save(output, store if args.headwords else None)
+            counts = ", ".join(f"{lang}: {len(terms):,}" for lang, terms in sorted(index.index.items())) or "none"
+            print(f"Reverse index ({counts} terms) -> {output}")
+        else:
+            index = load_or_build(store)
+            for term in args.terms:
+                print(f"{term}\t{', '.join(index.headwords(store, args.lang, term)) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
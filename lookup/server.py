@@ -0,0 +1,323 @@
+# dictionary_project/lookup/server.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Local HTTP lookup service over a packed `.ldict` dictionary.
+
+The store, its reverse index and any `<store>.<lang>.ngram` files are opened once
+at startup; every request is answered from those in-memory / memory-mapped
+indexes. Responses are JSON and are kept in an LRU keyed by the request target,
+with an ETag (sha1 of the body) so clients can revalidate with If-None-Match.
+
+  GET  /lookup/{word}              exact -> lemma -> typo-tolerant lookup
+  GET  /prefix/{p}?pos=&rarity=&lang=&limit=
+  GET  /reverse/{lang}/{term}      headwords whose `lang` translation is `term`
+  GET  /search?q=&lang=en&limit=   substring search in definitions / examples
+  GET  /batch?words=a,b,c          several lookups in one round trip
+  POST /batch                      {"words": [...]}
+  GET  /health                     sizes, loaded indexes and cache counters
+
+Only the standard library is used (asyncio streams, HTTP/1.1 keep-alive), so the
+service runs wherever the dictionary tools do.
+
+Usage:
+  python -m lookup.server dictionary.ldict --port 8080
+  python -m lookup.server dictionary.ldict --build-indexes --cache-size 20000
+  curl localhost:8080/lookup/aardvark
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from lookup.ngram_index import CJK_LANGS, ENGLISH, NgramIndex, build_ngram_index, ngram_index_path_for
+from lookup.reverse_index import load_or_build
+from lookup.store import DEFAULT_STORE_PATH, DictionaryStore
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+DEFAULT_RESPONSE_CACHE = 10_000
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 1000
+MAX_BATCH = 500
+MAX_BODY = 1 << 20
+
+_REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _int_param(params: Dict[str, List[str]], name: str, default: int, upper: int = MAX_LIMIT) -> int:
+    values = params.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[-1])
+    except ValueError:
+        raise HTTPError(400, f"'{name}' must be an integer")
+    return max(0, min(value, upper))
+
+
+def _str_param(params: Dict[str, List[str]], name: str) -> Optional[str]:
+    values = params.get(name)
+    return values[-1] if values and values[-1] else None
+
+
+def _filters(params: Dict[str, List[str]]) -> Dict[str, Any]:
+    rarity = None
+    if params.get("rarity"):
+        try:
+            rarity = [int(level) for value in params["rarity"] for level in value.split(",") if level]
+        except ValueError:
+            raise HTTPError(400, "'rarity' must be integers")
+    return {"pos": _str_param(params, "pos"), "rarity": rarity, "lang": _str_param(params, "lang")}
+
+
+class LookupService:
+    """Request routing over one store; independent of the transport so it can be called directly."""
+
+    def __init__(self, store: DictionaryStore, cache_size: int = DEFAULT_RESPONSE_CACHE,
+                 build_indexes: bool = False):
+        self.store = store
+        self.reverse = load_or_build(store)
+        self.ngrams: Dict[str, NgramIndex] = {}
+        for lang in [ENGLISH] + list(store.langs):
+            path = ngram_index_path_for(store.path, lang)
+            index = NgramIndex(path) if path.exists() else None
+            if index is not None and not index.is_current(store):
+                index.close()
+                index = None
+            if index is None and build_indexes and (lang == ENGLISH or lang in CJK_LANGS):
+                build_ngram_index(store, lang, path)
+                index = NgramIndex(path)
+            if index is not None:
+                self.ngrams[lang] = index
+        # 첫 오타 검색이 느려지지 않도록 시작할 때 미리 만듭니다.
+        store.fuzzy_index()
+        self.cache_size = cache_size
+        self._responses: "OrderedDict[str, Tuple[int, str, bytes]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.started_at = time.time()
+
+    def close(self):
+        for index in self.ngrams.values():
+            index.close()
+        self.ngrams.clear()
+
+    # -- routes --------------------------------------------------------------
+    def route(self, method: str, path: str, params: Dict[str, List[str]], body: bytes) -> Dict[str, Any]:
+        parts = [unquote(p) for p in path.strip("/").split("/")]
+        name, args = parts[0], parts[1:]
+        if name == "batch":
+            if method == "POST":
+                try:
+                    words = json.loads(body or b"{}").get("words")
+                except (ValueError, AttributeError):
+                    raise HTTPError(400, "Body must be a JSON object with a 'words' list")
+            else:
+                words = [w for value in params.get("words", []) for w in value.split(",") if w]
+            return self.batch(words)
+        if method != "GET":
+            raise HTTPError(405, f"{method} is not allowed on /{name}")
+        if name == "lookup" and len(args) == 1:
+            return self.lookup(args[0])
+        if name == "prefix" and len(args) == 1:
+            return self.prefix(args[0], _int_param(params, "limit", DEFAULT_LIMIT), **_filters(params))
+        if name == "reverse" and len(args) == 2:
+            return self.reverse_lookup(args[0], args[1])
+        if name == "search" and not args:
+            query = _str_param(params, "q")
+            if query is None:
+                raise HTTPError(400, "Missing 'q'")
+            return self.search(query, _str_param(params, "lang") or ENGLISH, _int_param(params, "limit", DEFAULT_LIMIT))
+        if name == "health" and not args:
+            return self.health()
+        raise HTTPError(404, f"No route for {path}")
+
+    def lookup(self, word: str) -> Dict[str, Any]:
+        result = self.store.lookup(word)
+        if result["match"] is None:
+            raise HTTPError(404, f"'{word}' not found")
+        return result
+
+    def prefix(self, prefix: str, limit: int = DEFAULT_LIMIT, **filters) -> Dict[str, Any]:
+        if filters.get("lang") is not None and filters["lang"] not in self.store.langs:
+            raise HTTPError(400, f"Unknown language '{filters['lang']}'")
+        ids = self.store.prefix_ids(prefix, **filters)
+        return {"prefix": prefix, "total": len(ids), "entries": self.store.entries(ids[:limit])}
+
+    def reverse_lookup(self, lang: str, term: str) -> Dict[str, Any]:
+        if lang not in self.reverse.index:
+            raise HTTPError(400, f"No reverse index for '{lang}' (have: {', '.join(self.reverse.langs)})")
+        ids = self.reverse.lookup(lang, term)
+        if not ids:
+            raise HTTPError(404, f"No {lang} translation '{term}'")
+        return {"lang": lang, "term": term, "entries": self.store.entries(ids)}
+
+    def search(self, query: str, lang: str = ENGLISH, limit: int = DEFAULT_LIMIT) -> Dict[str, Any]:
+        index = self.ngrams.get(lang)
+        if index is None:
+            raise HTTPError(400, f"No n-gram index for '{lang}' (have: {', '.join(sorted(self.ngrams))}); "
+                                 f"start the server with --build-indexes")
+        matches = index.search(query, limit=limit)
+        return {"q": query, "lang": lang,
+                "results": [{"field": m.field, "entry": self.store.entry(m.entry_id)} for m in matches]}
+
+    def batch(self, words: Any) -> Dict[str, Any]:
+        if not isinstance(words, list) or not all(isinstance(w, str) for w in words):
+            raise HTTPError(400, "'words' must be a list of strings")
+        if len(words) > MAX_BATCH:
+            raise HTTPError(413, f"At most {MAX_BATCH} words per batch")
+        return {"results": [self.store.lookup(word) for word in words]}
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "store": str(self.store.path), "entries": len(self.store), "langs": self.store.langs,
+            "reverse_langs": self.reverse.langs, "ngram_langs": sorted(self.ngrams),
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "response_cache": self.cache_info(), "entry_cache": self.store.cache_info(),
+        }
+
+    # -- response cache ------------------------------------------------------
+    def respond(self, method: str, target: str, body: bytes = b"") -> Tuple[int, str, bytes]:
+        """(status, etag, JSON body) for one request. GET responses are cached by target."""
+        cacheable = method == "GET" and not target.startswith("/health")
+        if cacheable:
+            cached = self._responses.get(target)
+            if cached is not None:
+                self._responses.move_to_end(target)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        split = urlsplit(target)
+        try:
+            status, data = 200, self.route(method, split.path, parse_qs(split.query), body)
+        except HTTPError as e:
+            status, data = e.status, {"error": e.message}
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        etag = '"' + hashlib.sha1(payload).hexdigest() + '"'
+        # 404도 캐시합니다: 없는 단어를 반복 조회해도 퍼지 검색을 다시 하지 않습니다.
+        if cacheable and status in (200, 404) and self.cache_size:
+            self._responses[target] = (status, etag, payload)
+            if len(self._responses) > self.cache_size:
+                self._responses.popitem(last=False)
+        return status, etag, payload
+
+    def cache_info(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._responses), "max_size": self.cache_size}
+
+
+# ---------------------------------------------------------------------------
+# HTTP/1.1 transport
+# ---------------------------------------------------------------------------
+
+def _response_bytes(status: int, body: bytes, etag: Optional[str], keep_alive: bool) -> bytes:
+    headers = [f"HTTP/1.1 {status} {_REASONS.get(status, 'Unknown')}",
+               f"Content-Length: {len(body)}",
+               "Connection: keep-alive" if keep_alive else "Connection: close"]
+    if body:
+        headers.append("Content-Type: application/json; charset=utf-8")
+    if etag:
+        headers += [f"ETag: {etag}", "Cache-Control: public, max-age=3600"]
+    return ("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body
+
+
+async def _handle_connection(service: LookupService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                break
+            request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+            try:
+                method, target, version = request_line.split(" ", 2)
+            except ValueError:
+                writer.write(_response_bytes(400, b'{"error":"Malformed request line"}', None, False))
+                break
+            headers = {}
+            for line in header_lines:
+                key, _, value = line.partition(":")
+                headers[key.strip().lower()] = value.strip()
+            try:
+                length = int(headers.get("content-length") or 0)
+            except ValueError:
+                length = -1
+            if not 0 <= length <= MAX_BODY:
+                writer.write(_response_bytes(413, b'{"error":"Bad or oversized body"}', None, False))
+                break
+            body = await reader.readexactly(length) if length else b""
+            connection = headers.get("connection", "").lower()
+            keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+            try:
+                status, etag, payload = service.respond(method.upper(), target, body)
+            except Exception as e:  # 요청 하나의 실패로 연결 전체를 끊지 않습니다.
+                status, etag = 500, None
+                payload = json.dumps({"error": f"{type(e).__name__}: {e}"}).encode("utf-8")
+            if status == 200 and etag is not None and headers.get("if-none-match") == etag:
+                status, payload = 304, b""
+            writer.write(_response_bytes(status, payload, etag if status in (200, 304) else None, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    finally:
+        writer.close()
+
+
+async def serve(service: LookupService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+    """Start listening; the caller owns the returned server (`serve_forever()` / `close()`)."""
+    return await asyncio.start_server(lambda r, w: _handle_connection(service, r, w), host, port)
+
+
+def open_service(path: Union[str, Path] = DEFAULT_STORE_PATH, cache_size: int = DEFAULT_RESPONSE_CACHE,
+                 build_indexes: bool = False) -> LookupService:
+    return LookupService(DictionaryStore(path), cache_size, build_indexes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve dictionary lookups over HTTP")
+    parser.add_argument("store", type=Path, nargs="?", default=DEFAULT_STORE_PATH)
+    parser.add_argument("--host", type=str, default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_RESPONSE_CACHE, help="Cached responses (0 disables)")
+    parser.add_argument("--build-indexes", action="store_true",
+                        help="Build missing or stale n-gram indexes (English + CJK) before serving")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    service = open_service(args.store, args.cache_size, args.build_indexes)
+    print(f"Loaded {len(service.store):,} entries from {args.store} in {time.perf_counter() - started:.2f}s "
+          f"(reverse: {', '.join(service.reverse.langs) or '-'}; search: {', '.join(sorted(service.ngrams)) or '-'})")
+
+    async def run():
+        server = await serve(service, args.host, args.port)
+        print(f"Listening on http://{args.host}:{args.port}")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+        service.store.close()
+
+
+if __name__ == "__main__":
+    main()
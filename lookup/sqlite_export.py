@@ -0,0 +1,279 @@
+# dictionary_project/lookup/sqlite_export.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+SQLite export with FTS5 full-text search over definitions and examples.
+
+Schema:
+  entries        one row per headword (English fields + pos/rarity/score/...)
+  translations   one row per (entry, language): word, definition, example
+  entries_fts    FTS5 over word / definition_en / example_en (porter + unicode61)
+  fts_<lang>     FTS5 per target language over translations of that language;
+                 `trigram` for ja/ko/zh, `unicode61 remove_diacritics 2` otherwise.
+                 Table names are generated from the language codes (pt-BR -> fts_pt_br)
+                 and recorded under "fts_tables" in `meta`; codes are never spliced into SQL.
+
+The FTS tables are external-content tables over `entries` / `translations`, so
+text is stored once. Rows are streamed in with large transactions and journaling
+off; secondary indexes and the FTS contents are built after the load.
+
+Usage:
+  python -m lookup.sqlite_export export merged_dictionary.json dictionary.sqlite
+  python -m lookup.sqlite_export query dictionary.sqlite "termite mound"
+  python -m lookup.sqlite_export query dictionary.sqlite 夜行性 --lang ja
+"""
+
+import argparse
+import itertools
+import json
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from lookup.ngram_index import CJK_LANGS
+from lookup.packed import iter_source_entries
+
+DEFAULT_BATCH_SIZE = 50_000
+SCHEMA_VERSION = 2
+
+ENGLISH_TOKENIZER = "porter unicode61 remove_diacritics 2"
+LATIN_TOKENIZER = "unicode61 remove_diacritics 2"
+CJK_TOKENIZER = "trigram"
+
+_SCHEMA = """
+CREATE TABLE entries (
+    id INTEGER PRIMARY KEY,
+    word TEXT NOT NULL,
+    pos TEXT,
+    prefix TEXT,
+    length INTEGER,
+    rarity INTEGER,
+    confidence REAL,
+    score REAL,
+    collected_at TEXT,
+    definition_en TEXT,
+    example_en TEXT
+);
+CREATE TABLE translations (
+    id INTEGER PRIMARY KEY,
+    entry_id INTEGER NOT NULL REFERENCES entries(id),
+    lang TEXT NOT NULL,
+    word TEXT,
+    definition TEXT,
+    example TEXT
+);
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+# 적재가 끝난 뒤에 생성합니다 (행마다 인덱스를 갱신하지 않도록).
+_INDEXES = """
+CREATE UNIQUE INDEX idx_entries_word ON entries(word);
+CREATE INDEX idx_entries_prefix ON entries(prefix);
+CREATE INDEX idx_translations_entry ON translations(entry_id, lang);
+CREATE INDEX idx_translations_word ON translations(lang, word);
+"""
+
+
+def tokenizer_for(lang: str) -> str:
+    return CJK_TOKENIZER if lang in CJK_LANGS else LATIN_TOKENIZER
+
+
+def fts_table_names(langs: Iterable[str]) -> Dict[str, str]:
+    """{lang: FTS table name}; names contain only [a-z0-9_] and are unique even if two codes normalize alike."""
+    tables: Dict[str, str] = {}
+    for lang in sorted(langs):
+        base = "fts_" + (re.sub(r"[^a-z0-9]+", "_", lang.lower()).strip("_") or "lang")
+        name, n = base, 2
+        while name in tables.values():
+            name, n = f"{base}_{n}", n + 1
+        tables[lang] = name
+    return tables
+
+
+def like_pattern(text: str) -> str:
+    """Substring LIKE pattern for user text; use with ESCAPE '\\'."""
+    return "%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def _entry_row(entry_id: int, entry: Dict[str, Any]) -> tuple:
+    return (entry_id, entry["word"], entry.get("pos"), entry.get("prefix"), entry.get("length"), entry.get("rarity"),
+            entry.get("confidence"), entry.get("score"), entry.get("collected_at"), entry.get("definition_en"),
+            entry.get("example_en"))
+
+
+def export_sqlite(entries: Iterable[Dict[str, Any]], path: Union[str, Path], batch_size: int = DEFAULT_BATCH_SIZE,
+                  source: str = "") -> Dict[str, Any]:
+    """Stream canonical entries into a fresh SQLite database at `path`. Returns load statistics."""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+    started = time.perf_counter()
+    conn = sqlite3.connect(tmp_path, isolation_level=None)
+    try:
+        conn.executescript("PRAGMA journal_mode=OFF; PRAGMA synchronous=OFF; PRAGMA temp_store=MEMORY;")
+        conn.executescript(_SCHEMA)
+        langs = set()
+        total_entries = total_translations = 0
+        seen_words = set()
+        iterator = iter(entries)
+        while True:
+            batch = list(itertools.islice(iterator, batch_size))
+            if not batch:
+                break
+            entry_rows, translation_rows = [], []
+            for entry in batch:
+                # Duplicate headwords across one input keep the first occurrence (the unique index needs this).
+                if entry["word"] in seen_words:
+                    continue
+                seen_words.add(entry["word"])
+                total_entries += 1
+                entry_rows.append(_entry_row(total_entries, entry))
+                for lang, info in entry.get("translations", {}).items():
+                    langs.add(lang)
+                    translation_rows.append((total_entries, lang, info.get("word") or None, info.get("definition"),
+                                             info.get("example")))
+            conn.execute("BEGIN")
+            conn.executemany("INSERT INTO entries VALUES (?,?,?,?,?,?,?,?,?,?,?)", entry_rows)
+            conn.executemany("INSERT INTO translations (entry_id, lang, word, definition, example) VALUES (?,?,?,?,?)",
+                             translation_rows)
+            conn.execute("COMMIT")
+            total_translations += len(translation_rows)
+        loaded = time.perf_counter() - started
+
+        conn.execute("BEGIN")
+        for statement in filter(str.strip, _INDEXES.split(";")):
+            conn.execute(statement)
+        conn.execute(f"CREATE VIRTUAL TABLE entries_fts USING fts5(word, definition_en, example_en, "
+                     f"content='entries', content_rowid='id', tokenize='{ENGLISH_TOKENIZER}')")
+        conn.execute("INSERT INTO entries_fts (rowid, word, definition_en, example_en) "
+                     "SELECT id, word, definition_en, example_en FROM entries")
+        fts_tables = fts_table_names(langs)
+        for lang, table in fts_tables.items():
+            conn.execute(f"CREATE VIRTUAL TABLE {table} USING fts5(word, definition, example, "
+                         f"content='translations', content_rowid='id', tokenize='{tokenizer_for(lang)}')")
+            conn.execute(f"INSERT INTO {table} (rowid, word, definition, example) "
+                         f"SELECT id, word, definition, example FROM translations WHERE lang = ?", (lang,))
+            conn.execute(f"INSERT INTO {table} ({table}) VALUES ('optimize')")
+        conn.execute("INSERT INTO entries_fts (entries_fts) VALUES ('optimize')")
+        meta = {"schema_version": SCHEMA_VERSION, "langs": sorted(langs), "fts_tables": fts_tables,
+                "entries": total_entries, "translations": total_translations, "source": source}
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", [(k, json.dumps(v, ensure_ascii=False)) for k, v in meta.items()])
+        conn.execute("COMMIT")
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    tmp_path.replace(path)
+    return {**meta, "load_seconds": loaded, "total_seconds": time.perf_counter() - started}
+
+
+def export_file(input_path: Union[str, Path], output_path: Union[str, Path],
+                batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, Any]:
+    return export_sqlite(iter_source_entries(input_path), output_path, batch_size, source=str(input_path))
+
+
+def fts_phrase(text: str) -> str:
+    """Quote user text as FTS5 phrases so punctuation is never parsed as query syntax."""
+    return " ".join('"' + token.replace('"', '""') + '"' for token in text.split())
+
+
+class SearchDatabase:
+    """Query helper over an exported database."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.meta = {row["key"]: json.loads(row["value"]) for row in self.conn.execute("SELECT key, value FROM meta")}
+        self.langs: List[str] = self.meta.get("langs", [])
+        # Version 1 exports named the tables fts_<lang> directly.
+        self.fts_tables: Dict[str, str] = self.meta.get("fts_tables") or {lang: f"fts_{lang}" for lang in self.langs}
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> "SearchDatabase":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def entry(self, word: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT * FROM entries WHERE word = ?", (word,)).fetchone()
+        if row is None:
+            return None
+        entry = {k: row[k] for k in row.keys() if k != "id" and row[k] is not None}
+        entry["translations"] = {
+            t["lang"]: {"word": t["word"] or "", "definition": t["definition"] or "", "example": t["example"] or ""}
+            for t in self.conn.execute("SELECT lang, word, definition, example FROM translations WHERE entry_id = ?",
+                                       (row["id"],))
+        }
+        return entry
+
+    def search(self, text: str, lang: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Ranked (bm25) full-text search. Without `lang` the English fields are searched;
+        with `lang` that language's translations. CJK queries shorter than a trigram
+        fall back to a LIKE scan of that language's rows.
+        """
+        text = text.strip()
+        if not text:
+            return []
+        if lang is None:
+            sql = ("SELECT e.word, e.pos, snippet(entries_fts, -1, '[', ']', '…', 12) AS snippet, "
+                   "bm25(entries_fts) AS rank FROM entries_fts JOIN entries e ON e.id = entries_fts.rowid "
+                   "WHERE entries_fts MATCH ? ORDER BY rank LIMIT ?")
+            params = (fts_phrase(text), limit)
+        elif lang not in self.fts_tables:
+            raise ValueError(f"No '{lang}' translations in {self.path} (have: {', '.join(self.langs)})")
+        elif tokenizer_for(lang) == CJK_TOKENIZER and len(text) < 3:
+            sql = ("SELECT e.word, e.pos, t.word AS target_word, coalesce(t.definition, '') AS snippet, 0.0 AS rank "
+                   "FROM translations t JOIN entries e ON e.id = t.entry_id "
+                   "WHERE t.lang = ?1 AND (t.word LIKE ?2 ESCAPE '\\' OR t.definition LIKE ?2 ESCAPE '\\' "
+                   "OR t.example LIKE ?2 ESCAPE '\\') LIMIT ?3")
+            params = (lang, like_pattern(text), limit)
+        else:
+            table = self.fts_tables[lang]
+            sql = (f"SELECT e.word, e.pos, t.word AS target_word, snippet({table}, -1, '[', ']', '…', 12) AS snippet, "
+                   f"bm25({table}) AS rank FROM {table} JOIN translations t ON t.id = {table}.rowid "
+                   f"JOIN entries e ON e.id = t.entry_id WHERE {table} MATCH ? ORDER BY rank LIMIT ?")
+            # trigram matches raw substrings, so CJK text is one phrase rather than whitespace tokens
+            phrase = '"' + text.replace('"', '""') + '"' if tokenizer_for(lang) == CJK_TOKENIZER else fts_phrase(text)
+            params = (phrase, limit)
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a dictionary to SQLite FTS5 or query the export")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("export", help="Stream a .ldict / JSON / JSONL dictionary into a SQLite database")
+    export.add_argument("input")
+    export.add_argument("output")
+    export.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    query = sub.add_parser("query", help="Ranked full-text search")
+    query.add_argument("database")
+    query.add_argument("text")
+    query.add_argument("--lang", type=str, default=None, help="Search this language's translations (default: English)")
+    query.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.command == "export":
+        stats = export_file(args.input, args.output, args.batch_size)
+        size = Path(args.output).stat().st_size
+        print(f"Exported {stats['entries']:,} entries / {stats['translations']:,} translations "
+              f"({', '.join(stats['langs'])}) to {args.output} ({size / 1e6:.2f} MB) in {stats['total_seconds']:.2f}s "
+              f"(rows loaded in {stats['load_seconds']:.2f}s)")
+    else:
+        with SearchDatabase(args.database) as db:
+            started = time.perf_counter()
+            rows = db.search(args.text, args.lang, args.limit)
+            elapsed = (time.perf_counter() - started) * 1e3
+            for row in rows:
+                print(f"{row['word']}\t{row.get('target_word') or ''}\t{row['snippet']}")
+            print(f"({len(rows)} results in {elapsed:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+# dictionary_project/lookup/store.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+DictionaryStore: read-only lookup engine over a packed `.ldict` file.
+
+The file is memory-mapped, so opening costs a header read regardless of size and
+every process opening the same file shares its pages through the OS page cache.
+  - exact headword lookup: binary search over the headword table, O(log n)
+  - prefix queries: one contiguous id range (e.g. the builder's 2-letter prefixes)
+  - pos / rarity / target-language filters: vectorized over the fixed-width
+    attribute table, without decoding any record
+  - records are decoded on demand and kept in a small LRU
+
+Usage:
+  python -m lookup.packed build merged_dictionary.json dictionary.ldict
+  python -m lookup.store dictionary.ldict get aardvark
+  python -m lookup.store dictionary.ldict prefix ab --pos noun --lang ja --limit 5
+"""
+
+import argparse
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+from lookup.packed import NO_RARITY, PackedDictionary
+
+DEFAULT_STORE_PATH = Path("dictionary.ldict")
+DEFAULT_CACHE_SIZE = 4096
+
+Rarity = Union[int, Iterable[int]]
+
+
+class DictionaryStore:
+    """Memory-mapped dictionary with exact, prefix and filtered lookups."""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_STORE_PATH, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.packed = PackedDictionary(path)
+        self.path = self.packed.path
+        self.langs: List[str] = self.packed.langs
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._fuzzy = None
+
+    def __len__(self) -> int:
+        return len(self.packed)
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self.find(word) is not None
+
+    def close(self):
+        self._cache.clear()
+        self.packed.close()
+
+    def __enter__(self) -> "DictionaryStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -- entries -------------------------------------------------------------
+    def entry(self, entry_id: int) -> Dict[str, Any]:
+        """Decoded entry by id (its position in headword order). Callers must not mutate it."""
+        cached = self._cache.get(entry_id)
+        if cached is not None:
+            self._cache.move_to_end(entry_id)
+            self.hits += 1
+            return cached
+        self.misses += 1
+        entry = self.packed.entry(entry_id)
+        if self.cache_size:
+            self._cache[entry_id] = entry
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return entry
+
+    def entries(self, entry_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        return [self.entry(int(i)) for i in entry_ids]
+
+    def word_at(self, entry_id: int) -> str:
+        return self.packed.word_at(entry_id)
+
+    def find(self, word: str) -> Optional[int]:
+        """Entry id of `word`, falling back to its lowercase form (headwords are stored lowercase)."""
+        entry_id = self.packed.find(word)
+        if entry_id is None and word != word.lower():
+            entry_id = self.packed.find(word.lower())
+        return entry_id
+
+    def get(self, word: str) -> Optional[Dict[str, Any]]:
+        entry_id = self.find(word)
+        return None if entry_id is None else self.entry(entry_id)
+
+    def fuzzy_index(self):
+        """The symmetric-delete index over this store's headwords, built on first use."""
+        if self._fuzzy is None:
+            from lookup.fuzzy import FuzzyIndex
+            self._fuzzy = FuzzyIndex(self)
+        return self._fuzzy
+
+    def lookup(self, word: str, fuzzy: bool = True, limit: int = 5) -> Dict[str, Any]:
+        """
+        Exact lookup, then inflection-aware (geese -> goose via WordNet morphy), then
+        typo-tolerant. Returns {"query", "match": "exact" | "lemma" | "fuzzy" | None,
+        "entries": [...]}; fuzzy entries carry their edit distance under "distance".
+        """
+        entry_id = self.find(word)
+        if entry_id is not None:
+            return {"query": word, "match": "exact", "entries": [self.entry(entry_id)]}
+        from utils.morphy import get_morphy
+        lemma_ids = [self.find(base) for base in get_morphy().lemmas(word, self.__contains__)]
+        if lemma_ids:
+            return {"query": word, "match": "lemma", "entries": self.entries(lemma_ids[:limit])}
+        if fuzzy:
+            suggestions = self.fuzzy_index().suggest(word, limit=limit)
+            if suggestions:
+                entries = [{**self.entry(s.entry_id), "distance": s.distance} for s in suggestions]
+                return {"query": word, "match": "fuzzy", "entries": entries}
+        return {"query": word, "match": None, "entries": []}
+
+    # -- queries -------------------------------------------------------------
+    def filter_ids(self, ids: Union[range, np.ndarray, None] = None, pos: Optional[str] = None,
+                   rarity: Optional[Rarity] = None, lang: Optional[str] = None) -> np.ndarray:
+        """
+        Entry ids (from `ids`, default all) whose part of speech, rarity and target
+        languages match. `rarity` is one level or a collection of levels; `lang`
+        keeps entries that have a translation in that language.
+        """
+        if ids is None:
+            ids = range(len(self))
+        if isinstance(ids, range):
+            rows = self.packed.attr_table()[ids.start:ids.stop]
+            selected = np.arange(ids.start, ids.stop)
+        else:
+            selected = np.asarray(ids, dtype=np.int64)
+            rows = self.packed.attr_table()[selected]
+        mask = np.ones(len(selected), dtype=bool)
+        if pos is not None:
+            if pos not in self.packed.pos_pool:
+                return selected[:0]
+            mask &= rows["pos"] == self.packed.pos_pool.index(pos)
+        if rarity is not None:
+            levels = [rarity] if isinstance(rarity, int) else list(rarity)
+            mask &= np.isin(rows["rarity"], [level if level is not None else NO_RARITY for level in levels])
+        if lang is not None:
+            bit = self.packed.lang_bit(lang)
+            if not bit:
+                return selected[:0]
+            mask &= (rows["lang_mask"] & bit) != 0
+        return selected[mask]
+
+    def prefix_ids(self, prefix: str, **filters) -> np.ndarray:
+        """Ids of headwords starting with `prefix` (case-insensitive), filtered like `filter_ids`."""
+        return self.filter_ids(self.packed.prefix_range(prefix.lower()), **filters)
+
+    def prefix(self, prefix: str, limit: Optional[int] = None, **filters) -> List[Dict[str, Any]]:
+        """Decoded entries for a prefix query, in headword order."""
+        return self.entries(self.prefix_ids(prefix, **filters)[:limit])
+
+    def search(self, limit: Optional[int] = None, **filters) -> List[Dict[str, Any]]:
+        """Decoded entries matching only the attribute filters, in headword order."""
+        return self.entries(self.filter_ids(None, **filters)[:limit])
+
+    def prefix_counts(self, length: int = 2) -> Dict[str, int]:
+        """Number of headwords per leading `length` characters, e.g. the builder's 2-letter prefixes."""
+        counts: Dict[str, int] = {}
+        i = 0
+        while i < len(self):
+            head = self.word_at(i)[:length]
+            block = self.packed.prefix_range(head)
+            counts[head] = len(block)
+            i = block.stop
+        return counts
+
+    def cache_info(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._cache), "max_size": self.cache_size}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query a packed .ldict dictionary")
+    parser.add_argument("path", type=Path, nargs="?", default=DEFAULT_STORE_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    get = sub.add_parser("get", help="Exact headword lookup")
+    get.add_argument("words", nargs="+")
+    prefix = sub.add_parser("prefix", help="Headwords starting with a prefix")
+    prefix.add_argument("prefix")
+    search = sub.add_parser("search", help="Entries matching attribute filters only")
+    for query in (prefix, search):
+        query.add_argument("--pos", type=str, default=None)
+        query.add_argument("--rarity", type=int, nargs="*", default=None)
+        query.add_argument("--lang", type=str, default=None)
+        query.add_argument("--limit", type=int, default=20)
+    sub.add_parser("prefixes", help="Headword counts per 2-letter prefix")
+    args = parser.parse_args()
+
+    with DictionaryStore(args.path) as store:
+        if args.command == "get":
+            for word in args.words:
+                print(json.dumps(store.get(word), ensure_ascii=False, indent=2))
+        elif args.command == "prefixes":
+            for head, count in store.prefix_counts().items():
+                print(f"{head}\t{count}")
+        else:
+            filters = {"pos": args.pos, "rarity": args.rarity, "lang": args.lang}
+            ids = store.prefix_ids(args.prefix, **filters) if args.command == "prefix" else store.filter_ids(None, **filters)
+            for entry in store.entries(ids[:args.limit]):
+                langs = ", ".join(sorted(entry.get("translations", {})))
+                print(f"{entry['word']}\t{entry.get('pos', '')}\t{entry.get('rarity', '')}\t{langs}")
+            print(f"({len(ids):,} matches)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,23 +2,126 @@
 # Copyright (c) 2025 [Your Name/Organization]
 # Licensed under the MIT License. See LICENSE file in the project root for details.
 
-from typing import Tuple
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from utils.model_registry import is_available, get_module
+
+# 백엔드는 임포트 시점에 한 번만 결정합니다 (bleurt 자체는 실제 사용할 때 로드).
+BLEU_BACKEND = "bleurt" if is_available("bleurt") else "ngram"
+
+MAX_ORDER = 4
+SMOOTHING_EPSILON = 0.1
+
+# 공백 분할이 의미 없는 언어는 문자 단위로 토큰화합니다.
+CHARACTER_TOKENIZED_LANGS = {"ja", "zh", "ko"}
+_WORD_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+_CHAR_SKIP_RE = re.compile(r"[\s\W_]", re.UNICODE)
+
+
+@lru_cache(maxsize=200_000)
+def tokenize(text: str, lang: str = "en") -> Tuple[str, ...]:
+    """Cached BLEU tokenization: characters for CJK, words and punctuation otherwise."""
+    if lang in CHARACTER_TOKENIZED_LANGS:
+        return tuple(ch for ch in text if not _CHAR_SKIP_RE.match(ch))
+    return tuple(_WORD_RE.findall(text))
+
+
+@lru_cache(maxsize=200_000)
+def _ngram_counts(tokens: Tuple[str, ...], max_order: int) -> Tuple[Counter, ...]:
+    return tuple(
+        Counter(zip(*(tokens[i:] for i in range(n)))) for n in range(1, max_order + 1)
+    )
+
+
+def _sufficient_statistics(pairs: Sequence[Tuple[str, str]], lang: str, max_order: int) -> Tuple[np.ndarray, ...]:
+    """Per-pair clipped n-gram matches, n-gram totals, hypothesis and reference lengths."""
+    size = len(pairs)
+    matches = np.zeros((size, max_order), dtype=np.int64)
+    totals = np.zeros((size, max_order), dtype=np.int64)
+    hyp_len = np.zeros(size, dtype=np.int64)
+    ref_len = np.zeros(size, dtype=np.int64)
+    for row, (hypothesis, reference) in enumerate(pairs):
+        hyp_tokens, ref_tokens = tokenize(hypothesis, lang), tokenize(reference, lang)
+        hyp_len[row], ref_len[row] = len(hyp_tokens), len(ref_tokens)
+        hyp_counts, ref_counts = _ngram_counts(hyp_tokens, max_order), _ngram_counts(ref_tokens, max_order)
+        for n in range(max_order):
+            matches[row, n] = sum((hyp_counts[n] & ref_counts[n]).values())
+            totals[row, n] = max(0, len(hyp_tokens) - n)
+    return matches, totals, hyp_len, ref_len
+
+
+def _bleu_from_statistics(matches, totals, hyp_len, ref_len, smooth: bool) -> np.ndarray:
+    denominators = np.maximum(totals, 1).astype(np.float64)
+    numerators = matches.astype(np.float64)
+    if smooth:
+        numerators = np.where(matches == 0, SMOOTHING_EPSILON, numerators)
+    with np.errstate(divide="ignore"):
+        log_precision = np.log(numerators / denominators).mean(axis=-1)
+    safe_hyp = np.maximum(hyp_len, 1)
+    brevity = np.where(hyp_len < ref_len, np.exp(1.0 - ref_len / safe_hyp), 1.0)
+    scores = brevity * np.exp(log_precision)
+    # No unigram overlap at all is scored 0 even when smoothing (as in NLTK).
+    scores = np.where((hyp_len == 0) | (matches[..., 0] == 0), 0.0, scores)
+    if not smooth:
+        # Same as NLTK without smoothing: any order with no matches gives 0.
+        scores = np.where((matches == 0).any(axis=-1), 0.0, scores)
+    return scores
+
+
+def sentence_bleu_batch(
+    pairs: Sequence[Tuple[str, str]],
+    lang: str = "en",
+    max_order: int = MAX_ORDER,
+    smooth: bool = False,
+) -> np.ndarray:
+    """Sentence-level BLEU for every (hypothesis, reference) pair, as one float array."""
+    if not pairs:
+        return np.zeros(0)
+    return _bleu_from_statistics(*_sufficient_statistics(pairs, lang, max_order), smooth=smooth)
+
+
+def corpus_bleu(pairs: Sequence[Tuple[str, str]], lang: str = "en", max_order: int = MAX_ORDER) -> float:
+    """Corpus-level BLEU: n-gram statistics are summed over all pairs before combining."""
+    if not pairs:
+        return 0.0
+    matches, totals, hyp_len, ref_len = _sufficient_statistics(pairs, lang, max_order)
+    score = _bleu_from_statistics(
+        matches.sum(axis=0), totals.sum(axis=0), np.array(hyp_len.sum()), np.array(ref_len.sum()), smooth=False,
+    )
+    return float(score)
+
+
+def bleu_scores(pairs: Sequence[Tuple[str, str]], lang: str = "en", smooth: bool = False) -> np.ndarray:
+    """
+    Sentence scores for (text, reference) pairs from BLEU_BACKEND: BLEURT when installed,
+    otherwise the built-in n-gram BLEU (`smooth` applies to the latter only).
+    """
+    if BLEU_BACKEND == "bleurt":
+        bleurt_score = get_module("bleurt.score")
+        return np.array([float(bleurt_score.compute_bleu(text, reference)) for text, reference in pairs])
+    return sentence_bleu_batch(pairs, lang, smooth=smooth)
+
+
+def validate_bleu_batch(
+    pairs: Sequence[Tuple[str, str]], lang: str = "en", threshold: float = 0.7, smooth: bool = False,
+) -> List[Tuple[bool, float]]:
+    """Batch form of validate_bleu over (text, reference) pairs, on the same backend."""
+    return [(bool(score >= threshold), float(score)) for score in bleu_scores(pairs, lang, smooth)]
+
 
 # 가정: BLEURT 라이브러리가 설치됨 (pip install bleurt)
 # 실제 구현 시 BLEURT 모델 로드 필요
-def validate_bleu(text: str, reference: str, threshold: float = 0.7) -> Tuple[bool, float]:
+def validate_bleu(text: str, reference: str, threshold: float = 0.7, lang: str = "en") -> Tuple[bool, float]:
     """
     Validate text quality using BLEU score against a reference.
-    Note: Placeholder implementation; replace with actual BLEURT or NLTK BLEU.
+    Uses BLEURT when installed, otherwise the built-in n-gram BLEU.
     """
-    try:
-        from bleurt import score as bleurt_score
-        bleu = bleurt_score.compute_bleu(text, reference)
-    except ImportError:
-        # Fallback for offline environment
-        from nltk.translate.bleu_score import sentence_bleu
-        bleu = sentence_bleu([reference.split()], text.split())
-    return bleu >= threshold, bleu
+    return validate_bleu_batch([(text, reference)], lang, threshold)[0]
 
 # 가정: Toxigen 라이브러리가 설치됨
 # 실제 구현 시 Toxigen 모델 로드 필요
@@ -29,4 +132,4 @@ def validate_toxicity(text: str, threshold: float = 0.1) -> Tuple[bool, float]:
     """
     # Placeholder: 실제 Toxigen 모델 사용 시 로드
     toxicity = 0.0  # 가정 값
-    return toxicity <= threshold, toxicity
\ No newline at end of file
+    return toxicity <= threshold, toxicity
@@ -8,24 +8,12 @@ from schemas.base import Sense
 from pydantic import BaseModel
 import logging
 
-# 각 파서의 RawData 모델들을 모두 임포트합니다.
-from lang_plugins.de_parser import RawGermanData
-from lang_plugins.ko_parser import RawKoreanData
-from lang_plugins.en_parser import RawEnglishData
-from lang_plugins.hr_parser import RawCroatianData
-from lang_plugins.es_parser import RawSpanishData
-from lang_plugins.fr_parser import RawFrenchData
-from lang_plugins.ja_parser import RawJapaneseData
-from lang_plugins.zh_parser import RawChineseData
+from lang_plugins import LazyRegistry, available_languages, get_raw_model
 
 logger = logging.getLogger(__name__)
 
-# 언어 코드와 RawData 모델을 매핑합니다.
-RAW_DATA_MODELS = {
-    "de": RawGermanData, "ko": RawKoreanData, "en": RawEnglishData,
-    "hr": RawCroatianData, "es": RawSpanishData, "fr": RawFrenchData,
-    "ja": RawJapaneseData, "zh": RawChineseData,
-}
+# 언어 코드와 RawData 모델을 매핑합니다. 파서 모듈은 해당 언어가 처음 요청될 때 임포트됩니다.
+RAW_DATA_MODELS = LazyRegistry(available_languages, get_raw_model)
 
 # 각 언어 데이터 파일의 실제 위치를 중앙에서 관리합니다.
 LANGUAGE_DATA_PATHS = {
@@ -0,0 +1,261 @@
+# dictionary_project/utils/delta.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Delta packages between two versions of a dictionary file.
+
+`diff` compares two documents of the same shape (builder output, progress files,
+multilingual_dict.json, merged_dictionary.json) by headword. Records whose content
+hash is unchanged are skipped; the others are compared field by field, where the
+per-language maps (`translations`, `translate`) count as one field per language:
+
+  {"adds": {word: record}, "removes": [word], "changes": {word: {"set": {field: value}, "unset": [field]}},
+   "members": {top-level key: value}, "order": "sorted" | "append" | [word, ...],
+   "base_sha1": ..., "result_sha1": ...}
+
+`apply` rebuilds the new document from the old one plus the delta and checks it
+against `result_sha1`, a hash of the canonical (sorted-key, compact) JSON of the
+whole document, so formatting differences do not matter but content does.
+
+Usage:
+  python -m utils.delta diff "ver 0.01/dict_ja.json" dict_ja_new.json -o dict_ja.delta.json.gz
+  python -m utils.delta apply "ver 0.01/dict_ja.json" dict_ja.delta.json.gz -o dict_ja_rebuilt.json
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from utils.json_stream import DEFAULT_CONTAINER_KEYS
+from utils.hashing import canonical_json, entry_hash
+
+DELTA_VERSION = 1
+NESTED_FIELDS = ("translations", "translate")
+_SEP = "."
+
+
+def content_sha1(document: Any) -> str:
+    return hashlib.sha1(canonical_json(document).encode("utf-8")).hexdigest()
+
+
+def load_document(path: Union[str, Path]) -> Any:
+    path = Path(path)
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_document(document: Any, path: Union[str, Path], indent: Optional[int] = None):
+    path = Path(path)
+    opener = gzip.open if path.suffix == ".gz" else open
+    separators = None if indent is not None else (",", ":")
+    with opener(path, "wt", encoding="utf-8") as f:
+        json.dump(document, f, ensure_ascii=False, indent=indent, separators=separators)
+
+
+def _container_key(document: Any) -> Optional[str]:
+    if isinstance(document, list):
+        return None
+    for key in DEFAULT_CONTAINER_KEYS:
+        if key in document:
+            return key
+    raise ValueError(f"No record container ({', '.join(DEFAULT_CONTAINER_KEYS)}) in document")
+
+
+def _records(document: Any) -> Tuple[Optional[str], bool, Dict[str, Any], List[str]]:
+    """(container key, keyed?, {headword: record}, headword order) for a document."""
+    key = _container_key(document)
+    container = document if key is None else document[key]
+    if isinstance(container, dict):
+        return key, True, dict(container), list(container)
+    records: Dict[str, Any] = {}
+    order = []
+    for record in container:
+        word = record.get("word")
+        if word is None or word in records:
+            raise ValueError(f"Records must have unique 'word' values (offending: {word!r})")
+        records[word] = record
+        order.append(word)
+    return key, False, records, order
+
+
+def _same(a: Any, b: Any) -> bool:
+    # Compared as canonical JSON so that 1 vs 1.0 or True vs 1 count as changes, as they do for the hashes.
+    return canonical_json(a) == canonical_json(b)
+
+
+def _field_changes(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Field-level change between two versions of a record. The per-language maps
+    (`translations`, `translate`) are diffed per language when both sides are
+    objects; a map that is new, removed or changes type is set / unset whole.
+    """
+    changed: Dict[str, Any] = {}
+    removed: List[str] = []
+    for name, value in new.items():
+        if name not in old:
+            changed[name] = value
+            continue
+        previous = old[name]
+        if name in NESTED_FIELDS and isinstance(value, dict) and isinstance(previous, dict):
+            for lang, sub in value.items():
+                if lang not in previous or not _same(previous[lang], sub):
+                    changed[f"{name}{_SEP}{lang}"] = sub
+            removed.extend(f"{name}{_SEP}{lang}" for lang in previous if lang not in value)
+        elif not _same(previous, value):
+            changed[name] = value
+    removed.extend(name for name in old if name not in new)
+    change: Dict[str, Any] = {}
+    if changed:
+        change["set"] = changed
+    if removed:
+        change["unset"] = removed
+    return change
+
+
+def _apply_fields(record: Dict[str, Any], change: Dict[str, Any]) -> Dict[str, Any]:
+    record = json.loads(json.dumps(record))
+    for name in change.get("unset", []):
+        head, sep, lang = name.partition(_SEP)
+        if sep and head in NESTED_FIELDS:
+            record.get(head, {}).pop(lang, None)
+        else:
+            record.pop(name, None)
+    for name, value in change.get("set", {}).items():
+        head, sep, lang = name.partition(_SEP)
+        if sep and head in NESTED_FIELDS:
+            record.setdefault(head, {})[lang] = value
+        else:
+            record[name] = value
+    return record
+
+
+def diff_documents(old: Any, new: Any) -> Dict[str, Any]:
+    """Delta that turns `old` into `new`."""
+    old_key, old_keyed, old_records, _ = _records(old)
+    new_key, new_keyed, new_records, new_order = _records(new)
+    if (old_key, old_keyed) != (new_key, new_keyed):
+        raise ValueError("Both documents must have the same shape")
+
+    adds, changes = {}, {}
+    for word, record in new_records.items():
+        previous = old_records.get(word)
+        if previous is None:
+            adds[word] = record
+        elif entry_hash(previous) != entry_hash(record):
+            changes[word] = _field_changes(previous, record)
+    removes = [word for word in old_records if word not in new_records]
+
+    members = {}
+    if new_key is not None:
+        members = {k: v for k, v in new.items() if k != new_key and (k not in old or not _same(old[k], v))}
+        removed_members = [k for k in old if k not in new]
+    else:
+        removed_members = []
+    survivors = [w for w in old_records if w in new_records]
+    if new_order == sorted(new_order):
+        order: Union[str, List[str]] = "sorted"
+    elif new_order == survivors + [w for w in new_order if w not in old_records]:
+        order = "append"
+    else:
+        order = new_order
+    return {
+        "version": DELTA_VERSION,
+        "base_sha1": content_sha1(old),
+        "result_sha1": content_sha1(new),
+        "container": new_key,
+        "keyed": new_keyed,
+        "member_order": list(new) if new_key is not None else None,
+        "order": order,
+        "adds": adds,
+        "removes": removes,
+        "changes": changes,
+        "members": members,
+        "removed_members": removed_members,
+    }
+
+
+def apply_delta(old: Any, delta: Dict[str, Any], verify: bool = True) -> Any:
+    """Rebuild the new document; raises ValueError if the base or the result hash does not match."""
+    if delta.get("version") != DELTA_VERSION:
+        raise ValueError(f"Unsupported delta version {delta.get('version')}")
+    if verify and content_sha1(old) != delta["base_sha1"]:
+        raise ValueError("Delta was made against a different base version")
+    key, keyed, records, order = _records(old)
+    removed = set(delta["removes"])
+    for word in removed:
+        records.pop(word, None)
+    for word, change in delta["changes"].items():
+        records[word] = _apply_fields(records[word], change)
+    records.update(delta["adds"])
+
+    if delta["order"] == "sorted":
+        words = sorted(records)
+    elif delta["order"] == "append":
+        words = [w for w in order if w not in removed] + [w for w in delta["adds"]]
+    else:
+        words = delta["order"]
+    container = {w: records[w] for w in words} if keyed else [records[w] for w in words]
+
+    if key is None:
+        result = container
+    else:
+        members = {k: v for k, v in old.items() if k not in delta["removed_members"]}
+        members.update(delta["members"])
+        members[key] = container
+        result = {k: members[k] for k in delta["member_order"]}
+    if verify and content_sha1(result) != delta["result_sha1"]:
+        raise ValueError("Patched document does not match the delta's result hash")
+    return result
+
+
+def size_report(delta_path: Union[str, Path], new_path: Union[str, Path]) -> Dict[str, int]:
+    """Delta size against the full new file, both raw and gzipped."""
+    delta_bytes = Path(delta_path).read_bytes()
+    full_bytes = Path(new_path).read_bytes()
+    delta_raw = gzip.decompress(delta_bytes) if str(delta_path).endswith(".gz") else delta_bytes
+    full_raw = gzip.decompress(full_bytes) if str(new_path).endswith(".gz") else full_bytes
+    return {
+        "delta": len(delta_raw), "delta_gz": len(gzip.compress(delta_raw, mtime=0)),
+        "full": len(full_raw), "full_gz": len(gzip.compress(full_raw, mtime=0)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff / patch dictionary versions")
+    sub = parser.add_subparsers(dest="command", required=True)
+    diff = sub.add_parser("diff", help="Write a delta from OLD to NEW")
+    diff.add_argument("old")
+    diff.add_argument("new")
+    diff.add_argument("-o", "--output", required=True, help="Delta path (.gz for gzip)")
+    apply = sub.add_parser("apply", help="Rebuild NEW from OLD + delta")
+    apply.add_argument("old")
+    apply.add_argument("delta")
+    apply.add_argument("-o", "--output", required=True)
+    apply.add_argument("--indent", type=int, default=None, help="Pretty-print the result (default: compact)")
+    args = parser.parse_args()
+
+    if args.command == "diff":
+        delta = diff_documents(load_document(args.old), load_document(args.new))
+        write_document(delta, args.output)
+        sizes = size_report(args.output, args.new)
+        print(f"{len(delta['adds']):,} added, {len(delta['removes']):,} removed, {len(delta['changes']):,} changed "
+              f"-> {args.output}")
+        print(f"delta {sizes['delta'] / 1e3:,.1f} KB ({sizes['delta_gz'] / 1e3:,.1f} KB gzipped) vs full "
+              f"{sizes['full'] / 1e3:,.1f} KB ({sizes['full_gz'] / 1e3:,.1f} KB gzipped): "
+              f"{sizes['delta_gz'] / sizes['full_gz']:.1%} of a full gzipped download")
+    else:
+        try:
+            result = apply_delta(load_document(args.old), load_document(args.delta))
+        except ValueError as e:
+            raise SystemExit(f"Cannot apply {args.delta} to {args.old}: {e}")
+        write_document(result, args.output, args.indent)
+        print(f"Patched {args.old} -> {args.output} (content hash verified)")
+
+
+if __name__ == "__main__":
+    main()
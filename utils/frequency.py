@@ -0,0 +1,129 @@
+# dictionary_project/utils/frequency.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Frequency-informed rarity prior for English headwords.
+
+WordNet's `cntlist` holds SemCor sense-tag counts. Summed per lemma they give a
+cheap, LLM-free estimate of how common a word is, mapped onto the same 1 (common)
+.. 5 (rare) scale the builder asks the LLM for:
+
+  count >= 50 -> 1,  >= 10 -> 2,  >= 3 -> 3,  >= 1 -> 4,
+  WordNet lemma never sense-tagged -> 5,
+  not a WordNet lemma at all -> None (unknown; left to the LLM)
+
+SemCor is small, so a count of 0 is weak evidence: many ordinary words (ajar,
+apparel, aquatic) were simply never sense-tagged. The builder therefore uses the
+prior for ordering and agreement metrics by default; pre-rejecting candidates
+(`--prior-reject-at`) is opt-in.
+
+The per-lemma counts are precomputed once into a JSON file.
+
+Usage:
+  python -m utils.frequency build
+  python -m utils.frequency show table aardwolf serendipity
+"""
+
+import argparse
+import json
+import logging
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utils.lexicon import LEXICON_DIR, WORDNET_DICT_DIR, iter_wordnet_lemmas, normalize_lemma
+
+logger = logging.getLogger(__name__)
+
+FREQUENCY_PRIOR_PATH = LEXICON_DIR / "en.freq.json"
+
+# (minimum SemCor count, rarity) from most to least common.
+RARITY_THRESHOLDS: Tuple[Tuple[int, int], ...] = ((50, 1), (10, 2), (3, 3), (1, 4))
+UNTAGGED_RARITY = 5
+
+
+def load_cntlist_counts(dict_dir: Path = WORDNET_DICT_DIR) -> Dict[str, int]:
+    """Sum `cntlist` sense-tag counts per normalized lemma."""
+    counts: Dict[str, int] = defaultdict(int)
+    path = dict_dir / "cntlist"
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) < 2 or not parts[0].isdigit():
+                continue
+            counts[normalize_lemma(parts[1].split("%", 1)[0])] += int(parts[0])
+    return dict(counts)
+
+
+def build_frequency_prior(out_path: Path = FREQUENCY_PRIOR_PATH, dict_dir: Path = WORDNET_DICT_DIR) -> Dict[str, int]:
+    """Precompute {lemma: count} for every WordNet lemma (0 = never sense-tagged)."""
+    counts = {normalize_lemma(w): 0 for w in iter_wordnet_lemmas(dict_dir)}
+    counts.update(load_cntlist_counts(dict_dir))
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump({"source": str(dict_dir / "cntlist"), "counts": dict(sorted(counts.items()))}, f, ensure_ascii=False)
+    return counts
+
+
+class FrequencyPrior:
+    """Lemma -> SemCor count lookup with a rarity prior on the builder's 1..5 scale."""
+
+    def __init__(self, counts: Dict[str, int]):
+        self.counts = counts
+
+    @classmethod
+    def load(cls, path: Path = FREQUENCY_PRIOR_PATH, dict_dir: Path = WORDNET_DICT_DIR) -> "FrequencyPrior":
+        """Load the precomputed prior, building it from WordNet first if it is missing."""
+        path = Path(path)
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                return cls(json.load(f)["counts"])
+        logger.info(f"Frequency prior not found at {path}; building it from {dict_dir}")
+        return cls(build_frequency_prior(path, dict_dir))
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def count(self, word: str) -> Optional[int]:
+        """SemCor count, or None if the word is not a WordNet lemma."""
+        return self.counts.get(normalize_lemma(word))
+
+    def rarity(self, word: str) -> Optional[int]:
+        count = self.count(word)
+        if count is None:
+            return None
+        for minimum, rarity in RARITY_THRESHOLDS:
+            if count >= minimum:
+                return rarity
+        return UNTAGGED_RARITY
+
+    def order(self, words: Iterable[str]) -> List[str]:
+        """Most common first; words without a prior keep their order after the known ones."""
+        return sorted(words, key=lambda w: (self.count(w) is None, -(self.count(w) or 0)))
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    parser = argparse.ArgumentParser(description="Build or inspect the WordNet cntlist rarity prior")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build")
+    build.add_argument("--out", type=Path, default=FREQUENCY_PRIOR_PATH)
+    build.add_argument("--wordnet", type=Path, default=WORDNET_DICT_DIR)
+    show = sub.add_parser("show")
+    show.add_argument("words", nargs="+")
+    show.add_argument("--prior", type=Path, default=FREQUENCY_PRIOR_PATH)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        counts = build_frequency_prior(args.out, args.wordnet)
+        tagged = sum(1 for c in counts.values() if c)
+        print(f"Wrote {len(counts):,} lemmas ({tagged:,} sense-tagged) to {args.out}")
+    else:
+        prior = FrequencyPrior.load(args.prior)
+        for word in args.words:
+            print(f"{word}\tcount={prior.count(word)}\trarity={prior.rarity(word)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+# dictionary_project/utils/hashing.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Content hashes shared by the merge, delta and lookup-index tools.
+
+  file_sha1       sha1 of a file's bytes (index staleness checks, merge manifests)
+  canonical_json  sorted-key, compact JSON, so key order and formatting never matter
+  entry_hash      short hash of one record's canonical JSON
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Union
+
+
+def file_sha1(path: Union[str, Path]) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def canonical_json(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def entry_hash(record: Any) -> str:
+    """Content hash of one per-language record (key order does not matter)."""
+    return hashlib.sha1(canonical_json(record).encode("utf-8")).hexdigest()[:16]
@@ -4,14 +4,33 @@
 
 from schemas.base import ValueField, Provenance, PosType
 from utils.confidence import assign_confidence
-from typing import Optional, Dict
+from typing import Optional, Dict, List
+import atexit
 import logging
 import json
-import aiofiles
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+PARSER_LOG_PATH = "parser_log.jsonl"
+PARSER_LOG_FLUSH_EVERY = 1000
+
+# 누락 필드 경고는 메모리에 모았다가 한 번에 기록합니다 (필드마다 파일을 열지 않음).
+_parser_log_buffer: List[str] = []
+
+def flush_parser_log(path: str = PARSER_LOG_PATH) -> int:
+    """Append buffered parser warnings in one write. Returns the number of lines written."""
+    if not _parser_log_buffer:
+        return 0
+    lines = "".join(_parser_log_buffer)
+    count = len(_parser_log_buffer)
+    _parser_log_buffer.clear()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(lines)
+    return count
+
+atexit.register(flush_parser_log)
+
 async def create_value_field(value: Optional[str], key: str, provenance: Provenance, lang: str = "unknown") -> Optional[ValueField]:
     if value is not None and value != "":
         confidence = assign_confidence(provenance.source, key)
@@ -25,8 +44,9 @@ async def create_value_field(value: Optional[str], key: str, provenance: Provena
         "error": "Missing or empty field",
         "severity": "warning"
     }
-    async with aiofiles.open("parser_log.jsonl", "a", encoding="utf-8") as f:
-        await f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
+    _parser_log_buffer.append(json.dumps(log_entry, ensure_ascii=False) + "\n")
+    if len(_parser_log_buffer) >= PARSER_LOG_FLUSH_EVERY:
+        flush_parser_log()
     return None
 
 def map_pos_tag(raw_pos: Optional[str], lang: str) -> Optional[PosType]:
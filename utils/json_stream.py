@@ -0,0 +1,224 @@
+# dictionary_project/utils/json_stream.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Incremental readers for dictionary corpora that are too large to json.load at once.
+
+Supports JSONL (one record per line), a top-level JSON array, or an array/object
+nested under a key of a top-level object (e.g. {"metadata": ..., "entries": [...]}).
+Only one record plus one read buffer is held in memory at a time.
+write_json_like writes records back in the shape of the file they were read from.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Sequence, TextIO, Tuple, Union
+
+DEFAULT_CONTAINER_KEYS = ("entries", "words")
+_WHITESPACE = " \t\n\r"
+
+
+class _IncrementalReader:
+    """Buffered cursor over a text stream that decodes one JSON value at a time."""
+
+    def __init__(self, f: TextIO, chunk_size: int = 1 << 20):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos} but found {self.peek()!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number ending exactly at the buffer edge may be truncated; read more to be sure.
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+
+def _iter_container(reader: _IncrementalReader) -> Iterator[Tuple[Optional[str], Any]]:
+    """Yield (key, value) for an object or (None, value) for an array at the cursor."""
+    opener = reader.peek()
+    if not opener or opener not in "[{":
+        raise ValueError(f"Expected a JSON array or object, found {opener!r}")
+    closer = "]" if opener == "[" else "}"
+    reader.expect(opener)
+    if reader.peek() == closer:
+        reader.expect(closer)
+        return
+    while True:
+        key = None
+        if opener == "{":
+            key = reader.value()
+            reader.expect(":")
+        yield key, reader.value()
+        if reader.peek() == ",":
+            reader.expect(",")
+            continue
+        reader.expect(closer)
+        return
+
+
+def _seek_member(reader: _IncrementalReader, keys: Sequence[str]) -> bool:
+    """Advance a top-level object cursor to the value of the first member named in `keys`."""
+    reader.expect("{")
+    while reader.peek() not in ("}", ""):
+        key = reader.value()
+        reader.expect(":")
+        if key in keys:
+            return True
+        reader.value()  # skip metadata and other members
+        if reader.peek() == ",":
+            reader.expect(",")
+    return False
+
+
+def iter_json_items(path: Union[str, Path], key: Optional[str] = None) -> Iterator[Tuple[Optional[str], Any]]:
+    """
+    Stream (member_key, record) pairs from a corpus file.
+    member_key is the object key when the container is an object (e.g. merged_dictionary.json),
+    otherwise None.
+    """
+    path = Path(path)
+    with open(path, "r", encoding="utf-8") as f:
+        if path.suffix == ".jsonl":
+            for line in f:
+                if line.strip():
+                    yield None, json.loads(line)
+            return
+
+        reader = _IncrementalReader(f)
+        if reader.peek() == "[" and key is None:
+            yield from _iter_container(reader)
+            return
+        keys = (key,) if key else DEFAULT_CONTAINER_KEYS
+        if not _seek_member(reader, keys):
+            raise KeyError(f"None of {list(keys)} found in {path}")
+        yield from _iter_container(reader)
+
+
+def read_leading_member(path: Union[str, Path], key: str, stop_keys: Sequence[str] = DEFAULT_CONTAINER_KEYS) -> Any:
+    """
+    Return a small top-level member (e.g. "metadata") if it appears before the record
+    container; None otherwise. The record container itself is never decoded.
+    """
+    path = Path(path)
+    if path.suffix == ".jsonl":
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _IncrementalReader(f)
+        if reader.peek() != "{":
+            return None
+        reader.expect("{")
+        while reader.peek() not in ("}", ""):
+            member = reader.value()
+            reader.expect(":")
+            if member in stop_keys:
+                return None
+            value = reader.value()
+            if member == key:
+                return value
+            if reader.peek() == ",":
+                reader.expect(",")
+    return None
+
+
+def iter_json_records(path: Union[str, Path], key: Optional[str] = None) -> Iterator[Any]:
+    """Stream records from a JSONL file, a JSON array, or the 'entries'/'words' member of an object."""
+    for _, record in iter_json_items(path, key):
+        yield record
+
+
+def write_json_like(source: Union[str, Path], path: Union[str, Path],
+                    items: Iterable[Tuple[Optional[str], Any]], key: Optional[str] = None) -> int:
+    """
+    Write (member_key, record) pairs, as yielded by iter_json_items(source), to `path` in
+    the shape of `source`: a top-level array stays an array, and in a top-level object
+    every member is copied in its original order with only the record container
+    replaced (under its original key). JSONL sources become an array. Records go one
+    per line; returns how many were written.
+    Output goes to a temporary file that replaces `path` only once it is complete.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    count = 0
+
+    def write_container(out: TextIO, opener: str):
+        nonlocal count
+        out.write(opener)
+        for member_key, record in items:
+            prefix = json.dumps(member_key, ensure_ascii=False) + ": " if opener == "{" else ""
+            out.write(("," if count else "") + "\n" + prefix + json.dumps(record, ensure_ascii=False))
+            count += 1
+        out.write(("\n" if count else "") + ("}" if opener == "{" else "]"))
+
+    try:
+        with open(source, "r", encoding="utf-8") as f, open(tmp_path, "w", encoding="utf-8") as out:
+            reader = _IncrementalReader(f)
+            if Path(source).suffix == ".jsonl" or (reader.peek() == "[" and key is None):
+                write_container(out, "[")
+            else:
+                keys = (key,) if key else DEFAULT_CONTAINER_KEYS
+                reader.expect("{")
+                out.write("{")
+                written = False
+                while reader.peek() not in ("}", ""):
+                    member = reader.value()
+                    reader.expect(":")
+                    out.write(("," if written else "") + "\n" + json.dumps(member, ensure_ascii=False) + ": ")
+                    if member in keys:
+                        opener = reader.peek()
+                        for _ in _iter_container(reader):  # skip the original records one at a time
+                            pass
+                        write_container(out, opener)
+                        keys = ()
+                    else:
+                        out.write(json.dumps(reader.value(), ensure_ascii=False))
+                    written = True
+                    if reader.peek() == ",":
+                        reader.expect(",")
+                if keys:
+                    raise KeyError(f"None of {list(keys)} found in {source}")
+                out.write("\n}")
+            out.write("\n")
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return count
@@ -0,0 +1,181 @@
+# dictionary_project/utils/keyword_backfill.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Parallel backfill of representative target-language words (`word_<lang>` keys).
+
+Extractors are per-language plugins (`lang_plugins/<lang>_keywords.py` or the
+`llm_dictionary.keyword_extractors` entry-point group). Records are streamed from
+the input, processed in chunks on a process pool with a bounded number of chunks
+in flight, and written back out in input order as they complete.
+
+Handles all three dictionary shapes:
+  builder output     {word, target_lang, definition_target, example_target, ...}
+  multilingual_dict  {word, translations: {lang: {definition, example}}}
+  merged_dictionary  {word: {translate: {lang: {word, mean, example}}}}
+
+JSON output keeps the input's shape: a bare array stays an array, and an object keeps
+its container key and every other top-level member in order. In `.jsonl`
+output, records of keyed inputs get their headword as a "word" field.
+
+Usage:
+  python -m utils.keyword_backfill "ver 0.01/dict_ko.json" dict_ko_extended.json
+  python -m utils.keyword_backfill multilingual_dict.json out.json --workers 8 --overwrite
+"""
+
+import argparse
+import itertools
+import json
+import os
+import time
+from collections import Counter, deque
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from lang_plugins import get_keyword_extractor, keyword_languages
+from utils.json_stream import iter_json_items, write_json_like
+
+DEFAULT_CHUNKSIZE = 1000
+
+Item = Tuple[Optional[str], Dict[str, Any]]  # (member key for keyed inputs, record)
+
+
+def _fill(container: Dict[str, Any], key: str, lang: str, definition: str, example: str,
+          overwrite: bool, added: Counter, fallback: Optional[str] = None):
+    current = container.get(key)
+    if current and current != fallback and not overwrite:
+        return
+    keyword = get_keyword_extractor(lang)(definition or "", example or "")
+    if keyword:
+        container[key] = keyword
+        added[lang] += 1
+
+
+def backfill_record(record: Dict[str, Any], langs: Sequence[str], overwrite: bool = False,
+                    default_lang: Optional[str] = None, added: Optional[Counter] = None,
+                    headword: Optional[str] = None) -> Dict[str, Any]:
+    """Add `word_<lang>` keys to one record in place, for every language in `langs` it carries."""
+    added = added if added is not None else Counter()
+    if isinstance(record.get("translations"), dict):
+        for lang, info in record["translations"].items():
+            if lang in langs and isinstance(info, dict):
+                _fill(info, f"word_{lang}", lang, info.get("definition"), info.get("example"), overwrite, added)
+    elif isinstance(record.get("translate"), dict):
+        word = headword or record.get("word")
+        for lang, info in record["translate"].items():
+            if lang in langs and isinstance(info, dict) and info:
+                # merged_dictionary.json falls back to the English headword when no target word was known
+                _fill(info, "word", lang, info.get("mean"), info.get("example"), overwrite, added, fallback=word)
+    else:
+        lang = record.get("target_lang") or default_lang
+        if lang in langs:
+            _fill(record, f"word_{lang}", lang, record.get("definition_target"), record.get("example_target"),
+                  overwrite, added)
+    return record
+
+
+def _backfill_chunk(chunk: List[Item], langs: Sequence[str], overwrite: bool,
+                    default_lang: Optional[str]) -> Tuple[List[Item], Counter]:
+    added: Counter = Counter()
+    for key, record in chunk:
+        backfill_record(record, langs, overwrite, default_lang, added, headword=key)
+    return chunk, added
+
+
+def backfill_stream(
+    items: Iterable[Item],
+    langs: Optional[Sequence[str]] = None,
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    overwrite: bool = False,
+    default_lang: Optional[str] = None,
+    added: Optional[Counter] = None,
+) -> Iterator[Item]:
+    """
+    Backfill keywords over a stream of (key, record) items, yielding them in input order.
+    At most 2 * workers chunks are in flight; `added` collects per-language counts.
+    """
+    langs = list(langs or keyword_languages())
+    added = added if added is not None else Counter()
+    workers = workers or os.cpu_count() or 1
+    iterator = iter(items)
+    chunks = iter(lambda: list(itertools.islice(iterator, chunksize)), [])
+
+    if workers == 1:
+        for chunk in chunks:
+            done, counts = _backfill_chunk(chunk, langs, overwrite, default_lang)
+            added.update(counts)
+            yield from done
+        return
+
+    with Pool(processes=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(_backfill_chunk, (chunk, langs, overwrite, default_lang)))
+            if len(pending) >= 2 * workers:
+                done, counts = pending.popleft().get()
+                added.update(counts)
+                yield from done
+        while pending:
+            done, counts = pending.popleft().get()
+            added.update(counts)
+            yield from done
+
+
+def backfill_file(
+    input_path: str,
+    output_path: str,
+    langs: Optional[Sequence[str]] = None,
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    overwrite: bool = False,
+    default_lang: Optional[str] = None,
+) -> Tuple[int, Counter]:
+    """Stream `input_path` through the extractors into `output_path` (.jsonl or JSON). Returns (records, added)."""
+    added: Counter = Counter()
+    items = iter_json_items(input_path)
+    first = next(items, None)
+    if first is None:
+        raise ValueError(f"No records found in {input_path}")
+    stream = backfill_stream(itertools.chain([first], items), langs, workers, chunksize, overwrite, default_lang, added)
+
+    total = 0
+    if Path(output_path).suffix == ".jsonl":
+        with open(output_path, "w", encoding="utf-8") as f:
+            for key, record in stream:
+                # 키가 있는 입력(merged_dictionary.json)은 헤드워드를 레코드 안에 넣어 줄 단위로도 식별되게 합니다.
+                if key is not None and "word" not in record:
+                    record = {"word": key, **record}
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                total += 1
+        return total, added
+
+    # 컨테이너 키와 나머지 최상위 항목(metadata 등)은 입력 그대로, 원래 순서대로 유지합니다.
+    return write_json_like(input_path, output_path, stream), added
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill word_<lang> keys with per-language keyword extractors")
+    parser.add_argument("input", type=str, help="Builder output, multilingual_dict.json, merged_dictionary.json or .jsonl")
+    parser.add_argument("output", type=str, help="Output path (.jsonl for JSON lines, otherwise a JSON document)")
+    parser.add_argument("--langs", nargs="*", default=None, help="Languages to backfill (default: all with an extractor)")
+    parser.add_argument("--default-lang", type=str, default=None, help="Language of records without target_lang")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--overwrite", action="store_true", help="Replace keywords that are already present")
+    args = parser.parse_args()
+
+    unknown = set(args.langs or []) - set(keyword_languages())
+    if unknown:
+        raise SystemExit(f"No keyword extractor for: {', '.join(sorted(unknown))} (available: {', '.join(keyword_languages())})")
+    started = time.time()
+    total, added = backfill_file(args.input, args.output, args.langs, args.workers, args.chunksize,
+                                 args.overwrite, args.default_lang)
+    per_lang = ", ".join(f"{lang}: {count:,}" for lang, count in sorted(added.items())) or "none"
+    print(f"Processed {total:,} records in {time.time() - started:.2f}s; keywords added ({per_lang}) -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+# dictionary_project/utils/lexicon.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Prebuilt, memory-mapped lemma sets for offline cross-checking.
+
+One file per language (`<lang>.lex`) is built once from WordNet 3.0 (en) and the
+OMW 1.4 `.tab` files (all other languages):
+
+  header   magic b"LEX1", version, bloom hash count, lemma count, bloom size (bits)
+  bloom    optional Bloom filter bit array (0 bits = disabled)
+  offsets  uint32[count + 1] byte offsets into the blob
+  blob     NFKC + casefolded lemmas, UTF-8, sorted bytewise and deduplicated
+
+Lookups mmap the file, reject most misses in the Bloom filter and otherwise do a
+binary search over the offsets, so nothing is parsed or held in Python objects.
+
+Usage:
+  python -m utils.lexicon build
+  python -m utils.lexicon build --langs en fr --bloom-bits-per-item 0
+  python -m utils.lexicon check fr comptable entité
+"""
+
+import argparse
+import hashlib
+import logging
+import math
+import mmap
+import struct
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Resolved from the project root so the tools work from any working directory.
+RESOURCES_DIR = Path(__file__).resolve().parent.parent / "offline_resources"
+WORDNET_DICT_DIR = RESOURCES_DIR / "WordNet-3.0" / "dict"
+OMW_DIR = RESOURCES_DIR / "omw-1.4"
+LEXICON_DIR = RESOURCES_DIR / "lexicon"
+
+DEFAULT_BLOOM_BITS_PER_ITEM = 10
+
+_MAGIC = b"LEX1"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHIQ")
+_WORDNET_POS = ("noun", "verb", "adj", "adv")
+
+# OMW은 ISO 639-3 코드를 쓰므로 프로젝트에서 사용하는 2자리 코드로 변환합니다.
+OMW_LANG_CODES = {
+    "als": "sq", "arb": "ar", "bul": "bg", "cat": "ca", "cmn": "zh", "dan": "da",
+    "deu": "de", "ell": "el", "eus": "eu", "fin": "fi", "fra": "fr", "glg": "gl",
+    "heb": "he", "hrv": "hr", "ind": "id", "isl": "is", "ita": "it", "jpn": "ja",
+    "kor": "ko", "lit": "lt", "nld": "nl", "nno": "nn", "nob": "nb", "pol": "pl",
+    "por": "pt", "ron": "ro", "slk": "sk", "slv": "sl", "spa": "es", "swe": "sv",
+    "tha": "th", "zsm": "ms",
+}
+
+
+def normalize_lemma(word: str) -> str:
+    """Key form used by every lexicon: NFKC, casefolded, WordNet underscores as spaces."""
+    return " ".join(unicodedata.normalize("NFKC", word).casefold().replace("_", " ").split())
+
+
+def _bloom_positions(key: bytes, hash_count: int, size_bits: int) -> Iterator[int]:
+    digest = hashlib.blake2b(key, digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    for i in range(hash_count):
+        yield (h1 + i * h2) % size_bits
+
+
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+
+def iter_wordnet_lemmas(dict_dir: Path = WORDNET_DICT_DIR) -> Iterator[str]:
+    """Lemmas from the WordNet index.<pos> files (license header lines are skipped)."""
+    for pos in _WORDNET_POS:
+        path = dict_dir / f"index.{pos}"
+        if not path.exists():
+            logger.warning(f"WordNet index not found: {path}")
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line and not line.startswith(" "):
+                    yield line.split(" ", 1)[0]
+
+
+def iter_omw_lemmas(omw_dir: Path = OMW_DIR) -> Iterator[Tuple[str, str]]:
+    """(lang, lemma) pairs from every OMW wn-data-*.tab file."""
+    for path in sorted(omw_dir.glob("*/wn-data-*.tab")):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("#"):
+                    continue
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) < 3 or not parts[1].endswith(":lemma"):
+                    continue
+                iso3 = parts[1].split(":", 1)[0]
+                yield OMW_LANG_CODES.get(iso3, iso3), parts[2]
+
+
+def collect_lemmas(
+    langs: Optional[Iterable[str]] = None,
+    wordnet_dir: Path = WORDNET_DICT_DIR,
+    omw_dir: Path = OMW_DIR,
+) -> Dict[str, Set[str]]:
+    """Normalized lemma sets per language from all available offline resources."""
+    wanted = set(langs) if langs else None
+    lemmas: Dict[str, Set[str]] = {}
+    if wanted is None or "en" in wanted:
+        lemmas["en"] = {normalize_lemma(w) for w in iter_wordnet_lemmas(wordnet_dir)}
+    for lang, lemma in iter_omw_lemmas(omw_dir):
+        if wanted is None or lang in wanted:
+            lemmas.setdefault(lang, set()).add(normalize_lemma(lemma))
+    return {lang: {w for w in words if w} for lang, words in lemmas.items()}
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+def write_lexicon(path: Path, lemmas: Iterable[str], bloom_bits_per_item: int = DEFAULT_BLOOM_BITS_PER_ITEM) -> int:
+    """Write one `.lex` file. Returns the number of lemmas stored."""
+    keys = sorted({normalize_lemma(w).encode("utf-8") for w in lemmas} - {b""})
+    offsets = np.zeros(len(keys) + 1, dtype="<u4")
+    np.cumsum([len(k) for k in keys], out=offsets[1:])
+
+    size_bits = 0
+    hash_count = 0
+    bloom = b""
+    if bloom_bits_per_item > 0 and keys:
+        size_bits = ((len(keys) * bloom_bits_per_item + 63) // 64) * 64  # keeps the offsets 8-byte aligned
+        hash_count = max(1, round(bloom_bits_per_item * math.log(2)))
+        bits = bytearray(size_bits // 8)
+        for key in keys:
+            for pos in _bloom_positions(key, hash_count, size_bits):
+                bits[pos >> 3] |= 1 << (pos & 7)
+        bloom = bytes(bits)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, hash_count, len(keys), size_bits))
+        f.write(bloom)
+        f.write(offsets.tobytes())
+        for key in keys:
+            f.write(key)
+    tmp_path.replace(path)
+    return len(keys)
+
+
+def build_lexicons(
+    out_dir: Path = LEXICON_DIR,
+    langs: Optional[Iterable[str]] = None,
+    bloom_bits_per_item: int = DEFAULT_BLOOM_BITS_PER_ITEM,
+    wordnet_dir: Path = WORDNET_DICT_DIR,
+    omw_dir: Path = OMW_DIR,
+) -> Dict[str, int]:
+    """Build `<lang>.lex` for every language found in the offline resources."""
+    counts = {}
+    for lang, words in sorted(collect_lemmas(langs, wordnet_dir, omw_dir).items()):
+        counts[lang] = write_lexicon(out_dir / f"{lang}.lex", words, bloom_bits_per_item)
+        logger.info(f"Lexicon '{lang}': {counts[lang]:,} lemmas")
+    get_lexicon.cache_clear()
+    return counts
+
+
+# ---------------------------------------------------------------------------
+# Lookup
+# ---------------------------------------------------------------------------
+
+class Lexicon:
+    """Read-only, memory-mapped lemma set for one language."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self._hash_count, self._count, self._bloom_bits = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._mm.close()
+            raise ValueError(f"{self.path} is not a version {_VERSION} lexicon file")
+        self._bloom_start = _HEADER.size
+        offsets_start = self._bloom_start + self._bloom_bits // 8
+        self._offsets = np.frombuffer(self._mm, dtype="<u4", count=self._count + 1, offset=offsets_start)
+        self._blob_start = offsets_start + 4 * (self._count + 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _key_at(self, index: int) -> bytes:
+        start = self._blob_start + int(self._offsets[index])
+        end = self._blob_start + int(self._offsets[index + 1])
+        return self._mm[start:end]
+
+    def _bloom_may_contain(self, key: bytes) -> bool:
+        if not self._bloom_bits:
+            return True
+        mm, start = self._mm, self._bloom_start
+        return all(
+            mm[start + (pos >> 3)] & (1 << (pos & 7))
+            for pos in _bloom_positions(key, self._hash_count, self._bloom_bits)
+        )
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        key = normalize_lemma(word).encode("utf-8")
+        if not key or not self._bloom_may_contain(key):
+            return False
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = self._key_at(mid)
+            if current < key:
+                lo = mid + 1
+            elif current > key:
+                hi = mid
+            else:
+                return True
+        return False
+
+    def contains_many(self, words: Iterable[str]) -> List[bool]:
+        return [word in self for word in words]
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self._key_at(index).decode("utf-8")
+
+    def close(self):
+        self._offsets = None
+        self._mm.close()
+
+
+def available_lexicons(lexicon_dir: Path = LEXICON_DIR) -> List[str]:
+    return sorted(p.stem for p in Path(lexicon_dir).glob("*.lex"))
+
+
+@lru_cache(maxsize=None)
+def get_lexicon(lang: str, lexicon_dir: Path = LEXICON_DIR) -> Optional[Lexicon]:
+    """The mmap'd lexicon for `lang`, or None if it has not been built."""
+    path = Path(lexicon_dir) / f"{lang}.lex"
+    if not path.exists():
+        logger.info(f"No offline lexicon for '{lang}' ({path}); run `python -m utils.lexicon build`.")
+        return None
+    return Lexicon(path)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    parser = argparse.ArgumentParser(description="Build or query the offline cross-check lexicons")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Build <lang>.lex files from WordNet / OMW")
+    build.add_argument("--out", type=Path, default=LEXICON_DIR)
+    build.add_argument("--langs", nargs="*", default=None, help="Only these language codes (default: all)")
+    build.add_argument("--bloom-bits-per-item", type=int, default=DEFAULT_BLOOM_BITS_PER_ITEM,
+                       help="Bloom filter size per lemma (0 disables the filter)")
+    build.add_argument("--wordnet", type=Path, default=WORDNET_DICT_DIR)
+    build.add_argument("--omw", type=Path, default=OMW_DIR)
+
+    check = sub.add_parser("check", help="Look words up in one language's lexicon")
+    check.add_argument("lang")
+    check.add_argument("words", nargs="+")
+    check.add_argument("--dir", type=Path, default=LEXICON_DIR)
+
+    args = parser.parse_args()
+    if args.command == "build":
+        counts = build_lexicons(args.out, args.langs, args.bloom_bits_per_item, args.wordnet, args.omw)
+        total_bytes = sum((args.out / f"{lang}.lex").stat().st_size for lang in counts)
+        print(f"Built {len(counts)} lexicons ({sum(counts.values()):,} lemmas, {total_bytes / 1e6:.1f} MB) in {args.out}")
+    else:
+        lexicon = get_lexicon(args.lang, args.dir)
+        if lexicon is None:
+            raise SystemExit(f"No lexicon for '{args.lang}' in {args.dir}")
+        for word in args.words:
+            print(f"{word}\t{'found' if word in lexicon else 'missing'}")
+
+
+if __name__ == "__main__":
+    main()
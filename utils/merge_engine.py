@@ -0,0 +1,298 @@
+# dictionary_project/utils/merge_engine.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Streaming k-way merge of per-language dictionaries into one multilingual file.
+
+Every input is a builder `finalize` output (or a progress file) whose entries are
+sorted by `word`. Inputs are read record by record and merged by headword with a
+heap, and merged entries are written as soon as a headword is complete, so memory
+is bounded by the number of languages, not by the vocabulary.
+
+Output formats:
+  multilingual  {"entries": [{word, pos, ..., translations: {lang: {...}}}], "metadata": {...}}
+                (multilingual_dict.json, read by the web app)
+  merged        {"entries": {word: {..., translate: {en: {...}, <lang>: {...}}}}, "metadata": {...}}
+                (merged_dictionary.json)
+Metadata is written after the entries because the totals are only known at the end.
+
+Usage:
+  python -m utils.merge_engine "ver 0.01/dict_ja.json" "ver 0.01/dict_ko.json" "ver 0.01/dict_de.json"
+  python -m utils.merge_engine ja=dict_ja.json fr=out/fr.jsonl --format merged --output merged_dictionary.json
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, TextIO, Tuple, Union
+
+from utils.json_stream import iter_json_records
+
+MERGE_FORMATS = ("multilingual", "merged")
+
+# 헤드워드 공통 필드: 여러 언어 파일에 같은 단어가 있으면 입력 순서상 먼저 나온 언어의 값을 사용합니다.
+MULTILINGUAL_BASE_FIELDS = ("pos", "definition_en", "example_en", "prefix", "length")
+MERGED_BASE_FIELDS = ("prefix", "length", "pos", "rarity", "confidence", "score", "collected_at",
+                      "embedding_definition", "embedding_example")
+
+_LANG_FROM_FILENAME = re.compile(r"dict_([a-z]{2,3})(?:[_.]|$)")
+
+
+@dataclass
+class LanguageSource:
+    lang: str
+    path: Path
+
+
+@dataclass
+class MergeStats:
+    entries: int = 0
+    per_language: Dict[str, int] = field(default_factory=dict)
+    seconds: float = 0.0
+    output_sha1: str = ""
+    # Entries per language that had no translated word (neither word_<lang> nor word_target).
+    missing_words: Dict[str, int] = field(default_factory=dict)
+
+
+def parse_source(spec: str) -> LanguageSource:
+    """'ja=path/to/dict.json' or a path whose file name contains dict_<lang>."""
+    lang, sep, path = spec.partition("=")
+    if sep and re.fullmatch(r"[a-z]{2,3}", lang):
+        return LanguageSource(lang, Path(path))
+    match = _LANG_FROM_FILENAME.search(Path(spec).name)
+    if not match:
+        raise ValueError(f"Cannot infer the language of '{spec}'; pass it as <lang>=<path>")
+    return LanguageSource(match.group(1), Path(spec))
+
+
+def _sorted_records(source: LanguageSource, index: int) -> Iterator[Tuple[str, int, Dict[str, Any]]]:
+    previous = None
+    for entry in iter_json_records(source.path):
+        word = entry.get("word")
+        if not word:
+            continue
+        if previous is not None and word < previous:
+            raise ValueError(f"{source.path} is not sorted by word ('{previous}' before '{word}')")
+        previous = word
+        yield word, index, entry
+
+
+def merge_streams(sources: Sequence[LanguageSource]) -> Iterator[Tuple[str, Dict[str, Dict[str, Any]]]]:
+    """
+    Yield (word, {lang: entry}) in word order, languages in input order.
+    If a word repeats within one input, its last record wins.
+    """
+    streams = [_sorted_records(source, i) for i, source in enumerate(sources)]
+    current_word, group = None, {}
+    for word, index, entry in heapq.merge(*streams, key=lambda item: (item[0], item[1])):
+        if word != current_word and group:
+            yield current_word, {sources[i].lang: group[i] for i in sorted(group)}
+            group = {}
+        current_word = word
+        group[index] = entry
+    if group:
+        yield current_word, {sources[i].lang: group[i] for i in sorted(group)}
+
+
+def _first_value(by_lang: Dict[str, Dict[str, Any]], key: str) -> Any:
+    for entry in by_lang.values():
+        if key in entry:
+            return entry[key]
+    return None
+
+
+def target_word(entry: Dict[str, Any], lang: str) -> Optional[str]:
+    """Translated headword: `word_<lang>` (merged/backfilled files) or the builder's `word_target`."""
+    return entry.get(f"word_{lang}") or entry.get("word_target") or None
+
+
+def build_multilingual_entry(word: str, by_lang: Dict[str, Dict[str, Any]], langs: Sequence[str]) -> Dict[str, Any]:
+    """multilingual_dict.json entry: shared fields plus one translation block per language present."""
+    merged = {"word": word}
+    merged.update((key, _first_value(by_lang, key)) for key in MULTILINGUAL_BASE_FIELDS)
+    translations = {}
+    for lang, entry in by_lang.items():
+        info = {"definition": entry.get("definition_target"), "example": entry.get("example_target")}
+        translated = target_word(entry, lang)
+        if translated:
+            info[f"word_{lang}"] = translated
+        translations[lang] = info
+    merged["translations"] = translations
+    return merged
+
+
+def build_merged_entry(word: str, by_lang: Dict[str, Dict[str, Any]], langs: Sequence[str]) -> Dict[str, Any]:
+    """merged_dictionary.json entry: shared fields plus a `translate` block for en and every language."""
+    merged = {key: _first_value(by_lang, key) for key in MERGED_BASE_FIELDS}
+    translate = {"en": {
+        "word": word,
+        "mean": _first_value(by_lang, "definition_en"),
+        "example": _first_value(by_lang, "example_en"),
+    }}
+    for lang in langs:
+        entry = by_lang.get(lang)
+        translate[lang] = {} if entry is None else {
+            "word": target_word(entry, lang) or word,
+            "mean": entry.get("definition_target"),
+            "example": entry.get("example_target"),
+        }
+    merged["translate"] = translate
+    return merged
+
+
+ENTRY_BUILDERS: Dict[str, Callable[[str, Dict[str, Dict[str, Any]], Sequence[str]], Dict[str, Any]]] = {
+    "multilingual": build_multilingual_entry,
+    "merged": build_merged_entry,
+}
+
+
+class StreamingDictionaryWriter:
+    """
+    Writes {"entries": <array or object>, "metadata": {...}} one entry at a time.
+    Output goes to a temporary file that replaces `path` only on a clean close.
+    In compact mode (indent=None) every entry sits on its own line, so a later run
+    can copy unchanged entries verbatim (see iter_entry_lines).
+    """
+
+    def __init__(self, path: Union[str, Path], keyed: bool, indent: Optional[int] = None):
+        self.path = Path(path)
+        self.keyed = keyed
+        self.indent = indent
+        self.count = 0
+        self.sha1 = hashlib.sha1()
+        self._tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self._f: Optional[TextIO] = None
+
+    def _write(self, text: str):
+        self._f.write(text)
+        self.sha1.update(text.encode("utf-8"))
+
+    def _dumps(self, value: Any, depth: int) -> str:
+        text = json.dumps(value, ensure_ascii=False, indent=self.indent)
+        if self.indent is None:
+            return text
+        return text.replace("\n", "\n" + " " * (self.indent * depth))
+
+    def _newline(self, depth: int) -> str:
+        return "\n" if self.indent is None else "\n" + " " * (self.indent * depth)
+
+    def __enter__(self) -> "StreamingDictionaryWriter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = open(self._tmp_path, "w", encoding="utf-8")
+        opening = "{" if self.keyed else "["
+        self._write("{" + ("" if self.indent is None else self._newline(1)) + '"entries": ' + opening)
+        return self
+
+    def write_raw(self, text: str):
+        """Append one already-serialized entry (including its key when keyed)."""
+        self._write(("," if self.count else "") + self._newline(2) + text)
+        self.count += 1
+
+    def write(self, entry: Dict[str, Any], key: Optional[str] = None):
+        prefix = (json.dumps(key, ensure_ascii=False) + ": ") if self.keyed else ""
+        self.write_raw(prefix + self._dumps(entry, 2))
+
+    def close(self, metadata: Dict[str, Any]):
+        closing = "}" if self.keyed else "]"
+        if self.indent is None:
+            self._write("\n" + closing + ', "metadata": ' + self._dumps(metadata, 1) + "}\n")
+        else:
+            self._write((self._newline(1) if self.count else "") + closing + "," + self._newline(1)
+                        + '"metadata": ' + self._dumps(metadata, 1) + self._newline(0) + "}\n")
+        self._f.close()
+        self._f = None
+        os.replace(self._tmp_path, self.path)
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._f is not None:  # close() was not reached: discard the partial file
+            self._f.close()
+            self._tmp_path.unlink(missing_ok=True)
+        return False
+
+
+def iter_entry_lines(path: Union[str, Path]) -> Iterator[str]:
+    """Serialized entries of a compact StreamingDictionaryWriter output, one per line, without separators."""
+    with open(path, "r", encoding="utf-8") as f:
+        header = f.readline()
+        if not header.startswith('{"entries": ') or header.rstrip("\n")[-1] not in "[{":
+            raise ValueError(f"{path} is not a compact merge output")
+        for line in f:
+            text = line.rstrip("\n")
+            if text.startswith(("]", "}")):
+                return
+            yield text[:-1] if text.endswith(",") else text
+
+
+def merge_metadata(langs: Sequence[str], total_entries: int) -> Dict[str, Any]:
+    return {
+        "title": f"Multilingual Dictionary (EN-{'-'.join(lang.upper() for lang in langs)})",
+        "source_language": "en",
+        "target_languages": list(langs),
+        "total_entries": total_entries,
+    }
+
+
+def merge_dictionaries(
+    sources: Sequence[LanguageSource],
+    output_path: Union[str, Path],
+    output_format: str = "multilingual",
+    indent: Optional[int] = None,
+    on_entry: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> MergeStats:
+    """Stream-merge `sources` into `output_path`. `on_entry(word, merged_entry)` sees every entry written."""
+    if output_format not in ENTRY_BUILDERS:
+        raise ValueError(f"Unknown merge format '{output_format}' (expected one of {', '.join(MERGE_FORMATS)})")
+    langs = [source.lang for source in sources]
+    if len(set(langs)) != len(langs):
+        raise ValueError(f"Duplicate target languages in merge inputs: {langs}")
+    build_entry = ENTRY_BUILDERS[output_format]
+    keyed = output_format == "merged"
+    stats = MergeStats(per_language={lang: 0 for lang in langs}, missing_words={lang: 0 for lang in langs})
+    started = time.perf_counter()
+
+    with StreamingDictionaryWriter(output_path, keyed=keyed, indent=indent) as writer:
+        for word, by_lang in merge_streams(sources):
+            merged = build_entry(word, by_lang, langs)
+            writer.write(merged, key=word if keyed else None)
+            if on_entry:
+                on_entry(word, merged)
+            for lang, entry in by_lang.items():
+                stats.per_language[lang] += 1
+                if not target_word(entry, lang):
+                    stats.missing_words[lang] += 1
+        stats.entries = writer.count
+        writer.close(merge_metadata(langs, stats.entries))
+        stats.output_sha1 = writer.sha1.hexdigest()
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream-merge sorted per-language dictionaries by headword")
+    parser.add_argument("inputs", nargs="+", help="<lang>=<path> or paths named dict_<lang>*.json / .jsonl")
+    parser.add_argument("--format", choices=MERGE_FORMATS, default="multilingual")
+    parser.add_argument("--output", type=str, default=None,
+                        help="Default: multilingual_dict.json or merged_dictionary.json depending on --format")
+    parser.add_argument("--indent", type=int, default=None, help="Pretty-print entries (default: compact)")
+    args = parser.parse_args()
+
+    sources = [parse_source(spec) for spec in args.inputs]
+    output = args.output or ("merged_dictionary.json" if args.format == "merged" else "multilingual_dict.json")
+    stats = merge_dictionaries(sources, output, args.format, args.indent)
+    per_lang = ", ".join(f"{lang}: {count:,}" for lang, count in stats.per_language.items())
+    print(f"Merged {stats.entries:,} headwords ({per_lang}) into {output} in {stats.seconds:.2f}s")
+    missing = {lang: count for lang, count in stats.missing_words.items() if count}
+    if missing:
+        print("Warning: entries without a translated word (no word_<lang> / word_target): "
+              + ", ".join(f"{lang}: {count:,}" for lang, count in missing.items()))
+
+
+if __name__ == "__main__":
+    main()
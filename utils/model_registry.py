@@ -0,0 +1,77 @@
+# dictionary_project/utils/model_registry.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Shared, lazily populated registry for heavy optional dependencies.
+
+Nothing here imports torch, sentence-transformers or faiss until a caller actually
+asks for a model or index, and each model is loaded at most once per process no
+matter how many modules (builder, quality_scorer, ...) request it.
+"""
+
+import importlib
+import importlib.util
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_models: Dict[str, Any] = {}
+_failed: Dict[str, str] = {}
+
+
+def is_available(module_name: str) -> bool:
+    """Check whether a module is installed without importing it."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def get_module(module_name: str) -> Optional[Any]:
+    """Import a module on first use; returns None (and logs once) if it is missing."""
+    key = f"module:{module_name}"
+    with _lock:
+        if key in _models:
+            return _models[key]
+        if key in _failed:
+            return None
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            _failed[key] = str(e)
+            logger.warning(f"Optional dependency '{module_name}' is not available: {e}")
+            return None
+        _models[key] = module
+        return module
+
+
+def get_sentence_transformer(model_name: str = "all-MiniLM-L6-v2") -> Optional[Any]:
+    """Return a shared SentenceTransformer instance, loading it on first request."""
+    key = f"sentence_transformer:{model_name}"
+    with _lock:
+        if key in _models:
+            return _models[key]
+        if key in _failed:
+            return None
+    module = get_module("sentence_transformers")
+    if module is None:
+        return None
+    with _lock:
+        if key not in _models and key not in _failed:
+            try:
+                logger.info(f"Loading embedding model: {model_name}")
+                _models[key] = module.SentenceTransformer(model_name)
+            except Exception as e:
+                _failed[key] = str(e)
+                logger.error(f"Failed to load sentence-transformer model '{model_name}': {e}")
+        return _models.get(key)
+
+
+def loaded_models() -> Dict[str, Any]:
+    """Snapshot of everything loaded so far (for diagnostics)."""
+    with _lock:
+        return dict(_models)
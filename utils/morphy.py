@@ -0,0 +1,113 @@
+# dictionary_project/utils/morphy.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+WordNet morphy: map inflected English forms to their base forms.
+
+Two sources, tried in WordNet's order for every part of speech:
+  1. the exception lists (`noun.exc`, `verb.exc`, `adj.exc`, `adv.exc`), e.g.
+     geese -> goose, abode -> abide,
+  2. the detachment rules (`-ies` -> `-y`, `-ches` -> `-ch`, `-ed` -> `-e`, ...).
+
+Rule output is only a guess ("aahs" -> "aah", but also "bus" -> "bu"), so callers
+pass `is_known`, which accepts a candidate only if it is a real headword or lemma.
+
+Usage:
+  python -m utils.morphy geese aahed abode happier
+"""
+
+import argparse
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.lexicon import WORDNET_DICT_DIR, normalize_lemma
+
+MORPHY_POS = ("noun", "verb", "adj", "adv")
+
+# WordNet 3.0 morph.c detachment rules: (suffix, replacement) per part of speech.
+DETACHMENT_RULES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "noun": (("s", ""), ("ses", "s"), ("xes", "x"), ("zes", "z"), ("ches", "ch"), ("shes", "sh"),
+             ("men", "man"), ("ies", "y")),
+    "verb": (("s", ""), ("ies", "y"), ("es", "e"), ("es", ""), ("ed", "e"), ("ed", ""), ("ing", "e"),
+             ("ing", "")),
+    "adj": (("er", ""), ("est", ""), ("er", "e"), ("est", "e")),
+    "adv": (),
+}
+
+
+def load_exceptions(dict_dir: Path = WORDNET_DICT_DIR) -> Dict[str, Dict[str, List[str]]]:
+    """{pos: {inflected form: [base forms]}} from the WordNet *.exc files (missing files are skipped)."""
+    exceptions: Dict[str, Dict[str, List[str]]] = {}
+    for pos in MORPHY_POS:
+        table: Dict[str, List[str]] = {}
+        path = Path(dict_dir) / f"{pos}.exc"
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) >= 2:
+                        table[normalize_lemma(parts[0])] = [normalize_lemma(p) for p in parts[1:]]
+        exceptions[pos] = table
+    return exceptions
+
+
+class Morphy:
+    """Exception-list + rule-based lemmatizer."""
+
+    def __init__(self, exceptions: Dict[str, Dict[str, List[str]]]):
+        self.exceptions = exceptions
+
+    def candidates(self, word: str, pos: Optional[str] = None) -> List[Tuple[str, str]]:
+        """(base form, pos) guesses for `word`, exceptions first; `word` itself is never included."""
+        word = normalize_lemma(word)
+        found: List[Tuple[str, str]] = []
+        for p in ([pos] if pos else MORPHY_POS):
+            for base in self.exceptions.get(p, {}).get(word, ()):
+                if base != word and (base, p) not in found:
+                    found.append((base, p))
+        for p in ([pos] if pos else MORPHY_POS):
+            for suffix, replacement in DETACHMENT_RULES.get(p, ()):
+                if word.endswith(suffix) and len(word) > len(suffix):
+                    base = word[: len(word) - len(suffix)] + replacement
+                    if base != word and (base, p) not in found:
+                        found.append((base, p))
+        return found
+
+    def lemmas(self, word: str, is_known: Callable[[str], bool], pos: Optional[str] = None) -> List[str]:
+        """Base forms of `word` accepted by `is_known`, best first."""
+        result: List[str] = []
+        for base, _ in self.candidates(word, pos):
+            if base not in result and is_known(base):
+                result.append(base)
+        return result
+
+    def lemmatize(self, word: str, is_known: Callable[[str], bool], pos: Optional[str] = None) -> Optional[str]:
+        """The best known base form of `word`, or None if `word` does not look inflected."""
+        found = self.lemmas(word, is_known, pos)
+        return found[0] if found else None
+
+
+@lru_cache(maxsize=None)
+def get_morphy(dict_dir: Path = WORDNET_DICT_DIR) -> Morphy:
+    return Morphy(load_exceptions(dict_dir))
+
+
+def main():
+    from utils.frequency import FrequencyPrior
+
+    parser = argparse.ArgumentParser(description="Show WordNet base forms of English words")
+    parser.add_argument("words", nargs="+")
+    args = parser.parse_args()
+
+    morphy = get_morphy()
+    prior = FrequencyPrior.load()
+    for word in args.words:
+        lemma = morphy.lemmatize(word, lambda w: prior.count(w) is not None)
+        guesses = ", ".join(f"{base} ({pos})" for base, pos in morphy.candidates(word)) or "-"
+        print(f"{word}\t{lemma or '-'}\tcandidates: {guesses}")
+
+
+if __name__ == "__main__":
+    main()
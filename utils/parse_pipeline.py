@@ -0,0 +1,236 @@
+# dictionary_project/utils/parse_pipeline.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Concurrent hydration of raw per-language records into *Features models.
+
+Input is a stream of per-language records, grouped by entry (consecutive records
+sharing the same entry key belong to one entry):
+
+  {"word_en": "table", "lang": "de", "word": "Tisch", "source": "omw_v1", ...}
+  {"word_en": "table", "lang": "ja", "word": "テーブル", "source": "omw_v1", ...}
+
+Stages are connected by bounded queues:
+  group  -> parse (N workers; all languages of an entry via asyncio.gather) -> output
+so reading, parsing and consuming overlap while memory stays bounded.
+
+Usage:
+  python -m utils.parse_pipeline raw_records.jsonl --workers 16 --output parsed.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from lang_plugins import get_parser, get_raw_model
+from schemas.base import BaseFeatures
+from utils.helpers import flush_parser_log
+
+RawRecords = Union[Iterable[Dict[str, Any]], AsyncIterator[Dict[str, Any]]]
+
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    name: str
+    items: int = 0
+    busy_seconds: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self.items / self.busy_seconds if self.busy_seconds else 0.0
+
+
+@dataclass
+class PipelineStats:
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: Optional[float] = None
+
+    def stage(self, name: str) -> StageStats:
+        return self.stages.setdefault(name, StageStats(name))
+
+    def report(self) -> str:
+        wall = (self.finished_at or time.perf_counter()) - self.started_at
+        lines = [f"Pipeline wall time: {wall:.2f}s"]
+        for s in self.stages.values():
+            overall = s.items / wall if wall else 0.0
+            lines.append(f"  {s.name:<8} {s.items:>9,} items  busy {s.busy_seconds:8.2f}s  "
+                         f"{s.rate:>10,.0f}/s busy  {overall:>10,.0f}/s wall")
+        return "\n".join(lines)
+
+
+@dataclass
+class ParsedEntry:
+    key: Any
+    features: Dict[str, BaseFeatures]
+    errors: Dict[str, str]
+
+
+async def parse_entry_languages(raw_by_lang: Dict[str, Union[dict, BaseModel]]) -> Tuple[Dict[str, BaseFeatures], Dict[str, str]]:
+    """Parse all languages of one entry concurrently. Returns (features, errors) keyed by language."""
+    langs, coros = [], []
+    errors: Dict[str, str] = {}
+    for lang, raw in raw_by_lang.items():
+        try:
+            raw_model = raw if isinstance(raw, BaseModel) else get_raw_model(lang)(**raw)
+            coros.append(get_parser(lang)(raw_model))
+            langs.append(lang)
+        except Exception as e:
+            errors[lang] = f"{type(e).__name__}: {e}"
+    features: Dict[str, BaseFeatures] = {}
+    for lang, result in zip(langs, await asyncio.gather(*coros, return_exceptions=True)):
+        if isinstance(result, Exception):
+            errors[lang] = f"{type(result).__name__}: {result}"
+        else:
+            features[lang] = result
+    return features, errors
+
+
+async def _aiter(records: RawRecords) -> AsyncIterator[Dict[str, Any]]:
+    if hasattr(records, "__aiter__"):
+        async for record in records:
+            yield record
+    else:
+        for i, record in enumerate(records):
+            yield record
+            if i % 256 == 255:
+                await asyncio.sleep(0)  # let the parse workers run while a sync source is read
+
+
+async def run_parse_pipeline(
+    records: RawRecords,
+    workers: int = 8,
+    queue_size: int = 256,
+    entry_key: str = "word_en",
+    lang_key: str = "lang",
+    ordered: bool = True,
+    stats: Optional[PipelineStats] = None,
+) -> AsyncIterator[ParsedEntry]:
+    """
+    Hydrate a stream of raw per-language records, yielding one ParsedEntry per entry.
+    Pass a PipelineStats to collect per-stage throughput.
+    """
+    stats = stats if stats is not None else PipelineStats()
+    group_stats, parse_stats, output_stats = stats.stage("group"), stats.stage("parse"), stats.stage("output")
+    grouped: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    parsed: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    async def group_stage():
+        seq, current_key, current = 0, None, {}
+        try:
+            async for record in _aiter(records):
+                started = time.perf_counter()
+                key, lang = record.get(entry_key), record[lang_key]
+                raw = {k: v for k, v in record.items() if k not in (entry_key, lang_key)}
+                group_stats.busy_seconds += time.perf_counter() - started
+                if current and key != current_key:
+                    await grouped.put((seq, current_key, current))
+                    group_stats.items += 1
+                    seq, current = seq + 1, {}
+                current_key = key
+                current[lang] = raw
+            if current:
+                await grouped.put((seq, current_key, current))
+                group_stats.items += 1
+        finally:
+            # Always release the workers, even if the source raised.
+            for _ in range(workers):
+                await grouped.put(_DONE)
+
+    async def parse_worker():
+        try:
+            while True:
+                item = await grouped.get()
+                if item is _DONE:
+                    return
+                seq, key, raw_by_lang = item
+                started = time.perf_counter()
+                features, errors = await parse_entry_languages(raw_by_lang)
+                parse_stats.busy_seconds += time.perf_counter() - started
+                parse_stats.items += 1
+                await parsed.put((seq, ParsedEntry(key, features, errors)))
+        finally:
+            await parsed.put(_DONE)
+
+    tasks = [asyncio.create_task(group_stage())] + [asyncio.create_task(parse_worker()) for _ in range(workers)]
+    pending: Dict[int, ParsedEntry] = {}
+    next_seq, finished = 0, 0
+    try:
+        while finished < workers:
+            item = await parsed.get()
+            if item is _DONE:
+                finished += 1
+                continue
+            seq, entry = item
+            if not ordered:
+                output_stats.items += 1
+                yield entry
+                continue
+            pending[seq] = entry
+            while next_seq in pending:
+                output_stats.items += 1
+                yield pending.pop(next_seq)
+                next_seq += 1
+        for seq in sorted(pending):  # only reachable if a worker died mid-stream
+            output_stats.items += 1
+            yield pending.pop(seq)
+        for task in tasks:
+            if task.done() and not task.cancelled() and task.exception():
+                raise task.exception()
+    finally:
+        for task in tasks:
+            task.cancel()
+        flush_parser_log()
+        stats.finished_at = time.perf_counter()
+
+
+def _features_to_json(features: BaseFeatures) -> Dict[str, Any]:
+    return json.loads(json.dumps(features.dict(), ensure_ascii=False, default=str))
+
+
+async def _main_async(args):
+    from utils.json_stream import iter_json_records
+
+    stats = PipelineStats()
+    out = open(args.output, "w", encoding="utf-8") if args.output else None
+    failed = 0
+    try:
+        async for entry in run_parse_pipeline(
+            iter_json_records(args.records), workers=args.workers, queue_size=args.queue_size,
+            entry_key=args.entry_key, ordered=not args.unordered, stats=stats,
+        ):
+            failed += bool(entry.errors)
+            if out:
+                out.write(json.dumps({
+                    "key": entry.key,
+                    "translations": {lang: _features_to_json(f) for lang, f in entry.features.items()},
+                    "errors": entry.errors,
+                }, ensure_ascii=False) + "\n")
+    finally:
+        if out:
+            out.close()
+    print(stats.report())
+    print(f"Entries with parse errors: {failed:,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hydrate raw per-language records concurrently")
+    parser.add_argument("records", type=str, help="JSONL / JSON array of per-language raw records")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--queue-size", type=int, default=256)
+    parser.add_argument("--entry-key", type=str, default="word_en")
+    parser.add_argument("--unordered", action="store_true")
+    parser.add_argument("--output", type=str, default=None, help="Write parsed entries as JSONL")
+    asyncio.run(_main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
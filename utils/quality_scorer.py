@@ -3,87 +3,202 @@
 # Licensed under the MIT License. See LICENSE file in the project root for details.
 
 from schemas.base import DictionaryRoot
-from typing import Dict
-from sentence_transformers import SentenceTransformer, util
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from pathlib import Path
+from utils.bleu_validator import bleu_scores
+from utils.model_registry import get_sentence_transformer
+from utils.lexicon import get_lexicon
+import numpy as np
+import hashlib
 import logging
 
 logger = logging.getLogger(__name__)
 
-# ✅ 1. 임베딩 모델 로드 (프로그램 시작 시 한 번만 로드)
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+DEFAULT_ENCODE_BATCH_SIZE = 256
+# all-MiniLM-L6-v2 벡터(384차원 float32)는 약 1.5KB이므로 기본 상한은 약 75MB입니다.
+DEFAULT_EMBEDDING_CACHE_SIZE = 50_000
+
+# (translated texts, lang) -> English back-translations, in the same order.
+BackTranslator = Callable[[List[str], str], Awaitable[List[str]]]
+
+# ✅ 1. 임베딩 모델은 처음 사용할 때 공유 레지스트리에서 한 번만 로드합니다.
 # 전 세계적으로 널리 사용되는 경량 모델을 사용합니다.
-try:
-    embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
-except Exception as e:
-    logger.error(f"Failed to load sentence-transformer model. Please install it: pip install sentence-transformers. Error: {e}")
-    embedding_model = None
+def get_embedding_model():
+    return get_sentence_transformer(EMBEDDING_MODEL_NAME)
 
-async def _calculate_back_translation_score(original_text: str, translated_text: str) -> Dict[str, float]:
+def __getattr__(name: str):
+    # 하위 호환: `quality_scorer.embedding_model` 접근 시 지연 로드합니다.
+    if name == "embedding_model":
+        return get_embedding_model()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+class EmbeddingCache:
+    """
+    Content-hash keyed store of normalized embeddings.
+    Texts already seen (in this run or a previously saved cache file) are not re-encoded
+    while they are among the `max_entries` most recently used (None = unbounded).
+    """
+
+    def __init__(self, model_name: str = EMBEDDING_MODEL_NAME, max_entries: Optional[int] = DEFAULT_EMBEDDING_CACHE_SIZE):
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self._vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    def key(self, text: str) -> str:
+        return hashlib.sha1(f"{self.model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def _store(self, items: Iterable[Tuple[str, np.ndarray]]):
+        self._vectors.update(items)
+        if self.max_entries is not None:
+            while len(self._vectors) > self.max_entries:
+                self._vectors.popitem(last=False)
+
+    def encode(self, texts: Sequence[str], batch_size: int = DEFAULT_ENCODE_BATCH_SIZE) -> np.ndarray:
+        """Return an (n, dim) matrix of unit vectors, encoding only texts missing from the cache."""
+        keys = [self.key(t) for t in texts]
+        found: Dict[str, np.ndarray] = {}
+        missing: Dict[str, str] = {}
+        for k, t in zip(keys, texts):
+            if k in found or k in missing:
+                continue
+            vector = self._vectors.get(k)
+            if vector is None:
+                missing[k] = t
+            else:
+                self._vectors.move_to_end(k)
+                found[k] = vector
+        if missing:
+            vectors = get_embedding_model().encode(
+                list(missing.values()), batch_size=batch_size,
+                convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False,
+            )
+            encoded = dict(zip(missing.keys(), vectors.astype(np.float32)))
+            found.update(encoded)
+            self._store(encoded.items())
+        return np.stack([found[k] for k in keys]) if keys else np.empty((0, 0), dtype=np.float32)
+
+    def save(self, path: str | Path):
+        keys = list(self._vectors)
+        vectors = np.stack([self._vectors[k] for k in keys]) if keys else np.empty((0, 0), dtype=np.float32)
+        np.savez(path, keys=np.array(keys), vectors=vectors, model=np.array(self.model_name))
+
+    def load(self, path: str | Path):
+        path = Path(path)
+        if not path.exists():
+            return
+        with np.load(path) as data:
+            if str(data["model"]) != self.model_name:
+                logger.warning(f"Ignoring embedding cache {path}: built with {data['model']}")
+                return
+            self._store(zip(data["keys"].tolist(), data["vectors"]))
+
+embedding_cache = EmbeddingCache()
+
+async def _back_translation_scores(
+    pairs: Sequence[Tuple[str, str, str]],
+    back_translate: Optional[BackTranslator],
+    cache: EmbeddingCache,
+    batch_size: int = DEFAULT_ENCODE_BATCH_SIZE,
+) -> List[Dict[str, Optional[float]]]:
+    """
+    (lang, original, translated) 쌍마다 역번역을 수행하고 원문과의 임베딩 유사도와 BLEU 점수를 계산합니다.
+    역번역기가 없으면 점수를 꾸며내지 않고 None으로 둡니다.
+    """
+    if back_translate is None:
+        return [{"embedding_similarity": None, "bleu_score": None} for _ in pairs]
+    # 언어별로 한 번씩 역번역기를 호출합니다.
+    rows_by_lang: Dict[str, List[int]] = {}
+    for row, (lang, _, _) in enumerate(pairs):
+        rows_by_lang.setdefault(lang, []).append(row)
+    back_translated = [""] * len(pairs)
+    for lang, rows in rows_by_lang.items():
+        for row, text in zip(rows, await back_translate([pairs[row][2] for row in rows], lang)):
+            back_translated[row] = text
+    originals = [original for _, original, _ in pairs]
+
+    bleu = bleu_scores(list(zip(back_translated, originals)), "en") if pairs else np.zeros(0)
+    similarities = np.zeros(len(pairs), dtype=np.float32)
+    if pairs and get_embedding_model():
+        try:
+            similarities = np.einsum("ij,ij->i", cache.encode(originals, batch_size), cache.encode(back_translated, batch_size))
+        except Exception as e:
+            logger.error(f"Error calculating embedding similarity: {e}")
+    return [
+        {"embedding_similarity": round(float(similarity), 4), "bleu_score": round(float(score), 4)}
+        for similarity, score in zip(similarities, bleu)
+    ]
+
+async def _calculate_back_translation_score(
+    original_text: str, translated_text: str, lang: str = "", back_translate: Optional[BackTranslator] = None,
+) -> Dict[str, Optional[float]]:
     """
     역번역을 수행하고 원본과의 임베딩 유사도 점수를 계산합니다.
     """
-    if not embedding_model:
-        return {"embedding_similarity": 0.0, "bleu_score": 0.0}
-        
-    # TODO: 이 부분에 실제 역번역을 수행하는 API나 모델 호출 로직이 필요합니다.
-    # 예: back_translated_text = await translate_api(translated_text, target_lang="en")
-    # 지금은 테스트를 위해 번역된 텍스트를 그대로 사용합니다.
-    back_translated_text = translated_text 
-    
-    # ✅ 2. 실제 임베딩 및 코사인 유사도 계산
-    try:
-        original_embedding = embedding_model.encode(original_text, convert_to_tensor=True)
-        back_translated_embedding = embedding_model.encode(back_translated_text, convert_to_tensor=True)
-        
-        cosine_scores = util.cos_sim(original_embedding, back_translated_embedding)
-        embedding_sim = round(cosine_scores.item(), 4)
-    except Exception as e:
-        logger.error(f"Error calculating embedding similarity: {e}")
-        embedding_sim = 0.0
-    
-    # TODO: BLEU 점수 계산 로직 추가
-    bleu_score = 0.0 # 임시값
-
-    return {"embedding_similarity": embedding_sim, "bleu_score": bleu_score}
+    return (await _back_translation_scores([(lang, original_text, translated_text)], back_translate, embedding_cache))[0]
 
 async def _perform_cross_check(word: str, lang: str) -> bool:
     """
-    Wiktionary 등 외부 사전에 해당 단어가 존재하는지 확인합니다.
+    offline_resources에서 미리 빌드한 어휘 목록(utils.lexicon)에 해당 단어가 있는지 확인합니다.
+    해당 언어의 어휘 목록이 없으면 검증할 수 없으므로 True를 반환합니다.
     """
-    # TODO: 이 부분에 offline_resources에 있는 Wiktionary 등
-    # 대조용 사전 데이터를 조회하는 실제 로직이 필요합니다.
-    # 예: return word in wiktionary_set_for_lang
-    
-    return True # 임시로 항상 True 반환
-
-async def calculate_quality_scores(entry: DictionaryRoot) -> Dict[str, Dict[str, float | bool]]:
-    quality_scores = {}
-    
+    lexicon = get_lexicon(lang)
+    if lexicon is None:
+        return True
+    return word in lexicon
+
+def _collect_example_pairs(entry: DictionaryRoot) -> List[Tuple[str, str, str, str]]:
+    """(lang, original, translated, word_target) for the first sense of an entry."""
     if not entry.senses:
-        return {}
-        
+        return []
     first_sense = entry.senses[0]
     english_example = first_sense.examples_en[0] if first_sense.examples_en else entry.word_en
-
+    pairs = []
     for lang, features in first_sense.translations.items():
         if not features.examples:
             continue
-            
-        translated_example = features.examples[0].value
-
-        # 1. 역번역 점수 계산
-        back_trans_scores = await _calculate_back_translation_score(english_example, translated_example)
-        
-        # 2. 교차 검증 수행
-        cross_check_found = await _perform_cross_check(features.word_target.value, lang)
-
-        # 3. 최종 점수 계산
-        final_score = round(0.8 * back_trans_scores["embedding_similarity"] + 0.2 * back_trans_scores["bleu_score"], 4)
-        
-        quality_scores[lang] = {
-            "embedding_similarity": back_trans_scores["embedding_similarity"],
-            "bleu_score": back_trans_scores["bleu_score"],
-            "final_score": final_score,
-            "cross_check_found": cross_check_found
-        }
-        
-    return quality_scores
\ No newline at end of file
+        pairs.append((lang, english_example, features.examples[0].value, features.word_target.value))
+    return pairs
+
+async def calculate_quality_scores_batch(
+    entries: Sequence[DictionaryRoot],
+    batch_size: int = DEFAULT_ENCODE_BATCH_SIZE,
+    cache: Optional[EmbeddingCache] = None,
+    back_translate: Optional[BackTranslator] = None,
+) -> List[Dict[str, Dict[str, Optional[float | bool]]]]:
+    """
+    Bulk form of calculate_quality_scores.
+    Every example across entries and languages is back-translated (one call per language),
+    encoded in large batches through the content-hash cache, and scored against its English
+    original in one pass. Without `back_translate`, the similarity, BLEU and final scores are None.
+    """
+    cache = cache or embedding_cache
+    per_entry = [_collect_example_pairs(entry) for entry in entries]
+    flat = [(lang, original, translated) for pairs in per_entry for lang, original, translated, _ in pairs]
+    scores = iter(await _back_translation_scores(flat, back_translate, cache, batch_size))
+
+    results: List[Dict[str, Dict[str, Optional[float | bool]]]] = []
+    for pairs in per_entry:
+        quality_scores = {}
+        for lang, _, _, word_target in pairs:
+            back_trans_scores = next(scores)
+            embedding_sim, bleu_score = back_trans_scores["embedding_similarity"], back_trans_scores["bleu_score"]
+            cross_check_found = await _perform_cross_check(word_target, lang)
+            final_score = None if embedding_sim is None else round(0.8 * embedding_sim + 0.2 * bleu_score, 4)
+            quality_scores[lang] = {
+                "embedding_similarity": embedding_sim,
+                "bleu_score": bleu_score,
+                "final_score": final_score,
+                "cross_check_found": cross_check_found
+            }
+        results.append(quality_scores)
+    return results
+
+async def calculate_quality_scores(
+    entry: DictionaryRoot, back_translate: Optional[BackTranslator] = None,
+) -> Dict[str, Dict[str, Optional[float | bool]]]:
+    return (await calculate_quality_scores_batch([entry], back_translate=back_translate))[0]
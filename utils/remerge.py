@@ -0,0 +1,287 @@
+# dictionary_project/utils/remerge.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Incremental re-merge of per-language dictionaries.
+
+A manifest remembers, for every input language, the file hash and a content hash
+per entry, plus the hash of every merged output it produced. On the next run:
+  - inputs whose file hash is unchanged are not re-hashed,
+  - a headword is rebuilt only if one of its per-language hashes changed (or a
+    language gained / lost it); unchanged entries are copied verbatim from the
+    previous compact output,
+  - each output gets a change-set file (<output>.changes.json) with the upserted
+    entries and deleted headwords, tied to the output hashes before and after,
+    so web bundles and search indexes can patch themselves instead of reloading.
+An output that is missing, was edited by hand, or is pretty-printed is rebuilt in
+full; its change-set is still computed against the manifest. When the language
+list itself changed, every entry is different, so the change-set is marked
+`"full": true` and lists every entry as an upsert.
+
+Usage:
+  python -m utils.remerge "ver 0.01/dict_ja.json" "ver 0.01/dict_ko.json" "ver 0.01/dict_de.json" \\
+      --target multilingual=multilingual_dict.json --target merged=merged_dictionary.json
+"""
+
+import argparse
+import json
+import os
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from utils.hashing import entry_hash, file_sha1
+from utils.merge_engine import (
+    ENTRY_BUILDERS,
+    MERGE_FORMATS,
+    LanguageSource,
+    StreamingDictionaryWriter,
+    iter_entry_lines,
+    merge_metadata,
+    merge_streams,
+    parse_source,
+)
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST_PATH = Path("merge_manifest.json")
+
+EntryHashes = Dict[str, str]  # lang -> content hash of that language's record
+
+
+def changes_path_for(output: Union[str, Path]) -> Path:
+    output = Path(output)
+    return output.with_name(output.stem + ".changes.json")
+
+
+def load_manifest(path: Union[str, Path]) -> Dict[str, Any]:
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    return manifest if manifest.get("version") == MANIFEST_VERSION else {}
+
+
+@dataclass
+class MergeTarget:
+    output_format: str
+    path: Path
+
+
+@dataclass
+class TargetReport:
+    path: Path
+    incremental: bool
+    entries: int = 0
+    rebuilt: int = 0
+    copied: int = 0
+    deleted: int = 0
+    output_sha1: str = ""
+
+
+@dataclass
+class RemergeReport:
+    changed_languages: List[str] = field(default_factory=list)
+    changed_words: int = 0
+    targets: List[TargetReport] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+class _TargetState:
+    """Per-output writer, previous-line cursor and change-set for one re-merge pass."""
+
+    def __init__(self, target: MergeTarget, langs: Sequence[str], previous: Optional[Dict[str, Any]], incremental: bool,
+                 full: bool = False):
+        self.target = target
+        self.langs = langs
+        # A different language list changes every entry (and the metadata), so the change-set carries them all.
+        self.full = full
+        self.build_entry = ENTRY_BUILDERS[target.output_format]
+        self.keyed = target.output_format == "merged"
+        self.base_sha1 = previous.get("sha1") if previous else None
+        self.report = TargetReport(target.path, incremental)
+        self.upserts: Dict[str, Any] = {}
+        self.deletes: List[str] = []
+        # Only valid when incremental: the previous output's lines, in the same (sorted) word order.
+        self._old_lines: Optional[Iterator[str]] = iter_entry_lines(target.path) if incremental else None
+        self.writer = StreamingDictionaryWriter(target.path, keyed=self.keyed)
+
+    def skip_old(self):
+        if self._old_lines is not None:
+            next(self._old_lines)
+
+    def emit(self, word: str, by_lang: Dict[str, Dict[str, Any]], changed: bool, had_old: bool):
+        old_line = next(self._old_lines) if (self._old_lines is not None and had_old) else None
+        if changed or old_line is None:
+            merged = self.build_entry(word, by_lang, self.langs)
+            self.writer.write(merged, key=word if self.keyed else None)
+            self.report.rebuilt += 1
+            if changed or self.full:
+                self.upserts[word] = merged
+        else:
+            self.writer.write_raw(old_line)
+            self.report.copied += 1
+
+    def delete(self, word: str):
+        self.deletes.append(word)
+        self.report.deleted += 1
+
+    def finish(self, generated_at: str):
+        self.report.entries = self.writer.count
+        metadata = merge_metadata(self.langs, self.report.entries)
+        self.writer.close(metadata)
+        self.report.output_sha1 = self.writer.sha1.hexdigest()
+        change_set = {
+            "version": MANIFEST_VERSION,
+            "generated_at": generated_at,
+            "format": self.target.output_format,
+            "output": str(self.target.path),
+            "base_sha1": self.base_sha1,
+            "output_sha1": self.report.output_sha1,
+            "full": self.full,
+            "upserts": self.upserts,
+            "deletes": self.deletes,
+            "metadata": metadata,
+        }
+        with open(changes_path_for(self.target.path), "w", encoding="utf-8") as f:
+            json.dump(change_set, f, ensure_ascii=False)
+
+
+def _can_patch(target: MergeTarget, previous: Optional[Dict[str, Any]], same_langs: bool) -> bool:
+    return (
+        same_langs
+        and previous is not None
+        and previous.get("format") == target.output_format
+        and previous.get("compact", False)
+        and target.path.exists()
+        and file_sha1(target.path) == previous.get("sha1")
+    )
+
+
+def remerge(
+    sources: Sequence[LanguageSource],
+    targets: Sequence[MergeTarget],
+    manifest_path: Union[str, Path] = DEFAULT_MANIFEST_PATH,
+) -> RemergeReport:
+    """Bring every target up to date with `sources`, rebuilding only entries whose content changed."""
+    started = time.perf_counter()
+    langs = [source.lang for source in sources]
+    if len(set(langs)) != len(langs):
+        raise ValueError(f"Duplicate target languages in merge inputs: {langs}")
+    for target in targets:
+        if target.output_format not in ENTRY_BUILDERS:
+            raise ValueError(f"Unknown merge format '{target.output_format}'")
+
+    manifest = load_manifest(manifest_path)
+    old_entries: Dict[str, EntryHashes] = manifest.get("entries", {})
+    old_sources: Dict[str, Dict[str, str]] = manifest.get("sources", {})
+    old_outputs: Dict[str, Dict[str, Any]] = manifest.get("outputs", {})
+    same_langs = manifest.get("langs") == langs
+
+    source_hashes = {source.lang: file_sha1(source.path) for source in sources}
+    # 파일 해시가 같은 언어는 항목별 해시를 다시 계산하지 않고 매니페스트 값을 재사용합니다.
+    unchanged_langs = {lang for lang in langs if old_sources.get(lang, {}).get("sha1") == source_hashes[lang]}
+    report = RemergeReport(changed_languages=[lang for lang in langs if lang not in unchanged_langs]
+                           + sorted(set(old_sources) - set(langs)))
+
+    old_words = sorted(old_entries)
+    states = []
+    for target in targets:
+        previous = old_outputs.get(str(target.path))
+        states.append(_TargetState(target, langs, previous, _can_patch(target, previous, same_langs),
+                                   full=not same_langs))
+
+    new_entries: Dict[str, EntryHashes] = {}
+    old_index = 0
+    with ExitStack() as stack:
+        for state in states:
+            stack.enter_context(state.writer)
+        for word, by_lang in merge_streams(sources):
+            while old_index < len(old_words) and old_words[old_index] < word:
+                for state in states:
+                    state.skip_old()
+                    state.delete(old_words[old_index])
+                report.changed_words += 1
+                old_index += 1
+            had_old = old_index < len(old_words) and old_words[old_index] == word
+            old_hashes = old_entries.get(word, {}) if had_old else {}
+            if had_old:
+                old_index += 1
+
+            hashes = {
+                lang: old_hashes[lang] if lang in unchanged_langs and lang in old_hashes else entry_hash(record)
+                for lang, record in by_lang.items()
+            }
+            new_entries[word] = hashes
+            changed = hashes != old_hashes
+            report.changed_words += changed
+            for state in states:
+                state.emit(word, by_lang, changed, had_old)
+
+        for word in old_words[old_index:]:
+            for state in states:
+                state.skip_old()
+                state.delete(word)
+            report.changed_words += 1
+
+        generated_at = datetime.now().isoformat()
+        for state in states:
+            state.finish(generated_at)
+
+    # Outputs not refreshed in this run no longer line up with the new entry hashes, so they are dropped.
+    outputs = {}
+    for state in states:
+        outputs[str(state.target.path)] = {
+            "format": state.target.output_format,
+            "sha1": state.report.output_sha1,
+            "compact": True,
+            "entries": state.report.entries,
+        }
+        report.targets.append(state.report)
+
+    tmp_manifest = Path(str(manifest_path) + ".tmp")
+    with open(tmp_manifest, "w", encoding="utf-8") as f:
+        json.dump({
+            "version": MANIFEST_VERSION,
+            "langs": langs,
+            "sources": {source.lang: {"path": str(source.path), "sha1": source_hashes[source.lang]} for source in sources},
+            "outputs": outputs,
+            "entries": new_entries,
+        }, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_manifest, manifest_path)
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def parse_target(spec: str) -> MergeTarget:
+    output_format, sep, path = spec.partition("=")
+    if not sep or output_format not in MERGE_FORMATS:
+        raise ValueError(f"Target must be <format>=<path> with format in {MERGE_FORMATS}: '{spec}'")
+    return MergeTarget(output_format, Path(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally re-merge per-language dictionaries")
+    parser.add_argument("inputs", nargs="+", help="<lang>=<path> or paths named dict_<lang>*.json / .jsonl")
+    parser.add_argument("--target", action="append", default=None,
+                        help="<format>=<path>, repeatable (default: multilingual=multilingual_dict.json)")
+    parser.add_argument("--manifest", type=str, default=str(DEFAULT_MANIFEST_PATH))
+    args = parser.parse_args()
+
+    sources = [parse_source(spec) for spec in args.inputs]
+    targets = [parse_target(spec) for spec in (args.target or ["multilingual=multilingual_dict.json"])]
+    report = remerge(sources, targets, args.manifest)
+    changed = ", ".join(report.changed_languages) or "none"
+    print(f"Changed inputs: {changed}; {report.changed_words:,} headwords changed ({report.seconds:.2f}s)")
+    for t in report.targets:
+        mode = "patched" if t.incremental else "full rebuild"
+        print(f"  {t.path}: {mode}, {t.entries:,} entries ({t.rebuilt:,} rebuilt, {t.copied:,} copied, "
+              f"{t.deleted:,} deleted) -> {changes_path_for(t.path)}")
+
+
+if __name__ == "__main__":
+    main()
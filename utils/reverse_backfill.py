@@ -0,0 +1,304 @@
+# dictionary_project/utils/reverse_backfill.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Concurrent, rate-limited reverse-translation backfill (`word_reverse`).
+
+For every record that lacks the field, the English headword is sent to an LLM
+backend and the single target-language word it returns is stored. Requests run
+concurrently behind a token-bucket limiter; transient failures (model loading,
+429, 5xx, timeouts) are retried with exponential backoff. Finished translations
+are checkpointed periodically, so an interrupted run resumes where it stopped.
+JSON output keeps the input document as it was (container key, metadata, progress
+counters and member order); only the field is added to each record. `.jsonl` output
+writes the records alone.
+
+Backends:
+  ollama  the builder's Ollama /api/generate endpoint (--host/--port/--model)
+  hf      Hugging Face Inference API (--model, token from $HF_API_TOKEN)
+
+Usage:
+  python -m utils.reverse_backfill completed_20250905_133657_comprehensive_dict_progress.json out.json --lang ja
+  python -m utils.reverse_backfill dict_ko.json dict_ko_rev.json --lang ko --concurrency 16 --rate 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+import requests
+
+from utils.json_stream import iter_json_items, write_json_like
+
+DEFAULT_FIELD = "word_reverse"
+DEFAULT_CHECKPOINT_EVERY = 200
+DEFAULT_HF_MODEL = "meta-llama/Meta-Llama-3-8B-Instruct"
+
+LANGUAGE_NAMES = {
+    "ko": "Korean", "ja": "Japanese", "de": "German", "hr": "Croatian", "es": "Spanish",
+    "fr": "French", "zh": "Chinese", "ru": "Russian",
+}
+_SCRIPT_HINTS = {"ja": " in Hiragana, Katakana, or Kanji", "ko": " in Hangul", "zh": " in Chinese characters"}
+
+
+class RetryableError(Exception):
+    """A failure worth retrying (model still loading, rate limited, server error, timeout)."""
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def build_prompt(word: str, lang: str) -> str:
+    name = LANGUAGE_NAMES.get(lang, lang)
+    return (
+        f"Translate the following English word to its most common {name} equivalent. "
+        f"Respond with ONLY the single {name} word{_SCRIPT_HINTS.get(lang, '')}. "
+        f"Do not add any explanation or punctuation.\n\n"
+        f"English: {word}\n{name}:"
+    )
+
+
+def clean_translation(text: str) -> str:
+    """First non-empty line of the reply without quotes, labels or trailing punctuation."""
+    for line in (text or "").splitlines():
+        line = re.sub(r"^[\w ]+:\s*", "", line.strip()) if ":" in line else line.strip()
+        line = line.strip(" \t\"'`「」『』“”‘’.,。、!！?？")
+        if line:
+            return line
+    return ""
+
+
+class OllamaBackend:
+    def __init__(self, model: str, host: str = "localhost", port: int = 11434, timeout: float = 45):
+        self.model = model
+        self.url = f"http://{host}:{port}/api/generate"
+        self.timeout = timeout
+
+    def translate(self, word: str, lang: str) -> str:
+        data = {"model": self.model, "prompt": build_prompt(word, lang), "stream": False,
+                "options": {"temperature": 0.1, "num_predict": 20}}
+        try:
+            resp = requests.post(self.url, json=data, timeout=self.timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise RetryableError(str(e)) from e
+        if resp.status_code == 429 or resp.status_code >= 500:
+            raise RetryableError(f"HTTP {resp.status_code}: {resp.text[:200]}")
+        resp.raise_for_status()
+        return clean_translation(resp.json().get("response", ""))
+
+
+class HuggingFaceBackend:
+    def __init__(self, model: str = DEFAULT_HF_MODEL, token: Optional[str] = None, timeout: float = 60):
+        self.url = f"https://api-inference.huggingface.co/models/{model}"
+        token = token or os.getenv("HF_API_TOKEN")
+        if not token:
+            raise ValueError("HF_API_TOKEN is not set")
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.timeout = timeout
+
+    def translate(self, word: str, lang: str) -> str:
+        payload = {"inputs": build_prompt(word, lang),
+                   "parameters": {"max_new_tokens": 20, "return_full_text": False, "temperature": 0.1}}
+        try:
+            resp = requests.post(self.url, headers=self.headers, json=payload, timeout=self.timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise RetryableError(str(e)) from e
+        if resp.status_code == 429 or resp.status_code >= 500 or "is currently loading" in resp.text:
+            raise RetryableError(f"HTTP {resp.status_code}: {resp.text[:200]}")
+        resp.raise_for_status()
+        return clean_translation(resp.json()[0].get("generated_text", ""))
+
+
+class Checkpoint:
+    """{word: translation} results saved atomically every `every` new results."""
+
+    def __init__(self, path: Path, lang: str, every: int = DEFAULT_CHECKPOINT_EVERY):
+        self.path = Path(path)
+        self.lang = lang
+        self.every = max(1, every)
+        self.results: Dict[str, str] = {}
+        self.failed: Dict[str, str] = {}
+        self._unsaved = 0
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved.get("lang") == lang:
+                self.results = saved.get("results", {})
+
+    def add(self, word: str, translation: str):
+        self.results[word] = translation
+        self.failed.pop(word, None)
+        self._unsaved += 1
+        if self._unsaved >= self.every:
+            self.save()
+
+    def save(self):
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"lang": self.lang, "saved_at": time.time(), "results": self.results, "failed": self.failed},
+                      f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+        self._unsaved = 0
+
+
+def _pending_words(input_path: str, field: str, done: Dict[str, str]) -> Iterator[str]:
+    seen = set()
+    for key, record in iter_json_items(input_path):
+        word = key or record.get("word")
+        if not word or record.get(field) or word in done or word in seen:
+            continue
+        seen.add(word)
+        yield word
+
+
+async def translate_all(
+    input_path: str,
+    backend,
+    lang: str,
+    checkpoint: Checkpoint,
+    field: str = DEFAULT_FIELD,
+    concurrency: int = 8,
+    rate: float = 4.0,
+    max_retries: int = 5,
+    progress_every: int = 100,
+) -> Dict[str, int]:
+    """Translate every pending headword into `checkpoint`. Returns counters."""
+    bucket = TokenBucket(rate, capacity=max(1.0, rate))
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    stats = {"translated": 0, "failed": 0, "retries": 0}
+    started = time.time()
+
+    async def worker():
+        while True:
+            word = await queue.get()
+            if word is None:
+                return
+            for attempt in range(max_retries + 1):
+                await bucket.acquire()
+                try:
+                    translation = await asyncio.to_thread(backend.translate, word, lang)
+                except RetryableError as e:
+                    if attempt == max_retries:
+                        checkpoint.failed[word] = str(e)
+                        stats["failed"] += 1
+                        break
+                    stats["retries"] += 1
+                    await asyncio.sleep(min(60.0, 2 ** attempt))
+                    continue
+                except Exception as e:
+                    checkpoint.failed[word] = f"{type(e).__name__}: {e}"
+                    stats["failed"] += 1
+                    break
+                if translation:
+                    checkpoint.add(word, translation)
+                    stats["translated"] += 1
+                else:
+                    checkpoint.failed[word] = "empty response"
+                    stats["failed"] += 1
+                break
+            finished = stats["translated"] + stats["failed"]
+            if progress_every and finished % progress_every == 0:
+                rate_now = finished / max(time.time() - started, 1e-9)
+                print(f"  {finished:,} done ({stats['failed']:,} failed, {rate_now:.1f}/s)", flush=True)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        for word in _pending_words(input_path, field, checkpoint.results):
+            await queue.put(word)
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+        checkpoint.save()
+    return stats
+
+
+def write_output(input_path: str, output_path: str, results: Dict[str, str], field: str = DEFAULT_FIELD) -> int:
+    """Copy the input with `field` filled from `results`, streaming record by record."""
+    def records() -> Iterator[Any]:
+        for key, record in iter_json_items(input_path):
+            word = key or record.get("word")
+            if word in results and not record.get(field):
+                record[field] = results[word]
+            yield key, record
+
+    if Path(output_path).suffix == ".jsonl":
+        count = 0
+        with open(output_path, "w", encoding="utf-8") as f:
+            for _, record in records():
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+        return count
+
+    # 진행 파일의 다른 최상위 항목(words, completed_prefixes, metrics 등)은 그대로 두고 필드만 채웁니다.
+    return write_json_like(input_path, output_path, records())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill reverse translations concurrently with rate limiting")
+    parser.add_argument("input", type=str, help="Progress file, builder output, or JSONL")
+    parser.add_argument("output", type=str, help="Output path (.jsonl for JSON lines, otherwise a JSON document)")
+    parser.add_argument("--lang", type=str, required=True, help="Target language code (e.g. ja, ko, de)")
+    parser.add_argument("--backend", choices=("ollama", "hf"), default="ollama")
+    parser.add_argument("--model", type=str, default=None, help="Default: gpt-oss:20b (ollama) or Llama 3 8B Instruct (hf)")
+    parser.add_argument("--host", type=str, default="localhost")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--field", type=str, default=DEFAULT_FIELD)
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight")
+    parser.add_argument("--rate", type=float, default=4.0, help="Requests per second (0 = unlimited)")
+    parser.add_argument("--max-retries", type=int, default=5)
+    parser.add_argument("--checkpoint", type=str, default=None, help="Default: <output>.checkpoint.json")
+    parser.add_argument("--checkpoint-every", type=int, default=DEFAULT_CHECKPOINT_EVERY)
+    args = parser.parse_args()
+
+    if args.backend == "ollama":
+        backend = OllamaBackend(args.model or "gpt-oss:20b", args.host, args.port)
+    else:
+        backend = HuggingFaceBackend(args.model or DEFAULT_HF_MODEL)
+    checkpoint = Checkpoint(Path(args.checkpoint or f"{args.output}.checkpoint.json"), args.lang, args.checkpoint_every)
+    if checkpoint.results:
+        print(f"Resuming: {len(checkpoint.results):,} translations already in {checkpoint.path}")
+
+    started = time.time()
+    try:
+        stats = asyncio.run(translate_all(args.input, backend, args.lang, checkpoint, args.field,
+                                          max(1, args.concurrency), args.rate, args.max_retries))
+    except KeyboardInterrupt:
+        print(f"\nInterrupted; {len(checkpoint.results):,} translations saved to {checkpoint.path}. Re-run to resume.")
+        return
+    total = write_output(args.input, args.output, checkpoint.results, args.field)
+    print(f"Translated {stats['translated']:,} new headwords ({stats['failed']:,} failed, {stats['retries']:,} retries) "
+          f"in {time.time() - started:.1f}s; wrote {total:,} records to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# dictionary_project/utils/web_bundle.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Prefix- and language-sharded static bundles for the HTML / WebView front-ends.
+
+Instead of one large JSON the pages fetch `manifest.json` (a few KB) and then only
+the shards for the current query:
+
+  en/<prefix>.<hash>.json     English fields of every headword with that 2-letter prefix
+  <lang>/<prefix>.<hash>.json target-language fields for the same headwords
+  <lang>/words.<hash>.json    normalized target word -> headwords (reverse search)
+
+The manifest maps every group ("en" or a language) and shard name (prefix or
+"words") to the first 12 hex characters of the shard's sha256, which is also
+part of its file name.
+
+Shards use short keys (see "keys" in the manifest), no indentation, and have
+precompressed `.gz` and (when the `brotli` package is installed) `.br` siblings.
+Content hashes are part of the file names, so shards can be cached forever and
+a rebuild only changes the files whose content changed.
+
+Usage:
+  python -m utils.web_bundle merged_dictionary.json --out web_bundle
+  python -m utils.web_bundle dictionary.ldict --out web_bundle --langs ja ko
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from lookup.packed import iter_source_entries
+from lookup.reverse_index import index_terms
+from utils.model_registry import get_module, is_available
+
+BUNDLE_VERSION = 1
+DEFAULT_BUNDLE_DIR = Path("web_bundle")
+PREFIX_LENGTH = 2
+HAS_BROTLI = is_available("brotli")
+
+# Long field name -> short key written in shards.
+ENGLISH_KEYS = {"word": "w", "pos": "p", "rarity": "r", "score": "s", "definition_en": "d", "example_en": "x"}
+TARGET_KEYS = {"word": "w", "target_word": "t", "definition": "d", "example": "x"}
+WORDS_SHARD = "words"
+
+
+def shard_prefix(word: str) -> str:
+    """The builder's 2-letter prefix; headwords not starting with two letters go to "_"."""
+    head = word[:PREFIX_LENGTH].lower()
+    return head if len(head) == PREFIX_LENGTH and head.isalpha() and head.isascii() else "_"
+
+
+def _compact(record: Dict[str, Any], keys: Dict[str, str]) -> Dict[str, Any]:
+    return {short: record[name] for name, short in keys.items() if record.get(name) not in (None, "")}
+
+
+def _dump(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def _write_shard(out_dir: Path, relative: str, payload: bytes, level: int) -> Dict[str, int]:
+    """Write one shard plus its compressed siblings (skipped if already present); returns sizes."""
+    path = out_dir / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        path.write_bytes(payload)
+        # mtime=0 keeps .gz bytes identical across rebuilds of identical content
+        Path(str(path) + ".gz").write_bytes(gzip.compress(payload, compresslevel=level, mtime=0))
+        if HAS_BROTLI:
+            Path(str(path) + ".br").write_bytes(get_module("brotli").compress(payload, quality=11))
+    sizes = {"raw": len(payload), "gz": Path(str(path) + ".gz").stat().st_size}
+    if HAS_BROTLI and Path(str(path) + ".br").exists():
+        sizes["br"] = Path(str(path) + ".br").stat().st_size
+    return sizes
+
+
+def shard_file(group: str, name: str, digest: str) -> str:
+    """Relative path of a shard; the manifest stores only `digest` (the first 12 hex chars of its sha256)."""
+    return f"{group}/{name}.{digest}.json"
+
+
+def build_bundle(entries: Iterable[Dict[str, Any]], out_dir: Union[str, Path] = DEFAULT_BUNDLE_DIR,
+                 langs: Optional[Sequence[str]] = None, source: str = "",
+                 gzip_level: int = 9) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """Shard canonical entries into `out_dir` and write its manifest. Returns (manifest, total sizes)."""
+    out_dir = Path(out_dir)
+    groups: Dict[str, Dict[str, Any]] = defaultdict(lambda: defaultdict(list))
+    reverse: Dict[str, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list))
+    wanted = set(langs) if langs else None
+    count = 0
+    for entry in entries:
+        count += 1
+        prefix = shard_prefix(entry["word"])
+        groups["en"][prefix].append(_compact(entry, ENGLISH_KEYS))
+        for lang, info in entry.get("translations", {}).items():
+            if wanted is not None and lang not in wanted:
+                continue
+            record = {"word": entry["word"], "target_word": info.get("word"), "definition": info.get("definition"),
+                      "example": info.get("example")}
+            groups[lang][prefix].append(_compact(record, TARGET_KEYS))
+            for term in index_terms(info.get("word", "")):
+                if entry["word"] not in reverse[lang][term]:
+                    reverse[lang][term].append(entry["word"])
+    for lang, terms in reverse.items():
+        groups[lang][WORDS_SHARD] = dict(terms)
+
+    shards: Dict[str, Dict[str, str]] = {}
+    totals: Dict[str, int] = defaultdict(int)
+    for group in sorted(groups):
+        shards[group] = {}
+        for name, data in sorted(groups[group].items()):
+            payload = _dump(data)
+            digest = hashlib.sha256(payload).hexdigest()[:12]
+            for kind, size in _write_shard(out_dir, shard_file(group, name, digest), payload, gzip_level).items():
+                totals[kind] += size
+            shards[group][name] = digest
+    totals["shards"] = sum(len(g) for g in shards.values())
+
+    manifest = {
+        "version": BUNDLE_VERSION,
+        "generated_at": datetime.now().isoformat(),
+        "source": source,
+        "entries": count,
+        "prefix_length": PREFIX_LENGTH,
+        "langs": sorted(g for g in shards if g != "en"),
+        "file": "{group}/{name}.{hash}.json",
+        "keys": {"en": {v: k for k, v in ENGLISH_KEYS.items()}, "target": {v: k for k, v in TARGET_KEYS.items()}},
+        "compression": ["gz"] + (["br"] if HAS_BROTLI else []),
+        "shards": shards,
+    }
+    payload = json.dumps(manifest, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    tmp_manifest = out_dir / "manifest.json.tmp"
+    tmp_manifest.write_bytes(payload)
+    os.replace(tmp_manifest, out_dir / "manifest.json")
+    (out_dir / "manifest.json.gz").write_bytes(gzip.compress(payload, compresslevel=gzip_level, mtime=0))
+    totals["manifest"] = len(payload)
+    _remove_stale(out_dir, shards)
+    return manifest, dict(totals)
+
+
+def _remove_stale(out_dir: Path, shards: Dict[str, Dict[str, str]]):
+    """Delete shards (and siblings) from earlier builds that the new manifest no longer references."""
+    live = {shard_file(group, name, digest) for group, names in shards.items() for name, digest in names.items()}
+    for path in out_dir.glob("*/*.json*"):
+        relative = path.relative_to(out_dir).as_posix()
+        base = relative[:-3] if relative.endswith((".gz", ".br")) else relative
+        if base not in live:
+            path.unlink()
+    for group_dir in out_dir.iterdir():
+        if group_dir.is_dir() and group_dir.name not in shards and not any(group_dir.iterdir()):
+            group_dir.rmdir()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split a dictionary into lazily loaded web shards")
+    parser.add_argument("input", help=".ldict or any supported dictionary JSON/JSONL")
+    parser.add_argument("--out", type=Path, default=DEFAULT_BUNDLE_DIR)
+    parser.add_argument("--langs", nargs="*", default=None, help="Target languages to include (default: all)")
+    parser.add_argument("--gzip-level", type=int, default=9)
+    args = parser.parse_args()
+
+    manifest, totals = build_bundle(iter_source_entries(args.input), args.out, args.langs, source=str(args.input),
+                                    gzip_level=args.gzip_level)
+    print(f"{manifest['entries']:,} entries -> {totals['shards']} shards in {args.out} "
+          f"({totals['raw'] / 1e6:.2f} MB raw, {totals['gz'] / 1e6:.2f} MB gzip"
+          + (f", {totals['br'] / 1e6:.2f} MB brotli" if HAS_BROTLI else ", brotli not installed") + ")")
+    print(f"manifest.json {totals['manifest'] / 1e3:.1f} KB; "
+          f"average shard {totals['gz'] / totals['shards'] / 1e3:.1f} KB gzipped")
+
+
+if __name__ == "__main__":
+    main()
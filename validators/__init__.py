@@ -2,54 +2,76 @@
 # Copyright (c) 2025 [Your Name/Organization]
 # Licensed under the MIT License. See LICENSE file in the project root for details.
 
-from .schema_validator import validate_entry_data, log_validation_error
-from .custom_validator import (
-    validate_german_features, 
-    validate_korean_features, 
-    validate_japanese_features,
-    validate_croatian_features
+from .schema_validator import (
+    validate_entry_data,
+    log_validation_error,
+    record_validation_error,
+    write_validation_log,
+    VALIDATION_LOG_PATH,
 )
-from pydantic import ValidationError
-from schemas.base import BaseFeatures
-from typing import List, Tuple
-from multiprocessing import Pool
+from .structural_validator import is_well_formed_entry
+from pydantic import BaseModel, ValidationError
+from typing import List, Optional, Tuple
+from lang_plugins import LazyRegistry, get_feature_model, get_feature_validator, validator_languages
 
-CUSTOM_VALIDATORS = {
-    "de": validate_german_features,
-    "ko": validate_korean_features,
-    "ja": validate_japanese_features,
-    "hr": validate_croatian_features,
-}
+# 언어별 검증기와 Features 모델은 언어 코드로 탐색되고(lang_plugins/<lang>_validator.py 또는
+# llm_dictionary.validators 엔트리 포인트), 해당 언어가 처음 검증될 때 임포트됩니다.
+CUSTOM_VALIDATORS = LazyRegistry(validator_languages, get_feature_validator)
+FEATURE_MODELS = LazyRegistry(validator_languages, get_feature_model)
 
-def validate_entry(entry_data: dict) -> Tuple[bool, str]:
+def validate_entry(entry_data: dict, error_log: Optional[List[dict]] = None) -> Tuple[bool, str]:
     """
     Perform full validation (schema + custom) for a single entry.
     Returns (True, "") on success, (False, error_message) on failure.
+    Failures are appended to `error_log` when given, otherwise written to the log file.
     """
     try:
-        validated_obj = validate_entry_data(entry_data)
-        if not validated_obj.senses:
+        # Well-formed entries skip building the full model tree; only malformed ones
+        # go through Pydantic, which raises (and logs) the detailed errors.
+        if not is_well_formed_entry(entry_data):
+            validate_entry_data(entry_data, error_log)
+        # Both paths read the raw translations, so the language models below see the
+        # same input (and coerce it the same way) whichever path was taken.
+        senses = entry_data.get("senses") or []
+        if not senses:
             error_msg = "Validation Error: 'senses' field is empty."
-            import asyncio
-            asyncio.run(log_validation_error(entry_data, {"custom_error": error_msg}))
+            record_validation_error(entry_data, {"custom_error": error_msg}, error_log)
             return False, error_msg
-        first_sense = validated_obj.senses[0]
-        for lang, features in first_sense.translations.items():
+        for lang, features in senses[0]["translations"].items():
             if lang in CUSTOM_VALIDATORS:
-                if not isinstance(features, BaseFeatures):
-                    continue
-                validator_fn = CUSTOM_VALIDATORS[lang]
+                try:
+                    feature_model, validator_fn = FEATURE_MODELS[lang], CUSTOM_VALIDATORS[lang]
+                except (ImportError, AttributeError) as e:
+                    # 플러그인을 불러오지 못해도 워커가 죽지 않도록 검증 실패로 기록합니다.
+                    error_msg = f"[{lang}] Validator plugin failed to load: {type(e).__name__}: {e}"
+                    record_validation_error(entry_data, {"custom_error": error_msg}, error_log)
+                    return False, error_msg
+                if isinstance(features, BaseModel):
+                    features = features.dict()
+                try:
+                    features = feature_model.parse_obj(features)
+                except ValidationError as e:
+                    record_validation_error(entry_data, {"lang": lang, "errors": e.errors()}, error_log)
+                    return False, f"Schema Validation Error: [{lang}] {str(e)}"
                 is_valid, error_msg = validator_fn(features)
                 if not is_valid:
                     detailed_msg = f"[{lang}] {error_msg}"
-                    import asyncio
-                    asyncio.run(log_validation_error(entry_data, {"custom_error": detailed_msg}))
+                    record_validation_error(entry_data, {"custom_error": detailed_msg}, error_log)
                     return False, detailed_msg
     except ValidationError as e:
+        # validate_entry_data has already recorded these errors.
         return False, f"Schema Validation Error: {str(e)}"
     return True, ""
 
-def validate_batch(entries: List[dict]) -> List[Tuple[bool, str]]:
-    """Validate multiple entries in parallel."""
-    with Pool() as pool:
-        return pool.map(validate_entry, entries)
\ No newline at end of file
+def validate_batch(entries: List[dict], workers: Optional[int] = None) -> List[Tuple[bool, str]]:
+    """Validate multiple entries in parallel on the shared, long-lived worker pool."""
+    from .stream_validator import validate_stream
+    return [(ok, error) for _, ok, error in validate_stream(entries, workers=workers)]
+
+def __getattr__(name: str):
+    # Keep `from validators import validate_german_features` working without eager imports.
+    if name.startswith("validate_"):
+        for lang in validator_languages():
+            if getattr(CUSTOM_VALIDATORS[lang], "__name__", None) == name:
+                return CUSTOM_VALIDATORS[lang]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,8 +4,6 @@
 
 from schemas.base import GermanFeatures, KoreanFeatures, JapaneseFeatures, CroatianFeatures, PosType
 from typing import Tuple
-# 가정: BLEU 점수 계산용 라이브러리
-from bleurt import score as bleurt_score  # pip install bleurt
 
 def validate_german_features(features: GermanFeatures) -> Tuple[bool, str]:
     """Validate German-specific logical rules."""
@@ -34,7 +32,8 @@ def validate_korean_features(features: KoreanFeatures) -> Tuple[bool, str]:
         if ex.confidence < 0.85:
             return False, f"Example '{ex.value}' for '{features.word_target.value}' has low confidence {ex.confidence}."
         # BLEU 점수 검증 (참조 예문 필요)
-        # bleu = bleurt_score.compute_bleu(ex.value, reference="")  # 실제 참조 데이터 필요
+        # bleurt는 선택 의존성이므로 필요할 때만 로드합니다: get_module("bleurt.score") (utils.model_registry)
+        # bleu = get_module("bleurt.score").compute_bleu(ex.value, reference="")  # 실제 참조 데이터 필요
         # if bleu < 0.7:
         #     return False, f"Example '{ex.value}' for '{features.word_target.value}' has low BLEU score {bleu}."
     return True, ""
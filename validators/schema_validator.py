@@ -6,50 +6,49 @@ from pydantic import ValidationError
 from schemas.base import DictionaryRoot
 import json
 from datetime import datetime
+from typing import Iterable, List, Optional
 import aiofiles
 
-async def log_validation_error(data: dict, error_message: str | list):
-    """Log validation failures in jsonl format asynchronously."""
-    log_entry = {
+VALIDATION_LOG_PATH = "validation_log.jsonl"
+
+def make_validation_log_record(data: dict, error_message: str | list | dict) -> dict:
+    """Build one validation_log.jsonl record."""
+    return {
         "timestamp": datetime.utcnow().isoformat(),
         "invalid_data": data,
         "error": error_message
     }
-    async with aiofiles.open("validation_log.jsonl", "a", encoding="utf-8") as f:
-        await f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
 
-def validate_entry_data(data: dict) -> DictionaryRoot:
+def _dump_record(record: dict) -> str:
+    # Pydantic error contexts may hold exception objects; fall back to str() for those.
+    return json.dumps(record, ensure_ascii=False, default=str) + "\n"
+
+def write_validation_log(records: Iterable[dict], path: str = VALIDATION_LOG_PATH) -> int:
+    """Append many log records with a single open/write. Returns the number written."""
+    lines = [_dump_record(record) for record in records]
+    if lines:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("".join(lines))
+    return len(lines)
+
+def record_validation_error(data: dict, error_message: str | list | dict, error_log: Optional[List[dict]] = None):
     """
-    Validate data structure using Pydantic DictionaryRoot model.
-    Returns validated object or raises ValidationError with logging.
+    Collect a failure into `error_log` when the caller batches its writes
+    (e.g. pool workers), otherwise append it to the log file right away.
     """
-    try:
-        entry = DictionaryRoot.parse_obj(data)
-        return entry
-    except ValidationError as e:
-        import asyncio
-        asyncio.run(log_validation_error(data, e.errors()))
-        raise# dictionary_project/validators/schema_validator.py
-# Copyright (c) 2025 [Your Name/Organization]
-# Licensed under the MIT License. See LICENSE file in the project root for details.
-
-from pydantic import ValidationError
-from schemas.base import DictionaryRoot
-import json
-from datetime import datetime
-import aiofiles
+    record = make_validation_log_record(data, error_message)
+    if error_log is not None:
+        error_log.append(record)
+    else:
+        write_validation_log([record])
 
 async def log_validation_error(data: dict, error_message: str | list):
     """Log validation failures in jsonl format asynchronously."""
-    log_entry = {
-        "timestamp": datetime.utcnow().isoformat(),
-        "invalid_data": data,
-        "error": error_message
-    }
-    async with aiofiles.open("validation_log.jsonl", "a", encoding="utf-8") as f:
-        await f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
+    log_entry = make_validation_log_record(data, error_message)
+    async with aiofiles.open(VALIDATION_LOG_PATH, "a", encoding="utf-8") as f:
+        await f.write(_dump_record(log_entry))
 
-def validate_entry_data(data: dict) -> DictionaryRoot:
+def validate_entry_data(data: dict, error_log: Optional[List[dict]] = None) -> DictionaryRoot:
     """
     Validate data structure using Pydantic DictionaryRoot model.
     Returns validated object or raises ValidationError with logging.
@@ -58,6 +57,5 @@ def validate_entry_data(data: dict) -> DictionaryRoot:
         entry = DictionaryRoot.parse_obj(data)
         return entry
     except ValidationError as e:
-        import asyncio
-        asyncio.run(log_validation_error(data, e.errors()))
-        raise
\ No newline at end of file
+        record_validation_error(data, e.errors(), error_log)
+        raise
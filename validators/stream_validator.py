@@ -0,0 +1,157 @@
+# dictionary_project/validators/stream_validator.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Streaming validation over a long-lived worker pool.
+
+Records are read lazily, validated in chunks, and results are yielded as
+(index, ok, error) while at most `max_inflight` chunks are outstanding, so memory
+stays bounded by the window rather than by the corpus size.
+
+Usage:
+  python -m validators.stream_validator merged_entries.jsonl --workers 8
+  python -m validators.stream_validator dict_ko.json --unordered --chunksize 1000
+"""
+
+import argparse
+import atexit
+import itertools
+import os
+import queue
+import sys
+import time
+from collections import deque
+from multiprocessing import Pool
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from validators import validate_entry, write_validation_log, VALIDATION_LOG_PATH
+from utils.json_stream import iter_json_records
+
+DEFAULT_CHUNKSIZE = 500
+
+_pool = None
+_pool_workers = 0
+
+
+def get_pool(workers: Optional[int] = None):
+    """Return the shared worker pool, (re)creating it only if the worker count changes."""
+    global _pool, _pool_workers
+    workers = workers or os.cpu_count() or 1
+    if _pool is None or _pool_workers != workers:
+        close_pool()
+        _pool = Pool(processes=workers)
+        _pool_workers = workers
+    return _pool
+
+
+def close_pool():
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.close()
+        _pool.join()
+        _pool, _pool_workers = None, 0
+
+
+atexit.register(close_pool)
+
+
+def _validate_chunk(start: int, chunk: List[dict]) -> Tuple[List[Tuple[int, bool, str]], List[dict]]:
+    """Validate one chunk in a worker; log records are returned to the parent, not written here."""
+    results, error_log = [], []
+    for offset, entry in enumerate(chunk):
+        ok, error = validate_entry(entry, error_log)
+        results.append((start + offset, ok, error))
+    return results, error_log
+
+
+def _chunks(records: Iterable[Any], chunksize: int) -> Iterator[Tuple[int, List[Any]]]:
+    iterator = iter(records)
+    start = 0
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def validate_stream(
+    records: Iterable[dict],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    ordered: bool = True,
+    max_inflight: Optional[int] = None,
+    log_path: Optional[str] = VALIDATION_LOG_PATH,
+) -> Iterator[Tuple[int, bool, str]]:
+    """
+    Validate `records` on the shared pool and yield (index, ok, error) as chunks finish.
+    With ordered=False results come back in completion order.
+    Workers never touch the log file: the parent appends each chunk's failures in one
+    write (in input order when ordered=True). Pass log_path=None to skip logging.
+    """
+
+    def _finish(payload) -> List[Tuple[int, bool, str]]:
+        if isinstance(payload, BaseException):
+            raise payload
+        results, error_log = payload
+        if log_path and error_log:
+            write_validation_log(error_log, log_path)
+        return results
+
+    pool = get_pool(workers)
+    max_inflight = max_inflight or 2 * _pool_workers
+    chunks = _chunks(records, chunksize)
+
+    if ordered:
+        pending = deque()
+        for start, chunk in chunks:
+            pending.append(pool.apply_async(_validate_chunk, (start, chunk)))
+            if len(pending) >= max_inflight:
+                yield from _finish(pending.popleft().get())
+        while pending:
+            yield from _finish(pending.popleft().get())
+        return
+
+    done: "queue.SimpleQueue" = queue.SimpleQueue()
+    inflight = 0
+    for start, chunk in chunks:
+        pool.apply_async(_validate_chunk, (start, chunk), callback=done.put, error_callback=done.put)
+        inflight += 1
+        while inflight >= max_inflight:
+            inflight -= 1
+            yield from _finish(done.get())
+    while inflight:
+        inflight -= 1
+        yield from _finish(done.get())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream-validate a JSONL or JSON-array dictionary corpus")
+    parser.add_argument("corpus", type=str, help="Path to a .jsonl file or a JSON array / {'entries': [...]} file")
+    parser.add_argument("--key", type=str, default=None, help="Member holding the records (default: entries/words)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--unordered", action="store_true", help="Yield results as they finish")
+    parser.add_argument("--quiet", action="store_true", help="Only print the summary")
+    parser.add_argument("--log", type=str, default=VALIDATION_LOG_PATH, help="Validation log path ('' to disable)")
+    args = parser.parse_args()
+
+    total = invalid = 0
+    start_time = time.time()
+    records = iter_json_records(args.corpus, args.key)
+    for index, ok, error in validate_stream(records, args.workers, args.chunksize, ordered=not args.unordered, log_path=args.log or None):
+        total += 1
+        if not ok:
+            invalid += 1
+            if not args.quiet:
+                print(f"[{index}] {error}")
+    elapsed = time.time() - start_time
+    rate = total / elapsed if elapsed else 0.0
+    print(f"Validated {total:,} entries ({invalid:,} invalid) in {elapsed:.2f}s - {rate:,.0f} entries/sec")
+    close_pool()
+    sys.exit(1 if invalid else 0)
+
+
+if __name__ == "__main__":
+    main()
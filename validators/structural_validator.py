@@ -0,0 +1,151 @@
+# dictionary_project/validators/structural_validator.py
+# Copyright (c) 2025 [Your Name/Organization]
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""
+Fast structural pre-check for raw DictionaryRoot dicts.
+
+The schema below mirrors schemas/base.py and is compiled once, at import time,
+into a single flat Python function. The check is deliberately strict: an entry it
+accepts is always accepted by the Pydantic models, while anything it rejects
+(including values Pydantic would merely coerce) is handed to the Pydantic path,
+which produces the detailed errors.
+"""
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+# Same shape Pydantic accepts for ISO 8601 datetimes; range checks are left to fromisoformat.
+_ISO_DATETIME_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:Z|[+-]\d{2}:?\d{2})?"
+)
+_MISSING = object()
+
+# --- Schema nodes: ("str", min_len, max_len) | ("any",) | ("confidence",) | ("timestamp",)
+#     | ("optional", node) | ("list", node) | ("dict", node) | ("record", required, optional)
+Node = Tuple[Any, ...]
+
+STR: Node = ("str", None, None)
+ANY: Node = ("any",)
+
+PROVENANCE: Node = ("record", {"source": STR}, {
+    "generated_by": STR,
+    "prompt_id": ("optional", STR),
+    "timestamp": ("timestamp",),
+    "annotator_id": ("optional", STR),
+})
+VALUE_FIELD: Node = ("record", {"value": ANY, "provenance": PROVENANCE, "confidence": ("confidence",)}, {})
+FEATURES: Node = ("record", {"word_target": VALUE_FIELD}, {
+    "part_of_speech": ("optional", VALUE_FIELD),
+    "examples": ("list", VALUE_FIELD),
+})
+SENSE: Node = ("record", {
+    "sense_id": STR,
+    "definition_en": STR,
+    "translations": ("dict", FEATURES),
+}, {"examples_en": ("list", STR)})
+DICTIONARY_ROOT: Node = ("record", {"word_en": ("str", 1, 80)}, {
+    "schema_version": STR,
+    "senses": ("list", SENSE),
+})
+
+
+@lru_cache(maxsize=65536)
+def _is_iso_timestamp(v: str) -> bool:
+    if not _ISO_DATETIME_RE.fullmatch(v):
+        return False
+    try:
+        datetime.fromisoformat(v.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    return True
+
+
+def _is_timestamp(v: Any) -> bool:
+    # Corpora repeat the same few timestamps, so the string check is memoised.
+    return isinstance(v, datetime) or (type(v) is str and _is_iso_timestamp(v))
+
+
+class _Compiler:
+    """Emit straight-line Python source for a schema node."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.counter = 0
+
+    def _name(self, prefix: str = "v") -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def _line(self, depth: int, code: str):
+        self.lines.append("    " * depth + code)
+
+    def emit(self, node: Node, expr: str, depth: int):
+        kind = node[0]
+        if kind == "any":
+            return
+        if kind == "str":
+            _, min_len, max_len = node
+            cond = f"type({expr}) is not str"
+            if min_len is not None:
+                cond += f" or not {min_len} <= len({expr}) <= {max_len}"
+            self._line(depth, f"if {cond}: return False")
+        elif kind == "confidence":
+            self._line(depth, f"if not ((type({expr}) is float or type({expr}) is int) and 0.0 <= {expr} <= 1.0): return False")
+        elif kind == "timestamp":
+            self._line(depth, f"if not _is_timestamp({expr}): return False")
+        elif kind == "optional":
+            self._line(depth, f"if {expr} is not None:")
+            self._line(depth + 1, "pass")
+            self.emit(node[1], expr, depth + 1)
+        elif kind == "list":
+            item = self._name()
+            self._line(depth, f"if type({expr}) is not list: return False")
+            self._line(depth, f"for {item} in {expr}:")
+            self._line(depth + 1, "pass")
+            self.emit(node[1], item, depth + 1)
+        elif kind == "dict":
+            key, item = self._name("k"), self._name()
+            self._line(depth, f"if type({expr}) is not dict: return False")
+            self._line(depth, f"for {key}, {item} in {expr}.items():")
+            self._line(depth + 1, f"if type({key}) is not str: return False")
+            self.emit(node[1], item, depth + 1)
+        elif kind == "record":
+            _, required, optional = node
+            self._line(depth, f"if type({expr}) is not dict: return False")
+            for field, child in required.items():
+                value = self._name()
+                self._line(depth, f"{value} = {expr}.get({field!r}, _MISSING)")
+                self._line(depth, f"if {value} is _MISSING: return False")
+                self.emit(child, value, depth)
+            for field, child in optional.items():
+                value = self._name()
+                self._line(depth, f"{value} = {expr}.get({field!r}, _MISSING)")
+                self._line(depth, f"if {value} is not _MISSING:")
+                self._line(depth + 1, "pass")
+                self.emit(child, value, depth + 1)
+        else:
+            raise ValueError(f"Unknown schema node: {kind!r}")
+
+
+def compile_checker(node: Node, name: str = "check"):
+    """Compile a schema node into a `check(data) -> bool` function."""
+    compiler = _Compiler()
+    compiler.emit(node, "data", 1)
+    source = "\n".join([f"def {name}(data):", *compiler.lines, "    return True"])
+    namespace: Dict[str, Any] = {"_is_timestamp": _is_timestamp, "_MISSING": _MISSING}
+    exec(compile(source, f"<structural_validator:{name}>", "exec"), namespace)
+    return namespace[name]
+
+
+_check_dictionary_root = compile_checker(DICTIONARY_ROOT, "check_dictionary_root")
+
+
+def is_well_formed_entry(data: Any) -> bool:
+    """
+    Return True if `data` is certainly a valid DictionaryRoot.
+    False means "unknown": run the Pydantic path to get the verdict and error details.
+    """
+    return _check_dictionary_root(data)